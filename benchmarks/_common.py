@@ -0,0 +1,48 @@
+import time
+
+
+def best_time(func, *args, repeat=3, **kwargs):
+    """
+    Best wall time of several calls of a function
+
+    Parameters
+    ----------
+    func : callable
+        Function to be timed
+    args, kwargs
+        Arguments of the function
+    repeat : int, optional
+        Number of calls. Default: 3
+
+    Returns
+    -------
+    tuple
+        (best time in seconds, value returned by the last call)
+    """
+    best = float('inf')
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def print_table(header, rows):
+    """
+    Prints rows as a plain text table
+
+    Parameters
+    ----------
+    header : sequence of str
+        Column names
+    rows : sequence of sequences
+        Table rows. Floats are formatted with 4 significant digits.
+    """
+    cells = [[f'{value:.4g}' if isinstance(value, float) else str(value)
+              for value in row] for row in rows]
+    widths = [max(len(str(column)), *(len(row[i]) for row in cells))
+              for i, column in enumerate(header)]
+    print('  '.join(str(column).rjust(width) for column, width in zip(header, widths)))
+    for row in cells:
+        print('  '.join(cell.rjust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,50 @@
+"""
+Wall time to reach a target error with and without convergence acceleration
+
+Plain partial sums need about 1e11-1e12 terms for an error of 1e-12, so their time
+is extrapolated from the throughput measured with --plain-terms terms. Run from the
+repository root:
+
+    python -m benchmarks.bench_acceleration --tolerance 1e-12
+"""
+import argparse
+import math
+
+from benchmarks._common import best_time, print_table
+from src.acceleration import accelerate_to_tolerance, leibniz_alternating_curve
+from src.compute_pi import pi_euler_curve, pi_leibniz_curve
+
+# (curve, methods suited to it, terms needed by the plain partial sums for an error e)
+CASES = {
+    'leibniz (paired)': (pi_leibniz_curve, ('richardson',), lambda e: 1 / (2 * e)),
+    'euler': (pi_euler_curve, ('richardson',), lambda e: 3 / (math.pi * e)),
+    'leibniz (alternating)': (leibniz_alternating_curve,
+                              ('aitken', 'wynn', 'euler', 'richardson'),
+                              lambda e: 1 / e),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tolerance', type=float, default=1e-12)
+    parser.add_argument('--plain-terms', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for name, (curve, methods, plain_terms) in CASES.items():
+        elapsed, _ = best_time(curve, args.plain_terms, repeat=args.repeat)
+        terms = plain_terms(args.tolerance)
+        rows.append((name, 'none', f'{terms:.2g}', terms * elapsed / args.plain_terms,
+                     'extrapolated'))
+        for method in methods:
+            elapsed, result = best_time(accelerate_to_tolerance, curve, method,
+                                        args.tolerance, repeat=args.repeat)
+            rows.append((name, method, result.terms_used, elapsed,
+                         f'{abs(result.estimate - math.pi):.1e}'))
+    print(f'target error: {args.tolerance:g}')
+    print_table(('series', 'acceleration', 'terms', 'time (s)', 'actual error'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Batch evaluation of many configurations against one call per configuration
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch --configurations 1000
+"""
+import argparse
+
+import numpy as np
+
+from benchmarks._common import best_time, print_table
+from src.batch import pi_euler_batch, pi_leibniz_batch, pi_monte_carlo_batch
+from src.compute_pi import PiMonteCarlo, pi_euler, pi_leibniz
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--configurations', type=int, default=1_000)
+    parser.add_argument('--max-terms', type=int, default=100_000)
+    parser.add_argument('--max-points', type=int, default=100_000)
+    parser.add_argument('--seeds', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    terms = rng.integers(1, args.max_terms, args.configurations)
+    points = rng.integers(1, args.max_points, args.configurations)
+    seeds = rng.integers(0, args.seeds, args.configurations)
+
+    cases = (
+        ('leibniz', lambda: [pi_leibniz(int(n)) for n in terms],
+         lambda: pi_leibniz_batch(terms)),
+        ('euler', lambda: [pi_euler(int(n)) for n in terms],
+         lambda: pi_euler_batch(terms)),
+        ('monte carlo', lambda: [PiMonteCarlo(int(p), int(s)).calculate
+                                 for p, s in zip(points, seeds)],
+         lambda: pi_monte_carlo_batch(points, seeds)),
+    )
+    rows = []
+    for name, loop, batch in cases:
+        loop_time, _ = best_time(loop, repeat=args.repeat)
+        batch_time, _ = best_time(batch, repeat=args.repeat)
+        rows.append((name, args.configurations, loop_time, batch_time,
+                     loop_time / batch_time))
+    print_table(('method', 'configurations', 'loop (s)', 'batch (s)', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
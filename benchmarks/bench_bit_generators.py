@@ -0,0 +1,46 @@
+"""
+Throughput and skip-ahead cost of the NumPy bit generators used by Monte Carlo
+
+For each bit generator, the table shows the time to draw and count --points points
+and the time to start a run at point --offset, by skipping ahead when the generator
+supports it. Run from the repository root:
+
+    python -m benchmarks.bench_bit_generators --points 10000000
+"""
+import argparse
+
+import numpy as np
+
+from benchmarks._common import best_time, print_table
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import BIT_GENERATORS, draw_coords, make_rng
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--points', type=int, default=10_000_000)
+    parser.add_argument('--offset', type=int, default=10 ** 12)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for name, (_, step) in BIT_GENERATORS.items():
+        draw_time, _ = best_time(lambda: draw_coords(make_rng(42, name), args.points),
+                                 repeat=args.repeat)
+        run_time, _ = best_time(lambda: PiMonteCarloStream(args.points, 42,
+                                                           bit_generator=name).calculate,
+                                repeat=args.repeat)
+        if step is None:
+            skip_time = 'n/a'
+        else:
+            skip_time, _ = best_time(make_rng, 42, name, args.offset, repeat=args.repeat)
+        rows.append((name, draw_time, args.points / draw_time, run_time,
+                     args.points / run_time, skip_time))
+    print(f'{args.points:,} points, skip ahead to point {args.offset:,} '
+          f'(numpy {np.__version__})')
+    print_table(('bit generator', 'draw (s)', 'points/s', 'estimate (s)', 'points/s',
+                 'skip ahead (s)'), rows)
+
+
+if __name__ == '__main__':
+    main()
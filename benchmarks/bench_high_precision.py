@@ -0,0 +1,32 @@
+"""
+Time to compute pi digits with the high precision series
+
+Run from the repository root:
+
+    python -m benchmarks.bench_high_precision --max-digits 1000000
+"""
+import argparse
+import math
+
+from benchmarks._common import best_time, print_table
+from src.high_precision import HIGH_PRECISION_METHODS, pi_digits, terms_for_digits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-digits', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    rows = []
+    for exponent in range(4, int(math.log10(args.max_digits)) + 1):
+        digits = 10 ** exponent
+        for method in HIGH_PRECISION_METHODS:
+            elapsed, _ = best_time(pi_digits, digits, method, repeat=args.repeat)
+            rows.append((digits, method, terms_for_digits(digits, method), elapsed,
+                         digits / elapsed))
+    print_table(('digits', 'method', 'terms', 'time (s)', 'digits/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
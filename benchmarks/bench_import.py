@@ -0,0 +1,64 @@
+"""
+Cold-start import time of the modules
+
+Each import runs in a new interpreter, so nothing is cached in sys.modules. The
+heavy packages column lists the plotting and web packages loaded by the import. Run
+from the repository root:
+
+    python -m benchmarks.bench_import --repeat 5
+"""
+import argparse
+import subprocess
+import sys
+
+from benchmarks._common import print_table
+
+MODULES = ('numpy', 'src.helpers', 'src.compute_pi', 'src.sampling', 'src.batch',
+           'matplotlib.pyplot', 'plotly.graph_objects', 'streamlit')
+HEAVY_MODULES = ('matplotlib', 'plotly', 'streamlit')
+
+_CODE = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(name for name in {heavy!r} if name in sys.modules) or '-')
+'''
+
+
+def import_time(module):
+    """
+    Time to import a module in a new interpreter
+
+    Parameters
+    ----------
+    module : str
+        Module name
+
+    Returns
+    -------
+    tuple
+        (seconds, comma separated heavy packages loaded)
+    """
+    result = subprocess.run([sys.executable, '-c',
+                             _CODE.format(module=module, heavy=HEAVY_MODULES)],
+                            check=True, capture_output=True, text=True)
+    elapsed, loaded = result.stdout.split()
+    return float(elapsed), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--modules', nargs='+', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for module in args.modules:
+        times, loaded = zip(*(import_time(module) for _ in range(args.repeat)))
+        rows.append((module, min(times), loaded[0]))
+    print_table(('module', 'import time (s)', 'heavy packages'), rows)
+
+
+if __name__ == '__main__':
+    main()
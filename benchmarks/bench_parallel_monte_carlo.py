@@ -0,0 +1,39 @@
+"""
+Scaling of the parallel Monte Carlo estimator
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel_monte_carlo --points 100000000
+"""
+import argparse
+import os
+
+from benchmarks._common import best_time, print_table
+from src.compute_pi import PiMonteCarloStream
+from src.parallel import pi_monte_carlo_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--points', type=int, default=10_000_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    serial, _ = best_time(lambda: PiMonteCarloStream(args.points, 42).calculate,
+                          repeat=args.repeat)
+    rows = [('serial', serial, 1.0, 1.0, args.points / serial)]
+    workers = 1
+    while workers <= args.max_workers:
+        elapsed, result = best_time(pi_monte_carlo_parallel, args.points, 42, workers,
+                                    repeat=args.repeat)
+        speedup = serial / elapsed
+        rows.append((workers, elapsed, speedup, speedup / workers,
+                     args.points / elapsed))
+        workers *= 2
+    print(f'{args.points:,} points, {os.cpu_count()} logical CPUs')
+    print_table(('workers', 'time (s)', 'speedup', 'efficiency', 'samples/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Scaling of the parallel series summation
+
+The serial reference is the same compensated summation on one core; the parallel
+results are checked to be identical to it. Run from the repository root:
+
+    python -m benchmarks.bench_parallel_series --terms 1000000000
+"""
+import argparse
+import os
+
+from benchmarks._common import best_time, print_table
+from src.parallel import pi_series_parallel
+from src.series import SERIES, pi_series
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--series', choices=SERIES, default='leibniz')
+    parser.add_argument('--terms', type=int, default=100_000_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    serial, expected = best_time(pi_series, args.series, args.terms, 'neumaier',
+                                 repeat=args.repeat)
+    rows = [('serial', serial, 1.0, 1.0, args.terms / serial)]
+    workers = 1
+    while workers <= args.max_workers:
+        elapsed, value = best_time(pi_series_parallel, args.series, args.terms, workers,
+                                   repeat=args.repeat)
+        assert value == expected
+        speedup = serial / elapsed
+        rows.append((workers, elapsed, speedup, speedup / workers, args.terms / elapsed))
+        workers *= 2
+    print(f'{args.series} series, {args.terms:,} terms, {os.cpu_count()} logical CPUs')
+    print_table(('workers', 'time (s)', 'speedup', 'efficiency', 'terms/s'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Series sums read from a memory-mapped partial sums table against full summation
+
+Run from the repository root:
+
+    python -m benchmarks.bench_partial_sums --max-terms 100000000
+"""
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from benchmarks._common import best_time, print_table
+from src.compute_pi import pi_euler, pi_leibniz
+from src.partial_sums import DEFAULT_STRIDE, PartialSumTable, build_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-terms', type=int, default=10 ** 8)
+    parser.add_argument('--stride', type=int, default=DEFAULT_STRIDE)
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    queries = np.random.default_rng(0).integers(1, args.max_terms, args.queries)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, scalar in (('leibniz', pi_leibniz), ('euler', pi_euler)):
+            path = os.path.join(directory, f'{name}.table')
+            build_time, _ = best_time(build_table, path, name, args.max_terms,
+                                      args.stride, repeat=1)
+            open_time, table = best_time(PartialSumTable, path, repeat=args.repeat)
+            full_time, expected = best_time(lambda: [scalar(int(n)) for n in queries],
+                                            repeat=args.repeat)
+            table_time, values = best_time(lambda: [table.pi(int(n)) for n in queries],
+                                           repeat=args.repeat)
+            assert values == expected
+            rows.append((name, args.queries, build_time, open_time, full_time,
+                         table_time, full_time / table_time))
+    print_table(('series', 'queries', 'build (s)', 'open (s)', 'full (s)', 'table (s)',
+                 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Samples and time needed by each Monte Carlo sampling strategy to reach a target error
+
+The number of points is doubled until the estimated standard error is below the
+target. Run from the repository root:
+
+    python -m benchmarks.bench_sampling --target-error 0.0001
+"""
+import argparse
+import math
+import time
+
+from benchmarks._common import print_table
+from src.sampling import SAMPLING_STRATEGIES, estimate_pi
+
+
+def samples_to_target(strategy, target_error, max_points, seed=42):
+    points = 1_000
+    while True:
+        result = estimate_pi(points, seed, strategy)
+        if result.standard_error <= target_error or points >= max_points:
+            return result
+        points = min(2 * points, max_points)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--target-error', type=float, default=1e-3)
+    parser.add_argument('--max-points', type=int, default=100_000_000)
+    args = parser.parse_args()
+
+    rows = []
+    for strategy in SAMPLING_STRATEGIES:
+        start = time.perf_counter()
+        result = samples_to_target(strategy, args.target_error, args.max_points)
+        elapsed = time.perf_counter() - start
+        rows.append((strategy, result.samples, result.standard_error,
+                     abs(result.estimate - math.pi), elapsed))
+    print_table(('strategy', 'samples', 'standard error', 'actual error', 'time (s)'),
+                rows)
+
+
+if __name__ == '__main__':
+    main()
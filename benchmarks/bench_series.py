@@ -0,0 +1,52 @@
+"""
+Time and accuracy of every infinite series on the shared term engine
+
+For each series and number of terms, the table shows the time of the scalar
+approximation and of the convergence curve, and the relative error of the
+approximation. Run from the repository root:
+
+    python -m benchmarks.bench_series --max-terms 10000000
+"""
+import argparse
+import math
+
+from benchmarks._common import best_time, print_table
+from src.series import SERIES
+
+
+def terms_to_tolerance(series, tolerance, max_terms):
+    """
+    Fewest terms with a relative error below a tolerance, None if more than
+    `max_terms` terms are needed
+    """
+    errors = abs(series.curve(max_terms) - math.pi) / math.pi
+    below = (errors < tolerance).nonzero()[0]
+    return int(below[0]) + 1 if len(below) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-terms', type=int, default=10 ** 7)
+    parser.add_argument('--tolerance', type=float, default=1e-6)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [10 ** e for e in range(3, int(math.log10(args.max_terms)) + 1)]
+    rows = []
+    for name, series in SERIES.items():
+        for size in sizes:
+            scalar_time, value = best_time(series.pi, size, repeat=args.repeat)
+            curve_time, _ = best_time(series.curve, size, repeat=args.repeat)
+            rows.append((name, size, scalar_time, size / scalar_time, curve_time,
+                         abs(value - math.pi) / math.pi))
+    print_table(('series', 'terms', 'time (s)', 'terms/s', 'curve (s)',
+                 'relative error'), rows)
+
+    print(f'\nTerms for a relative error below {args.tolerance:g}')
+    print_table(('series', 'terms'),
+                [(name, terms_to_tolerance(series, args.tolerance, args.max_terms)
+                  or f'> {args.max_terms}') for name, series in SERIES.items()])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Time and accuracy of the summation methods of the infinite series
+
+The reference is the correctly rounded sum of the same float64 terms (math.fsum),
+so the table shows only the rounding error of each summation method. Run from the
+repository root:
+
+    python -m benchmarks.bench_summation --max-terms 100000000
+"""
+import argparse
+import itertools
+import math
+
+import numpy as np
+
+from benchmarks._common import best_time, print_table
+from src.series import SERIES
+from src.summation import SUMMATION_METHODS, chunk_bounds, sum_terms
+
+
+def reference_sum(terms, start, stop):
+    chunks = (terms(np.arange(first, last)) for first, last in chunk_bounds(start, stop))
+    return math.fsum(itertools.chain.from_iterable(chunks))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-terms', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [10 ** e for e in range(4, int(math.log10(args.max_terms)) + 1)]
+    for name, series in SERIES.items():
+        terms, start = series.terms, series.start
+        rows = []
+        for size in sizes:
+            reference = reference_sum(terms, start, start + size)
+            naive_time = None
+            for method in SUMMATION_METHODS:
+                elapsed, value = best_time(sum_terms, terms, start, start + size, method,
+                                           repeat=args.repeat)
+                naive_time = naive_time or elapsed
+                rows.append((size, method, elapsed, elapsed / naive_time,
+                             abs(value - reference) / reference))
+        print(f'\n{name} series')
+        print_table(('terms', 'method', 'time (s)', 'vs naive', 'relative error'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark suite of the estimators with regression tracking against a baseline
+
+Every case runs for sizes 10^2, 10^3, ... up to --max-size (or the case's own limit,
+for the ones that keep all the samples in memory). The time is the best of --repeat
+runs and the peak memory is measured by tracemalloc in a separate run. Run from the
+repository root:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.2
+
+With --baseline, the exit status is 1 if a case is slower than its baseline time by
+more than the threshold. benchmarks/baseline.json holds the reference results, with
+the Python and NumPy versions and machine they were measured on; times depend on the
+machine, so regenerate it with --output benchmarks/baseline.json on the machine that
+runs the comparisons and commit it when a change is expected to alter performance.
+"""
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+
+import numpy as np
+
+from benchmarks._common import best_time, print_table
+from src.compute_pi import (PiMonteCarlo, pi_euler, pi_euler_curve, pi_leibniz,
+                            pi_leibniz_curve)
+from src.series import SERIES
+
+IN_MEMORY_LIMIT = 10 ** 7
+# shorter baseline times are dominated by timer and scheduling noise
+MIN_COMPARED_TIME = 1e-3
+
+
+def _coords(points):
+    return PiMonteCarlo(points, 42).coords
+
+
+def _calculate(points):
+    return PiMonteCarlo(points, 42).calculate
+
+
+def _colors(points):
+    return PiMonteCarlo(points, 42)._colors(('red', 'blue'))
+
+
+def _plot(points):
+    return PiMonteCarlo(points, 42).plot(backend='plotly', arc=True)
+
+
+# name: (function of the size, maximum size)
+CASES = {
+    'pi_leibniz': (pi_leibniz, 10 ** 8),
+    'pi_euler': (pi_euler, 10 ** 8),
+    'pi_leibniz_curve': (pi_leibniz_curve, IN_MEMORY_LIMIT),
+    'pi_euler_curve': (pi_euler_curve, IN_MEMORY_LIMIT),
+    'PiMonteCarlo.coords': (_coords, IN_MEMORY_LIMIT),
+    'PiMonteCarlo.calculate': (_calculate, IN_MEMORY_LIMIT),
+    'PiMonteCarlo._colors': (_colors, IN_MEMORY_LIMIT),
+    'PiMonteCarlo.plot': (_plot, IN_MEMORY_LIMIT),
+    **{f'pi_series[{name}]': (series.pi, 10 ** 8) for name, series in SERIES.items()
+       if name not in ('leibniz', 'euler')},
+}
+
+
+def peak_memory(func, *args):
+    """
+    Peak memory allocated during a call, as traced by tracemalloc
+
+    Returns
+    -------
+    int
+        Bytes
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(cases, max_size, repeat):
+    """
+    Runs the benchmark cases
+
+    Parameters
+    ----------
+    cases : sequence of str
+        Names of CASES
+    max_size : int
+        Largest size
+    repeat : int
+        Runs of each case and size. The best time is kept.
+
+    Returns
+    -------
+    list of dicts
+        One result per case and size
+    """
+    results = []
+    for name in cases:
+        func, case_max_size = CASES[name]
+        size = 100
+        while size <= min(max_size, case_max_size):
+            elapsed, _ = best_time(func, size, repeat=repeat)
+            results.append({'case': name, 'size': size, 'time': elapsed,
+                            'peak_bytes': peak_memory(func, size),
+                            'per_second': size / elapsed})
+            size *= 10
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Cases slower than their baseline by more than a relative threshold. Cases whose
+    baseline time is below MIN_COMPARED_TIME are not compared.
+
+    Parameters
+    ----------
+    results, baseline : list of dicts
+        Results of `run`
+    threshold : float
+        Allowed relative slowdown, e.g. 0.2 for 20 %
+
+    Returns
+    -------
+    list of tuples
+        (case, size, baseline time, time, ratio) of the regressions
+    """
+    reference = {(item['case'], item['size']): item['time'] for item in baseline}
+    regressions = []
+    for item in results:
+        baseline_time = reference.get((item['case'], item['size']), 0)
+        if (baseline_time >= MIN_COMPARED_TIME
+                and item['time'] > baseline_time * (1 + threshold)):
+            regressions.append((item['case'], item['size'], baseline_time, item['time'],
+                                item['time'] / baseline_time))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    parser.add_argument('--max-size', type=int, default=10 ** 6)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON file where the results are written')
+    parser.add_argument('--baseline', help='JSON file of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run(args.cases, args.max_size, args.repeat)
+    print_table(('case', 'size', 'time (s)', 'peak memory (MiB)', 'samples/s'),
+                [(item['case'], item['size'], item['time'], item['peak_bytes'] / 2 ** 20,
+                  item['per_second']) for item in results])
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'python': platform.python_version(), 'numpy': np.__version__,
+                       'machine': platform.machine(), 'results': results}, file,
+                      indent=1)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file)['results'], args.threshold)
+        if regressions:
+            print(f'\nRegressions above {args.threshold:.0%}')
+            print_table(('case', 'size', 'baseline (s)', 'time (s)', 'ratio'),
+                        regressions)
+            sys.exit(1)
+        print(f'\nNo regression above {args.threshold:.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import uuid
 from itertools import cycle
 
 import numpy as np
@@ -5,8 +6,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from src.compute_pi import pi_leibniz, pi_euler
+from src.cache import RESULT_CACHE
 from src.helpers import load_css, CONFIG_PLOTLY, error, text_from_markdown
+from src.jobs import JOBS, progressive_curves
+from src.series import SERIES
 
 st.set_page_config(layout="centered", page_title="π - Infinite series",
                    page_icon=":chart_with_upwards_trend:")
@@ -16,77 +19,120 @@ load_css("pages/styles.css")
 PAGE_TEXT_FILE = 'pages/02_Infinite_series.md'
 content = text_from_markdown(PAGE_TEXT_FILE)
 
-with st.sidebar:
-    maximum = st.slider('Terms', 0, 400, 100, 20)
-    st.write('Estimation of pi - Euler:', pi_euler(maximum))
-    st.write('Error - Euler:', round(error(pi_euler(maximum), np.pi) * 100, 2), '%')
-    st.write('Estimation of pi - Leibniz:', pi_leibniz(maximum))
-    st.write('Error - Leibniz:', round(error(pi_leibniz(maximum), np.pi) * 100, 2), '%')
-
-terms = range(1, maximum + 1)
-
-fig = go.Figure()
-
-trace_leibniz = go.Scatter(x=list(terms),
-                           y=[pi_leibniz(i) for i in terms],
-                           name='Leibniz',
-                           )
-
-trace_euler = go.Scatter(x=list(terms),
-                         y=[pi_euler(i) for i in terms],
-                         name='Euler',
-                         )
-
-fig.add_trace(trace_leibniz)
-fig.add_trace(trace_euler)
-fig.add_hline(y=np.pi, line_dash='dot',
-              annotation_text='Pi value',
-              annotation_position='top left')
-
-palette = cycle(px.colors.qualitative.Plotly)
-
-fig.add_trace(trace_leibniz.update(xaxis='x2', yaxis='y2',
+# 0, 20, 40, ..., 400 and then 1-2-5 steps up to 5 million terms
+TERMS_OPTIONS = [*range(0, 401, 20),
+                 *(m * 10 ** e for e in range(3, 7) for m in (1, 2, 5))]
+MAXIMUM_PLOTTED_POINTS = 2_000
+
+if 'session_id' not in st.session_state:
+    st.session_state['session_id'] = uuid.uuid4().hex
+
+
+def plotted_indices(number_of_terms, maximum_points=MAXIMUM_PLOTTED_POINTS):
+    """
+    Indices of the curve points sent to the browser. Every point is plotted for short
+    curves; long curves are thinned with a mix of linear and logarithmic spacing, so
+    both the beginning and the tail of the curve keep their shape.
+    """
+    if number_of_terms <= maximum_points:
+        return np.arange(number_of_terms)
+    return np.unique(np.concatenate((
+        np.linspace(0, number_of_terms - 1, maximum_points // 2, dtype=int),
+        np.geomspace(1, number_of_terms, maximum_points // 2, dtype=int) - 1,
+    )))
+
+
+def series_figure(curves, maximum):
+    """
+    Approximations of the series and a zoom on the last quarter of the terms. The
+    curves may be partial (shorter than `maximum`) while they are computed.
+    """
+    length = len(next(iter(curves.values()), ()))
+    indices = plotted_indices(length)
+    terms = indices + 1
+
+    fig = go.Figure()
+
+    traces = [go.Scatter(x=terms, y=curve[indices], name=SERIES[name].title)
+              for name, curve in curves.items()]
+    for trace in traces:
+        fig.add_trace(trace)
+    fig.add_hline(y=np.pi, line_dash='dot',
+                  annotation_text='Pi value',
+                  annotation_position='top left')
+
+    palette = cycle(px.colors.qualitative.Plotly)
+
+    for trace in traces:
+        fig.add_trace(trace.update(xaxis='x2', yaxis='y2',
                                    showlegend=False,
                                    line=dict(color=next(palette)),
                                    ))
-fig.add_trace(trace_euler.update(xaxis='x2', yaxis='y2',
-                                 showlegend=False,
-                                 line=dict(color=next(palette)),
-                                 ))
-
-fig.add_hline(xref='x2', y=np.pi, line_dash='dot')  # ignored by Plotly. Issue #3755
-# work around to add pi horizontal line:                          (PT-BR-> gambiarra!)
-fig.add_shape(type="line", xref="x2 domain", yref="y2", x0=0, y0=np.pi, x1=1, y1=np.pi,
-              line=dict(dash="dot"),)
-
-last_quarter_x = trace_euler.x[int(len(trace_euler.x) * 0.75):]
-range_x2 = [min(last_quarter_x, default=0), max(last_quarter_x, default=0)]
-
-fig.update_layout(
-    legend=dict(orientation='h',
-                yanchor='top',
-                y=-0.2,
-                xanchor='left'),
-    margin=dict(l=20, r=20, t=20, b=20),
-    modebar=dict(orientation='v'),
-    xaxis=dict(title='Terms'),
-    yaxis=dict(title='Approximation'),
-    xaxis2=dict(domain=[0.7, 0.95], anchor='y2', range=range_x2,
-                showline=True, mirror=True, linecolor='black', linewidth=1,
-                ),
-    yaxis2=dict(domain=[0.2, 0.5], anchor='x2', range=[3.13, 3.1425],
-                showline=True, mirror=True, linecolor='black', linewidth=1,
-                ),
-)
-
-fig.add_annotation(xref='x2 domain', yref='y2 domain',
-                   x=0.5, y=1,
-                   text='Zoom',
-                   showarrow=False,
-                   yanchor='bottom',
-                   )
 
+    fig.add_hline(xref='x2', y=np.pi, line_dash='dot')  # ignored by Plotly. Issue #3755
+    # work around to add pi horizontal line:                      (PT-BR-> gambiarra!)
+    fig.add_shape(type="line", xref="x2 domain", yref="y2", x0=0, y0=np.pi, x1=1,
+                  y1=np.pi, line=dict(dash="dot"),)
+
+    range_x2 = [int(maximum * 0.75) + 1, maximum] if maximum else [0, 0]
+    # partial curves are drawn on the final axis, so they grow from left to right
+    range_x = None if length == maximum else [0, maximum]
+
+    fig.update_layout(
+        legend=dict(orientation='h',
+                    yanchor='top',
+                    y=-0.2,
+                    xanchor='left'),
+        margin=dict(l=20, r=20, t=20, b=20),
+        modebar=dict(orientation='v'),
+        xaxis=dict(title='Terms', range=range_x),
+        yaxis=dict(title='Approximation'),
+        xaxis2=dict(domain=[0.7, 0.95], anchor='y2', range=range_x2,
+                    showline=True, mirror=True, linecolor='black', linewidth=1,
+                    ),
+        yaxis2=dict(domain=[0.2, 0.5], anchor='x2', range=[3.13, 3.1425],
+                    showline=True, mirror=True, linecolor='black', linewidth=1,
+                    ),
+    )
+
+    fig.add_annotation(xref='x2 domain', yref='y2 domain',
+                       x=0.5, y=1,
+                       text='Zoom',
+                       showarrow=False,
+                       yanchor='bottom',
+                       )
+    return fig
+
+
+with st.sidebar:
+    maximum = st.select_slider('Terms', TERMS_OPTIONS, 100)
+    selected = st.multiselect('Series', list(SERIES), list(SERIES),
+                              format_func=lambda name: SERIES[name].title)
 
 st.markdown(''.join(content[0]))
-st.plotly_chart(fig, use_container_width=True, config=CONFIG_PLOTLY)
+chart = st.empty()
+
+# long curves are computed by a background job, one per session (a newer request
+# cancels the previous one), and drawn as they grow
+key = ('progressive_curves', maximum, tuple(selected))
+curves = RESULT_CACHE.get(key)
+if curves is None:
+    job = JOBS.submit(progressive_curves, maximum, series=tuple(selected),
+                      key=(st.session_state['session_id'], 'series'))
+    for partial in job.partials():
+        if len(next(iter(partial.values()), ())) < maximum:
+            chart.plotly_chart(series_figure(partial, maximum),
+                               use_container_width=True, config=CONFIG_PLOTLY)
+    curves = job.result()
+    RESULT_CACHE.put(key, curves)
+
+with st.sidebar:
+    for name, curve in curves.items():
+        pi_maximum = curve[-1] if maximum else 0
+        st.write(f'Estimation of pi - {SERIES[name].title}:', pi_maximum)
+        st.write(f'Error - {SERIES[name].title}:',
+                 round(error(pi_maximum, np.pi) * 100, 2), '%')
+
+chart.plotly_chart(series_figure(curves, maximum),
+                   use_container_width=True, config=CONFIG_PLOTLY)
 st.markdown(''.join(content[1]))
@@ -1,9 +1,14 @@
 import random
+import uuid
 
+import numpy as np
+import plotly.graph_objects as go
 import streamlit as st
 
+from src.cache import RESULT_CACHE
 from src.compute_pi import PiMonteCarlo
 from src.helpers import load_css, CONFIG_PLOTLY, text_from_markdown
+from src.jobs import JOBS, progressive_monte_carlo
 
 st.set_page_config(layout="centered", page_title="π - Monte Carlo",
                    page_icon=":chart_with_upwards_trend:")
@@ -13,35 +18,80 @@ load_css("pages/styles.css")
 PAGE_TEXT_FILE = 'pages/03_Monte_Carlo.md'
 content = text_from_markdown(PAGE_TEXT_FILE)
 
-MINIMUM = 1
-MAXIMUM = 10_000
 INITIAL_VALUE = 10
+# every 500 points up to 10,000 and then 1-2-5 steps up to 10 million points. Large
+# runs are plotted with WebGL and at most PiMonteCarlo.MAX_PLOTTED_POINTS points.
+POINTS_OPTIONS = [INITIAL_VALUE, *range(500, 10_001, 500),
+                  *(m * 10 ** e for e in range(4, 7) for m in (2, 5, 10))]
 
 # TODO create page text
 
 if 'random_integer' not in st.session_state:
     st.session_state['random_integer'] = INITIAL_VALUE
 
+# one estimator per session: when the number of points changes only the difference is
+# drawn and counted. Its seed also keys the figures in the shared cache. It keeps at
+# most the plotted points (1.6 MB); larger runs are counted by a PiMonteCarloStream.
+MAX_STORED_POINTS = PiMonteCarlo.MAX_PLOTTED_POINTS
+if 'pi_monte_carlo' not in st.session_state:
+    st.session_state['pi_monte_carlo'] = PiMonteCarlo(1, random.randrange(2 ** 32))
+if 'session_id' not in st.session_state:
+    st.session_state['session_id'] = uuid.uuid4().hex
+
 
 def random_integer():
-    st.session_state['random_integer'] = random.randint(MINIMUM, MAXIMUM)
+    st.session_state['random_integer'] = random.choice(POINTS_OPTIONS)
+
+
+def convergence_figure(partials, points):
+    """
+    Partial estimations of a running job with their 95 % confidence intervals
+    """
+    fig = go.Figure(go.Scatter(x=[partial.samples for partial in partials],
+                               y=[partial.estimate for partial in partials],
+                               error_y=dict(array=[1.96 * partial.standard_error
+                                                   for partial in partials]),
+                               mode='lines+markers', name='Estimation'))
+    fig.add_hline(y=np.pi, line_dash='dot', annotation_text='Pi value',
+                  annotation_position='top left')
+    fig.update_layout(xaxis=dict(title='Points', type='log',
+                                 range=[0, np.log10(max(points, 10))]),
+                      yaxis=dict(title='Approximation'),
+                      margin=dict(l=20, r=20, t=20, b=20))
+    return fig
 
 
 with st.sidebar:
-    points = st.slider('Points', 0, MAXIMUM,
-                       st.session_state['random_integer'], 500)
+    points = st.select_slider('Points', POINTS_OPTIONS,
+                              st.session_state['random_integer'])
     st.button('Random number', on_click=random_integer)
 
-pi_monte_carlo = PiMonteCarlo(1)
-pi_monte_carlo.points = int(points) if points != 0 else 1
-
 st.markdown(''.join(content[0]))
-st.plotly_chart(pi_monte_carlo.plot(backend='plotly', arc=True),
-                use_container_width=True,
-                config=CONFIG_PLOTLY)
+chart = st.empty()
+
+# the points are drawn by a background job, one per session: a newer request cancels
+# the previous one. The estimator is only used by the page after its job finished.
+pi_monte_carlo = st.session_state['pi_monte_carlo']
+job = JOBS.submit(progressive_monte_carlo, pi_monte_carlo, int(points),
+                  max_stored_points=MAX_STORED_POINTS,
+                  key=(st.session_state['session_id'], 'monte_carlo'))
+partials = []
+for partial in job.partials():
+    partials.append(partial)
+    if partial.samples < points:
+        chart.plotly_chart(convergence_figure(partials, points),
+                           use_container_width=True, config=CONFIG_PLOTLY)
+result = job.result()
+
+figure = RESULT_CACHE.get_or_compute(
+    ('PiMonteCarlo.plot', pi_monte_carlo.points, pi_monte_carlo.seed, 'plotly', True),
+    pi_monte_carlo.plot, backend='plotly', arc=True)
+chart.plotly_chart(figure,
+                   use_container_width=True,
+                   config=CONFIG_PLOTLY)
 st.markdown(''.join(content[1]))
 
 with st.sidebar:
-    st.write('Number of points:', pi_monte_carlo.points)
-    st.write('Estimation of pi:', pi_monte_carlo.calculate)
-    st.write('Percent error:', round(pi_monte_carlo.error() * 100, 2), '%')
+    st.write('Number of points:', result.points)
+    st.write('Estimation of pi:', result.calculate)
+    st.write('Percent error:', round(result.error() * 100, 2), '%')
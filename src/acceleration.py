@@ -0,0 +1,241 @@
+from collections import namedtuple
+
+import numpy as np
+
+Acceleration = namedtuple('Acceleration', ('estimate', 'error_estimate', 'terms_used'))
+
+
+def leibniz_alternating_curve(number_of_terms):
+    """
+    Partial sums of the original (alternating) Leibniz series, 4 (1 - 1/3 + 1/5 - ...)
+
+    `pi_leibniz` pairs consecutive terms, so its partial sums are the even partial
+    sums of this series and are not alternating anymore. The Euler transform, Aitken
+    and Wynn-epsilon methods work on this form.
+
+    Parameters
+    ----------
+    number_of_terms : int
+        Terms of the infinite series
+
+    Returns
+    -------
+    numpy array
+        Element i is the approximation with i + 1 terms
+    """
+    k = np.arange(number_of_terms)
+    return 4 * np.cumsum(np.where(k % 2, -1.0, 1.0) / (2 * k + 1))
+
+
+def aitken(partial_sums, window=32):
+    """
+    Iterated Aitken delta-squared process
+
+    Suited to linearly convergent and alternating sequences.
+
+    Parameters
+    ----------
+    partial_sums : sequence of floats
+        Approximations with 1, 2, ..., N terms
+    window : int, optional
+        Only the last `window` partial sums are transformed, which keeps the cost
+        independent of N. Default: 32
+
+    Returns
+    -------
+    Acceleration
+        The error estimate is the change of the last value between the last two
+        iterations. `accelerate` reports a more reliable one.
+    """
+    values = np.asarray(partial_sums[-window:], dtype=float)
+    previous = values[-1]
+    error_estimate = np.inf
+    while len(values) >= 3:
+        first = np.diff(values)
+        second = np.diff(first)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            transformed = values[2:] - first[1:] ** 2 / second
+        if not np.all(np.isfinite(transformed)):
+            break
+        values = transformed
+        error_estimate = abs(values[-1] - previous)
+        previous = values[-1]
+    return Acceleration(float(previous), float(error_estimate), len(partial_sums))
+
+
+def wynn_epsilon(partial_sums, window=32):
+    """
+    Wynn epsilon algorithm, equivalent to the Shanks transformation of every order
+
+    Suited to linearly convergent and alternating sequences.
+
+    Parameters
+    ----------
+    partial_sums : sequence of floats
+        Approximations with 1, 2, ..., N terms
+    window : int, optional
+        Only the last `window` partial sums are transformed, which keeps the cost
+        independent of N. Default: 32
+
+    Returns
+    -------
+    Acceleration
+        The error estimate is the difference between the last two even columns of the
+        epsilon table. `accelerate` reports a more reliable one.
+    """
+    current = np.asarray(partial_sums[-window:], dtype=float)
+    previous = np.zeros(len(current) + 1)
+    estimates = [current[-1]]
+    column = 0
+    while len(current) >= 2:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            following = previous[1:-1] + 1 / np.diff(current)
+        if not np.all(np.isfinite(following)):
+            break
+        previous, current = current, following
+        column += 1
+        if column % 2 == 0:
+            estimates.append(current[-1])
+    error_estimate = abs(estimates[-1] - estimates[-2]) if len(estimates) > 1 else np.inf
+    return Acceleration(float(estimates[-1]), float(error_estimate), len(partial_sums))
+
+
+def richardson(partial_sums, max_order=8):
+    """
+    Richardson extrapolation for sequences whose error is a series in 1 / n
+
+    The approximations with N, N // 2, N // 4, ... terms are extrapolated to 1 / n = 0
+    with a Neville table on the actual step sizes 1 / n, so N does not need to be a
+    power of two (for powers of two it is the Romberg table of factors 2 ** k).
+    Suited to the monotone sequences of `pi_leibniz` and `pi_euler`.
+
+    Parameters
+    ----------
+    partial_sums : sequence of floats
+        Approximations with 1, 2, ..., N terms
+    max_order : int, optional
+        Maximum number of eliminated error terms. Default: 8
+
+    Returns
+    -------
+    Acceleration
+        The error estimate is the difference between the last two orders.
+        `accelerate` reports a more reliable one.
+    """
+    size = len(partial_sums)
+    order = min(max_order, size.bit_length() - 1)
+    steps = [1 / (size >> j) for j in range(order, -1, -1)]
+    table = [float(partial_sums[(size >> j) - 1]) for j in range(order, -1, -1)]
+    estimates = [table[-1]]
+    for k in range(1, order + 1):
+        table = [(steps[i] * fine - steps[i + k] * coarse) / (steps[i] - steps[i + k])
+                 for i, (coarse, fine) in enumerate(zip(table, table[1:]))]
+        estimates.append(table[-1])
+    error_estimate = abs(estimates[-1] - estimates[-2]) if len(estimates) > 1 else np.inf
+    return Acceleration(estimates[-1], float(error_estimate), size)
+
+
+def euler_transform(partial_sums, window=32):
+    """
+    Euler transform of an alternating series, computed as repeated averaging of
+    consecutive partial sums (van Wijngaarden form)
+
+    Parameters
+    ----------
+    partial_sums : sequence of floats
+        Partial sums of an alternating series, with 1, 2, ..., N terms
+    window : int, optional
+        Only the last `window` partial sums are transformed, which keeps the cost
+        independent of N. Default: 32
+
+    Returns
+    -------
+    Acceleration
+        The error estimate is the change of the last value between the last two
+        averaging steps. `accelerate` reports a more reliable one.
+    """
+    values = np.asarray(partial_sums[-window:], dtype=float)
+    previous = values[-1]
+    error_estimate = np.inf
+    while len(values) >= 2:
+        values = (values[:-1] + values[1:]) / 2
+        error_estimate = abs(values[-1] - previous)
+        previous = values[-1]
+    return Acceleration(float(previous), float(error_estimate), len(partial_sums))
+
+
+ACCELERATION_METHODS = {
+    'aitken': aitken,
+    'wynn': wynn_epsilon,
+    'richardson': richardson,
+    'euler': euler_transform,
+}
+
+
+def accelerate(partial_sums, method='richardson', **options):
+    """
+    Applies a convergence acceleration method to a sequence of partial sums
+
+    Parameters
+    ----------
+    partial_sums : sequence of floats
+        Approximations with 1, 2, ..., N terms, e.g. from `pi_leibniz_curve`
+    method : str, optional
+        'aitken', 'wynn', 'richardson' or 'euler'. Default: 'richardson'
+    options
+        Options of the method, e.g. `window` or `max_order`
+
+    Returns
+    -------
+    Acceleration
+        The error estimate is the largest of the estimate of the method and the
+        difference with the same method applied to the first N/2 partial sums. The
+        estimate of the method alone only measures how much its last step changed
+        the result, which is tiny when the method converges to a wrong limit (e.g.
+        the Euler transform of the monotone `pi_leibniz_curve`).
+    """
+    if method not in ACCELERATION_METHODS:
+        raise ValueError(f'Method must be one of {", ".join(ACCELERATION_METHODS)}')
+    if len(partial_sums) == 0:
+        raise ValueError('At least one partial sum is needed')
+    function = ACCELERATION_METHODS[method]
+    result = function(partial_sums, **options)
+    if len(partial_sums) < 2:
+        return result
+    half = function(partial_sums[:len(partial_sums) // 2], **options)
+    error_estimate = max(result.error_estimate, abs(result.estimate - half.estimate))
+    return result._replace(error_estimate=float(error_estimate))
+
+
+def accelerate_to_tolerance(curve, method='richardson', tolerance=1e-12,
+                            initial_terms=8, max_terms=2 ** 24, **options):
+    """
+    Doubles the number of terms until the estimated error is below a tolerance
+
+    Parameters
+    ----------
+    curve : callable
+        Returns the partial sums for a number of terms, e.g. `pi_leibniz_curve`
+    method : str, optional
+        'aitken', 'wynn', 'richardson' or 'euler'. Default: 'richardson'
+    tolerance : float, optional
+        Target absolute error. Default: 1e-12
+    initial_terms : int, optional
+        Terms of the first attempt. Default: 8
+    max_terms : int, optional
+        Give up after this number of terms. Default: 2 ** 24
+    options
+        Options of the method, e.g. `window` or `max_order`
+
+    Returns
+    -------
+    Acceleration
+        Result of the last attempt, which may not reach the tolerance if `max_terms`
+        was hit.
+    """
+    terms = initial_terms
+    while True:
+        result = accelerate(curve(terms), method, **options)
+        if result.error_estimate <= tolerance or terms >= max_terms:
+            return result
+        terms = min(2 * terms, max_terms)
@@ -0,0 +1,170 @@
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import draw_coords, error, inside_quadrant
+from src.series import get_series
+from src.summation import DEFAULT_CHUNK_SIZE, chunk_bounds
+
+BatchResult = namedtuple('BatchResult', ('estimates', 'errors'))
+
+
+def _as_counts(values, name):
+    values = np.asarray(values)
+    if values.ndim != 1 or not np.issubdtype(values.dtype, np.integer):
+        raise TypeError(f'{name} must be a one-dimensional array of integers')
+    return values.astype(np.int64)
+
+
+def _prefix_sums(terms, start, counts, chunk_size):
+    """
+    Sums of the first `counts` terms of a series, for every count at once
+
+    The terms are summed once, up to the largest count, with a running cumulative sum,
+    so each result is the same as the naive sum of `src.summation.sum_terms`.
+    """
+    sums = np.zeros(len(counts))
+    order = np.argsort(counts, kind='stable')
+    sorted_counts = counts[order]
+    position = np.searchsorted(sorted_counts, 1)
+    total = 0.0
+    for first, last in chunk_bounds(0, int(sorted_counts[-1]) if len(counts) else 0,
+                                    chunk_size):
+        values = terms(np.arange(first, last) + start)
+        partial = np.cumsum(np.concatenate(([total], values)))
+        end = np.searchsorted(sorted_counts, last, side='right')
+        sums[order[position:end]] = partial[sorted_counts[position:end] - first]
+        position = end
+        total = partial[-1]
+    return sums
+
+
+def pi_series_batch(series, number_of_terms, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Pi approximations using an infinite series for many numbers of terms at once
+
+    The series is summed once up to the largest number of terms, so the cost is the
+    one of the largest configuration. The estimates are the same as
+    `src.series.pi_series`.
+
+    Parameters
+    ----------
+    series : str or Series
+        'leibniz', 'euler', 'nilakantha', 'wallis', 'ramanujan' or 'bbp'
+    number_of_terms : sequence of ints
+        Terms of the infinite series of each configuration
+    chunk_size : int, optional
+        Terms summed at a time. Default: 2 ** 20
+
+    Returns
+    -------
+    BatchResult
+        Arrays of estimates and errors
+    """
+    series = get_series(series)
+    counts = _as_counts(number_of_terms, 'Number of terms')
+    estimates = series.pi_from_sum(_prefix_sums(series.terms, series.start, counts,
+                                                chunk_size))
+    return BatchResult(estimates, error(estimates, math.pi))
+
+
+def pi_leibniz_batch(number_of_terms, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Pi approximations using Leibniz formula for many numbers of terms at once. The
+    estimates are the same as `pi_leibniz`, see `pi_series_batch`.
+
+    Parameters
+    ----------
+    number_of_terms : sequence of ints
+        Terms of the infinite series of each configuration
+    chunk_size : int, optional
+        Terms summed at a time. Default: 2 ** 20
+
+    Returns
+    -------
+    BatchResult
+        Arrays of estimates and errors
+    """
+    return pi_series_batch('leibniz', number_of_terms, chunk_size)
+
+
+def pi_euler_batch(number_of_terms, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Pi approximations using Euler formula for many numbers of terms at once. The
+    estimates are the same as `pi_euler`, see `pi_series_batch`.
+
+    Parameters
+    ----------
+    number_of_terms : sequence of ints
+        Terms of the infinite series of each configuration
+    chunk_size : int, optional
+        Terms summed at a time. Default: 2 ** 20
+
+    Returns
+    -------
+    BatchResult
+        Arrays of estimates and errors
+    """
+    return pi_series_batch('euler', number_of_terms, chunk_size)
+
+
+def _hits_for_seed(seed, counts, chunk_size):
+    """
+    Points inside the quadrant among the first `counts` points of a seed, for every
+    count at once, drawing the points only once
+    """
+    rng = np.random.default_rng(seed)
+    hits = np.zeros(len(counts), dtype=np.int64)
+    order = np.argsort(counts, kind='stable')
+    sorted_counts = counts[order]
+    position = 0
+    total = 0
+    for first, last in chunk_bounds(0, int(sorted_counts[-1]), chunk_size):
+        coords = draw_coords(rng, last - first)
+        cumulative = np.cumsum(inside_quadrant(coords.x, coords.y), dtype=np.int64)
+        end = np.searchsorted(sorted_counts, last, side='right')
+        hits[order[position:end]] = total + cumulative[sorted_counts[position:end]
+                                                       - first - 1]
+        position = end
+        total += int(cumulative[-1])
+    return hits
+
+
+def pi_monte_carlo_batch(points, seeds,
+                         chunk_size=PiMonteCarloStream.DEFAULT_CHUNK_SIZE):
+    """
+    Pi approximations by Monte Carlo method for many (points, seed) configurations
+
+    Configurations sharing a seed share their points: each seed draws its largest
+    number of points once, in chunks, and every configuration counts a prefix of them.
+    The estimates are the same as `PiMonteCarlo(points, seed).calculate`.
+
+    Parameters
+    ----------
+    points : sequence of ints
+        Number of points of each configuration
+    seeds : sequence of ints
+        Seed of each configuration
+    chunk_size : int, optional
+        Points drawn at a time. Default: 1,000,000
+
+    Returns
+    -------
+    BatchResult
+        Arrays of estimates and errors
+    """
+    counts = _as_counts(points, 'Points')
+    seeds = _as_counts(seeds, 'Seeds')
+    if len(counts) != len(seeds):
+        raise ValueError('Points and seeds must have the same length')
+    if np.any(counts <= 0):
+        raise ValueError('Points must be positive integers')
+    hits = np.zeros(len(counts), dtype=np.int64)
+    unique_seeds, groups = np.unique(seeds, return_inverse=True)
+    for group, seed in enumerate(unique_seeds):
+        selected = np.flatnonzero(groups == group)
+        hits[selected] = _hits_for_seed(int(seed), counts[selected], chunk_size)
+    estimates = 4 * hits / counts
+    return BatchResult(estimates, error(estimates, math.pi))
@@ -0,0 +1,239 @@
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+import numpy as np
+
+from src.compute_pi import PiMonteCarlo
+
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+_MISSING = object()
+
+CacheInfo = namedtuple('CacheInfo',
+                       ('hits', 'misses', 'evictions', 'entries', 'bytes', 'max_bytes'))
+
+
+def sizeof(value, _seen=None):
+    """
+    Approximate memory used by a value, following containers and object attributes.
+    Objects reached more than once (shared or in reference cycles) are counted once.
+
+    Parameters
+    ----------
+    value : object
+
+    Returns
+    -------
+    int
+        Bytes
+    """
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    if isinstance(value, np.ndarray):
+        return value.nbytes + sys.getsizeof(np.empty(0))
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(item, _seen) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(item, _seen) for item in value.values())
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return sys.getsizeof(value) + sizeof(vars(value), _seen)
+    return sys.getsizeof(value)
+
+
+def _read_only(value):
+    """
+    Marks the numpy arrays of a value (also inside tuples, lists and dicts) read-only,
+    so a caller modifying a cached array gets an error instead of corrupting the
+    value returned to every other caller
+    """
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _read_only(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _read_only(item)
+
+
+class ResultCache:
+    """
+    Process-wide memoization of expensive results with a memory budget
+
+    Entries are evicted in least recently used order once their total size exceeds
+    the budget. The cache is thread safe; a value is computed outside the lock, so two
+    threads asking for the same missing key may both compute it.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Memory budget. Default: 256 MiB
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Cached value of a key
+
+        Parameters
+        ----------
+        key : hashable
+        default : object, optional
+            Returned on a miss. Default: None
+
+        Returns
+        -------
+        object
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return default
+
+    def get_or_compute(self, key, function, *args, **kwargs):
+        """
+        Cached value of a key, computed by `function(*args, **kwargs)` on a miss
+
+        Parameters
+        ----------
+        key : hashable
+            Usually (method, parameters..., seed)
+        function : callable
+            Computes the value
+
+        Returns
+        -------
+        object
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = function(*args, **kwargs)
+            self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Stores a value, evicting the least recently used entries if needed. Values
+        larger than the whole budget are not stored. Cached numpy arrays are made
+        read-only since they are shared by every caller.
+
+        Parameters
+        ----------
+        key : hashable
+        value : object
+        """
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return
+        _read_only(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """
+        Cache counters
+
+        Returns
+        -------
+        CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries),
+                             self._bytes, self.max_bytes)
+
+    def memoize(self, function):
+        """
+        Decorator that caches a function by (function name, arguments)
+
+        Parameters
+        ----------
+        function : callable
+            Function with hashable arguments
+
+        Returns
+        -------
+        callable
+        """
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = (function.__qualname__, args, tuple(sorted(kwargs.items())))
+            return self.get_or_compute(key, function, *args, **kwargs)
+
+        return wrapper
+
+
+RESULT_CACHE = ResultCache()
+
+
+def _computed_monte_carlo(points, seed):
+    pi_monte_carlo = PiMonteCarlo(points, seed)
+    pi_monte_carlo.calculate
+    return pi_monte_carlo
+
+
+def cached_monte_carlo(points, seed, cache=RESULT_CACHE):
+    """
+    PiMonteCarlo with its estimation already calculated, shared through a cache
+
+    Runs without seed are random by definition and are never cached. The returned
+    object is shared, so it must not be modified (e.g. its points or seed set).
+
+    Parameters
+    ----------
+    points : int
+        number of points
+    seed : int or None
+        seed used by the NumPy PRNG
+    cache : ResultCache, optional
+        Default: RESULT_CACHE
+
+    Returns
+    -------
+    PiMonteCarlo
+    """
+    if seed is None:
+        return _computed_monte_carlo(points, seed)
+    return cache.get_or_compute(('PiMonteCarlo', points, seed),
+                                _computed_monte_carlo, points, seed)
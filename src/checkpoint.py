@@ -0,0 +1,165 @@
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import MonteCarloResult
+from src.series import get_series
+from src.summation import DEFAULT_CHUNK_SIZE, chunk_bounds, make_accumulator
+
+CHECKPOINT_VERSION = 1
+DEFAULT_INTERVAL = 60.0
+
+
+def save_checkpoint(path, state):
+    """
+    Writes a checkpoint atomically: the state is written to a temporary file in the
+    same directory, flushed to disk and renamed over the previous checkpoint, so a
+    crash never leaves a partial file.
+
+    Parameters
+    ----------
+    path : str
+        Checkpoint file
+    state : dict
+        JSON serializable state
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', dir=directory, delete=False,
+                                     suffix='.tmp') as file:
+        json.dump({'version': CHECKPOINT_VERSION, **state}, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(file.name, path)
+
+
+def load_checkpoint(path):
+    """
+    Reads a checkpoint
+
+    Parameters
+    ----------
+    path : str
+        Checkpoint file
+
+    Returns
+    -------
+    dict or None
+        The saved state, None if there is no checkpoint
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        state = json.load(file)
+    if state.pop('version', None) != CHECKPOINT_VERSION:
+        raise ValueError(f'Unsupported checkpoint version in {path}')
+    return state
+
+
+def _check_matches(state, path, **expected):
+    for name, value in expected.items():
+        if state.get(name) != value:
+            raise ValueError(f'Checkpoint {path} has {name}={state.get(name)!r}, '
+                             f'not {value!r}')
+
+
+def pi_monte_carlo_checkpointed(points, seed, path,
+                                chunk_size=PiMonteCarloStream.DEFAULT_CHUNK_SIZE,
+                                interval=DEFAULT_INTERVAL):
+    """
+    Monte Carlo estimation that saves its progress to a checkpoint file
+
+    An existing checkpoint of the same run is resumed. Checkpoints are taken between
+    chunks, so a resumed run draws the same chunks and gives exactly the same result
+    as an uninterrupted one. The file is kept, with the final state, at the end.
+
+    Parameters
+    ----------
+    points : int
+        number of points
+    seed : int or None
+        seed used by the NumPy PRNG
+    path : str
+        Checkpoint file
+    chunk_size : int, optional
+        number of points drawn at a time. Default: 1,000,000
+    interval : float, optional
+        Minimum seconds between checkpoints. Default: 60
+
+    Returns
+    -------
+    MonteCarloResult
+    """
+    state = load_checkpoint(path)
+    if state is None:
+        stream = PiMonteCarloStream(points, seed, chunk_size)
+    else:
+        _check_matches(state, path, kind='monte-carlo', points=points, seed=seed,
+                       chunk_size=chunk_size)
+        stream = PiMonteCarloStream.from_state(state)
+    last_save = time.monotonic()
+    while stream.trials < points:
+        stream.advance(min(chunk_size, points - stream.trials))
+        if time.monotonic() - last_save >= interval:
+            save_checkpoint(path, {'kind': 'monte-carlo', **stream.state})
+            last_save = time.monotonic()
+    save_checkpoint(path, {'kind': 'monte-carlo', **stream.state})
+    return MonteCarloResult(stream.calculate, stream.standard_error, stream.trials)
+
+
+def pi_series_checkpointed(series, number_of_terms, path, summation='neumaier',
+                           chunk_size=DEFAULT_CHUNK_SIZE, interval=DEFAULT_INTERVAL):
+    """
+    Series approximation of pi that saves its progress to a checkpoint file
+
+    The checkpoint holds the number of chunks already summed and the accumulator
+    state (e.g. the sum and its compensation term). An existing checkpoint of the
+    same run is resumed and the result is the same as `src.series.pi_series` with the
+    same summation method and chunk size.
+
+    Parameters
+    ----------
+    series : str
+        Name of a series of `src.series.SERIES`, e.g. 'leibniz'
+    number_of_terms : int
+        Terms of the infinite series
+    path : str
+        Checkpoint file
+    summation : str, optional
+        Summation method, see `src.summation.sum_terms`. Default: 'neumaier'
+    chunk_size : int, optional
+        Terms computed at a time. Default: 2 ** 20
+    interval : float, optional
+        Minimum seconds between checkpoints. Default: 60
+
+    Returns
+    -------
+    float
+    """
+    definition = get_series(series)
+    parameters = {'kind': 'series', 'series': definition.name,
+                  'number_of_terms': number_of_terms, 'summation': summation,
+                  'chunk_size': chunk_size}
+    state = load_checkpoint(path)
+    if state is None:
+        state = {**parameters, 'chunks_done': 0, 'accumulator': None}
+    else:
+        _check_matches(state, path, **parameters)
+    accumulator = make_accumulator(summation, state['accumulator'])
+    reverse = summation == 'reverse'
+    bounds = chunk_bounds(definition.start, definition.start + number_of_terms,
+                          chunk_size, reverse)
+    last_save = time.monotonic()
+    for index in range(state['chunks_done'], len(bounds)):
+        values = definition.terms(np.arange(*bounds[index]))
+        accumulator.add(values[::-1] if reverse else values)
+        if time.monotonic() - last_save >= interval:
+            save_checkpoint(path, {**parameters, 'chunks_done': index + 1,
+                                   'accumulator': accumulator.state})
+            last_save = time.monotonic()
+    save_checkpoint(path, {**parameters, 'chunks_done': len(bounds),
+                           'accumulator': accumulator.state})
+    return definition.pi_from_sum(accumulator.value)
@@ -0,0 +1,210 @@
+"""
+Runs the pi estimators over ranges of terms, points and seeds, without a browser
+
+Results are streamed, one line per run, as JSON lines or CSV. Sizes and seeds are
+lists of values, where each value is an integer or a range: start:stop[:step] for an
+arithmetic range (stop excluded, as Python's range) or start:stop:*factor for a
+geometric one.
+
+    python -m src.cli leibniz euler nilakantha wallis --terms 10:1000001:*10
+    python -m src.cli monte-carlo --points 1000 100000 --seeds 0:100 --workers 4 \\
+        --format csv --output sweep.csv --resume
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import error
+from src.series import SERIES, pi_series
+
+METHODS = (*SERIES, 'monte-carlo')
+FIELDS = ('method', 'size', 'seed', 'estimate', 'error', 'standard_error', 'elapsed')
+
+
+def parse_values(values):
+    """
+    Expands a list of integers and ranges
+
+    Parameters
+    ----------
+    values : sequence of str
+        e.g. ['5', '10:40:10', '100:100001:*10']
+
+    Returns
+    -------
+    list of ints
+        e.g. [5, 10, 20, 30, 100, 1000, 10000, 100000]
+    """
+    result = []
+    for value in values:
+        start, _, rest = value.partition(':')
+        if not rest:
+            result.append(int(start))
+            continue
+        stop, _, step = rest.partition(':')
+        start, stop = int(start), int(stop)
+        if step.startswith('*'):
+            factor = int(step[1:])
+            if factor < 2 or start <= 0:
+                raise ValueError(f'Invalid geometric range: {value}')
+            while start < stop:
+                result.append(start)
+                start *= factor
+        else:
+            result.extend(range(start, stop, int(step or 1)))
+    return result
+
+
+def configurations(methods, terms, points, seeds):
+    """
+    Runs of a sweep, as (method, size, seed) tuples
+
+    Series runs have no seed; every Monte Carlo points value is run with every seed.
+    """
+    for method in methods:
+        if method == 'monte-carlo':
+            yield from ((method, size, seed) for size in points for seed in seeds)
+        else:
+            yield from ((method, size, None) for size in terms)
+
+
+def run(configuration):
+    """
+    Runs one configuration
+
+    Parameters
+    ----------
+    configuration : tuple
+        (method, size, seed)
+
+    Returns
+    -------
+    dict
+        Record with the FIELDS keys
+    """
+    method, size, seed = configuration
+    start = time.perf_counter()
+    standard_error = None
+    if method in SERIES:
+        estimate = pi_series(method, size)
+    else:
+        stream = PiMonteCarloStream(size, seed)
+        estimate = stream.calculate
+        standard_error = stream.standard_error
+    return {'method': method, 'size': size, 'seed': seed, 'estimate': estimate,
+            'error': error(estimate, math.pi), 'standard_error': standard_error,
+            'elapsed': time.perf_counter() - start}
+
+
+def _key(record):
+    seed = record['seed']
+    seed = None if seed in (None, '') else int(seed)
+    return record['method'], int(record['size']), seed
+
+
+def completed_configurations(path, output_format):
+    """
+    Configurations already present in an output file, used to resume a sweep
+
+    Returns
+    -------
+    set of tuples
+        (method, size, seed)
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline='') as file:
+        if output_format == 'csv':
+            return {_key(record) for record in csv.DictReader(file)}
+        return {_key(json.loads(line)) for line in file if line.strip()}
+
+
+def _parse_sizes(parser, option, values, minimum):
+    """
+    Expanded values of an option, reporting invalid ones as usage errors
+    """
+    try:
+        result = parse_values(values)
+    except ValueError as exception:
+        parser.error(f'{option}: {exception}')
+    invalid = [value for value in result if value < minimum]
+    if invalid:
+        parser.error(f'{option} must be at least {minimum}, got {invalid[0]}')
+    return result
+
+
+class _Writer:
+    def __init__(self, file, output_format, header):
+        self.file = file
+        self.csv = csv.DictWriter(file, FIELDS) if output_format == 'csv' else None
+        if self.csv and header:
+            self.csv.writeheader()
+
+    def write(self, record):
+        if self.csv:
+            self.csv.writerow(record)
+        else:
+            self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        epilog='Values are integers, start:stop[:step] or start:stop:*factor ranges')
+    parser.add_argument('methods', nargs='+', choices=METHODS)
+    parser.add_argument('--terms', nargs='+', default=['10:1000001:*10'],
+                        help='Terms of the series. Default: 10:1000001:*10')
+    parser.add_argument('--points', nargs='+', default=['1000:1000001:*10'],
+                        help='Monte Carlo points. Default: 1000:1000001:*10')
+    parser.add_argument('--seeds', nargs='+', default=['0'],
+                        help='Monte Carlo seeds. Default: 0')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl')
+    parser.add_argument('--output', help='File where the results are appended. '
+                                         'Default: standard output')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip the runs already present in the output file')
+    args = parser.parse_args(argv)
+    if args.resume and not args.output:
+        parser.error('--resume needs --output')
+
+    # sizes are checked before the first run, so an invalid value never leaves a
+    # partial sweep in the output
+    terms = _parse_sizes(parser, '--terms', args.terms, 0)
+    points = _parse_sizes(parser, '--points', args.points, 1)
+    seeds = _parse_sizes(parser, '--seeds', args.seeds, 0)
+    pending = list(configurations(args.methods, terms, points, seeds))
+    if args.resume:
+        done = completed_configurations(args.output, args.format)
+        pending = [configuration for configuration in pending
+                   if configuration not in done]
+
+    if args.output:
+        header = not os.path.exists(args.output) or os.path.getsize(args.output) == 0
+        file = open(args.output, 'a', newline='')
+    else:
+        header, file = True, sys.stdout
+    try:
+        writer = _Writer(file, args.format, header)
+        if args.workers > 1:
+            # results are written in the order of the configurations as they arrive
+            with ProcessPoolExecutor(args.workers) as executor:
+                for record in executor.map(run, pending):
+                    writer.write(record)
+        else:
+            for configuration in pending:
+                writer.write(run(configuration))
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+if __name__ == '__main__':
+    main()
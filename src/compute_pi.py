@@ -1,15 +1,16 @@
 import math
-from functools import cached_property
+import time
 
-import matplotlib.pyplot as plt
 import numpy as np
-import plotly.graph_objects as go
-from matplotlib.patches import Arc
 
-from src.helpers import create_coords, distance_points, error
+from src import instrumentation
+from src.helpers import (BIT_GENERATORS, DEFAULT_BIT_GENERATOR, AdaptiveResult,
+                         Coordinates, MonteCarloResult, RunningStats, draw_coords, error,
+                         inside_quadrant, make_rng, stratified_indices)
+from src.series import SERIES
 
 
-def pi_leibniz(number_of_terms):
+def pi_leibniz(number_of_terms, summation='naive'):
     """
     Pi approximation using Leibniz formula
 
@@ -17,6 +18,9 @@ def pi_leibniz(number_of_terms):
     ----------
     number_of_terms : int
         Terms of the infinite series
+    summation : str, optional
+        Summation method: 'naive', 'neumaier', 'pairwise' or 'reverse'. See
+        `src.summation.sum_terms`. Default: 'naive'
 
     Returns
     -------
@@ -24,13 +28,10 @@ def pi_leibniz(number_of_terms):
         Pi approximation
     """
 
-    result = 0
-    for k in range(number_of_terms):
-        result += 1 / ((4 * k + 1) * (4 * k + 3))
-    return 8 * result
+    return SERIES['leibniz'].pi(number_of_terms, summation)
 
 
-def pi_euler(number_of_terms):
+def pi_euler(number_of_terms, summation='naive'):
     """
     Pi approximation using Euler formula
 
@@ -38,6 +39,9 @@ def pi_euler(number_of_terms):
     ----------
     number_of_terms : int
         Terms of the infinite series
+    summation : str, optional
+        Summation method: 'naive', 'neumaier', 'pairwise' or 'reverse'. See
+        `src.summation.sum_terms`. Default: 'naive'
 
     Returns
     -------
@@ -45,18 +49,67 @@ def pi_euler(number_of_terms):
         Pi approximation
     """
 
-    result = 0
-    for k in range(1, number_of_terms + 1):
-        result += 1 / k ** 2
-    return math.sqrt(6 * result)
+    return SERIES['euler'].pi(number_of_terms, summation)
+
+
+def pi_leibniz_curve(number_of_terms):
+    """
+    Pi approximations using Leibniz formula for every number of terms from 1 to
+    `number_of_terms`, computed in a single pass with a cumulative sum.
+
+    The values agree with `pi_leibniz` within a relative tolerance of 1e-12 (they are
+    identical while the terms denominators are exactly representable as floats).
+
+    Parameters
+    ----------
+    number_of_terms : int
+        Terms of the infinite series
+
+    Returns
+    -------
+    numpy array
+        Element i is the approximation with i + 1 terms
+    """
+    return SERIES['leibniz'].curve(number_of_terms)
+
+
+def pi_euler_curve(number_of_terms):
+    """
+    Pi approximations using Euler formula for every number of terms from 1 to
+    `number_of_terms`, computed in a single pass with a cumulative sum.
+
+    The values agree with `pi_euler` within a relative tolerance of 1e-12 (they are
+    identical while the squared indices are exactly representable as floats).
+
+    Parameters
+    ----------
+    number_of_terms : int
+        Terms of the infinite series
+
+    Returns
+    -------
+    numpy array
+        Element i is the approximation with i + 1 terms
+    """
+    return SERIES['euler'].curve(number_of_terms)
 
 
 class PiMonteCarlo:
     """
     Pi approximation by Monte Carlo method
+
+    Changing the number of points keeps the points already drawn: when it grows only
+    the extra points are drawn, continuing the same PRNG stream, and when it shrinks a
+    prefix of the stored points is used. The hit count is updated with the difference
+    only. Results are the same as the ones of a new object with the same seed and
+    points.
     """
 
-    def __init__(self, points, seed=None):
+    MAX_PLOTTED_POINTS = 100_000
+    WEBGL_THRESHOLD = 10_000
+
+    def __init__(self, points, seed=None, dtype=np.float64,
+                 bit_generator=DEFAULT_BIT_GENERATOR):
         """
         Class initialization
 
@@ -66,11 +119,29 @@ class PiMonteCarlo:
             number of points
         seed : number, optional
             seed used by the NumPy PRNG. Default None
+        dtype : numpy dtype, optional
+            Storage type of the coordinates, float64 or float32. float32 halves the
+            memory but points very close to the quadrant may change side. Default:
+            float64
+        bit_generator : str, optional
+            NumPy bit generator, see `src.helpers.make_rng`. Default: 'pcg64'
         """
 
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f'Bit generator must be one of {", ".join(BIT_GENERATORS)}')
+        self._dtype = np.dtype(dtype)
+        self._bit_generator = bit_generator
         self.points = points
         self.seed = seed
 
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def bit_generator(self):
+        return self._bit_generator
+
     @property
     def seed(self):
         return self._seed
@@ -92,70 +163,122 @@ class PiMonteCarlo:
         if not isinstance(value, int):
             raise TypeError('Points must be integer')
         if value > 0:
-            self._clear_cache()
+            self._clear_cache(samples=False)
             self._points = value
         else:
             raise ValueError('Points must be a positive integer')
 
-    def _gen_coords(self):
+    def _gen_coords(self, points):
+        """
+        Draws more points coordinates, continuing the PRNG stream of the points
+        already stored
+
+        Parameters
+        ----------
+        points : int
+            number of points to draw
         """
-        Generates points coordinates
+        if self._rng is None:
+            self._rng = make_rng(self.seed, self.bit_generator)
+            self._samples = Coordinates(dtype=self.dtype)
+        self._samples.append(draw_coords(self._rng, points, self.dtype))
+
+    @property
+    def _stored_points(self):
+        return 0 if self._samples is None else len(self._samples)
+
+    def _draw_missing(self):
+        """
+        Draws the points not stored yet, if any
 
         Returns
         -------
-        generator
-            Coordinates generator
+        bool
+            If points were drawn
         """
-        return create_coords(self.points, self.seed)
+        if self._stored_points >= self.points:
+            return False
+        instrumentation.increment('coords_cache_misses')
+        self._gen_coords(self.points - self._stored_points)
+        return True
 
     def _mask(self):
         """
-        Array of 0's (points outside quadrant) and 1's (points inside quadrant)
+        Array of False's (points outside quadrant) and True's (points inside quadrant)
+
+        The classification is stored with the points, one byte per point, so each
+        point is checked only once for a given seed; only points drawn since the last
+        call are checked. The returned array is a view and must not be modified.
 
         Returns
         -------
         numpy array
         """
-        return np.where(
-            np.array([distance_points(c) for c in self.coords]) <= 1, 1,
-            0)
+        self._draw_missing()
+        if self._inside_size < self.points:
+            added = self._samples[self._inside_size:self.points]
+            inside = inside_quadrant(added.x, added.y)
+            size = self._inside_size + len(inside)
+            if size > len(self._inside):
+                buffer = np.empty(max(size, 2 * len(self._inside)), dtype=bool)
+                buffer[:self._inside_size] = self._inside[:self._inside_size]
+                self._inside = buffer
+            self._inside[self._inside_size:size] = inside
+            self._inside_size = size
+        return self._inside[:self.points]
 
     def count_inside_quadrant(self):
         """
-        Count points inside quadrant
+        Count points inside quadrant. Only the points added or removed since the last
+        count are counted.
 
         Returns
         -------
         int
         """
-        return np.sum(self._mask())
+        mask = self._mask()
+        if self._hits_points < self.points:
+            self._hits += np.count_nonzero(mask[self._hits_points:])
+        elif self._hits_points > self.points:
+            self._hits -= np.count_nonzero(self._inside[self.points:self._hits_points])
+        self._hits_points = self.points
+        return self._hits
 
-    @cached_property
+    @property
     def coords(self):
         """
-        Points coordinates. This is a cached property which means that the values are
-        calculated only on the first time. Posterior calls are faster since the value
-        of the first calculation is cached.
+        Points coordinates, a view of the stored points. Missing points are drawn on
+        the first call.
 
         Returns
         -------
-        tuple
+        Coordinates
+            Compact storage with zero-copy `x` and `y` columns. Indexing it returns
+            a Coordinate.
         """
-        return tuple(self._gen_coords())
+        if not self._draw_missing():
+            instrumentation.increment('coords_cache_hits')
+        return self._samples[:self.points]
 
-    @cached_property
+    @property
     def calculate(self):
         """
-        Pi estimation. This is a cached property which means that the value is
-        calculated only on the first time. Posterior calls are faster since the value
-        of the first calculation is cached.
+        Pi estimation. The value is kept until the points or the seed change; after a
+        change of points only the points added or removed since the last estimation
+        are counted (see `count_inside_quadrant`).
 
         Returns
         -------
         float
         """
-        area_estimate = self.count_inside_quadrant() / self.points
-        return area_estimate * 4
+        if self._estimate is None:
+            instrumentation.increment('calculate_cache_misses')
+            with instrumentation.timer('PiMonteCarlo.calculate'):
+                area_estimate = self.count_inside_quadrant() / self.points
+                self._estimate = area_estimate * 4
+        else:
+            instrumentation.increment('calculate_cache_hits')
+        return self._estimate
 
     def error(self, expected=math.pi):
         """
@@ -172,18 +295,30 @@ class PiMonteCarlo:
         """
         return error(self.calculate, expected)
 
-    def _clear_cache(self):
+    def _clear_cache(self, samples=True):
         """
         Clears the cached values. This internal method is called every time that a new
         seed and/or points are set because new coordinates, estimation and errors need
         to be calculated.
+
+        Parameters
+        ----------
+        samples : bool, optional
+            If the stored points, their inside/outside classification, the PRNG and
+            the hit count are cleared too. They are kept when only the number of
+            points changes. Default: True
         """
 
-        if 'coords' in self.__dict__:
-            del self.__dict__['coords']
-        if 'calculate' in self.__dict__:
-            del self.__dict__['calculate']
+        self._estimate = None
+        if samples:
+            self._samples = None
+            self._rng = None
+            self._inside = np.empty(0, dtype=bool)
+            self._inside_size = 0
+            self._hits = 0
+            self._hits_points = 0
 
+    @instrumentation.timed('PiMonteCarlo._colors')
     def _colors(self, dot_colors=('red', 'blue')):
         """
         Relates colors to points (inside, outside) the quadrant.
@@ -197,30 +332,61 @@ class PiMonteCarlo:
         -------
         numpy array
         """
-        return np.where(self._mask() == 1, *dot_colors)
+        return np.where(self._mask(), *dot_colors)
+
+    @instrumentation.timed('PiMonteCarlo._plotted_points')
+    def _plotted_points(self, max_points):
+        """
+        Points drawn on the plot, split in (inside, outside) the quadrant
+
+        At most `max_points` points are returned, chosen by stratified subsampling:
+        each group keeps its share of the points, evenly spread over the samples. The
+        estimation still uses all the points.
+
+        Parameters
+        ----------
+        max_points : int or None
+            Maximum number of points. None means all the points.
 
-    def _matplotlib(self, colors, ax, arc):
+        Returns
+        -------
+        tuple of Coordinates
+            (inside, outside) points
+        """
+        mask = self._mask()
+        indices = stratified_indices(mask, max_points)
+        data = self._samples.data[indices]
+        inside = mask[indices]
+        return Coordinates(data[inside]), Coordinates(data[~inside])
+
+    @instrumentation.timed('PiMonteCarlo._matplotlib')
+    def _matplotlib(self, dot_colors, ax, arc, max_points):
         """
         Plot made with Matplotlib
 
         Parameters
         ----------
-        colors : tuple of strings
+        dot_colors : tuple of strings
             Colors for (inside, outside) the quadrant points.
         ax : matplotlib axis
             Axis on which the graph will be plotted
         arc : bool
             If the quadrant will be plotted
+        max_points : int or None
+            Maximum number of plotted points
 
         Returns
         -------
         matplotlib axis
         """
-        ax.scatter(*zip(*self.coords), color=colors)
+        for points, color in zip(self._plotted_points(max_points), dot_colors):
+            ax.scatter(points.x, points.y, color=color)
         ax.set_title(fr"Points = {self.points:,.0f}   "
                      fr"$\pi \approx$ {self.calculate:.4f}   "
                      fr"Error = {self.error():.2%}")
         if arc:
+            from matplotlib.patches import Arc
+
             arc = Arc(xy=(0, 0), theta1=0, theta2=90, height=2, width=2,
                       color='red', linewidth=3)
             ax.add_patch(arc)
@@ -228,29 +394,42 @@ class PiMonteCarlo:
             ax.set_xlim(-0.02, 1.02)
         return ax
 
-    def _plotly(self, colors, arc):
+    @instrumentation.timed('PiMonteCarlo._plotly')
+    def _plotly(self, dot_colors, arc, max_points):
         """
         Plot made with Plotly
 
+        One trace is used for each color, instead of one color string per point, and
+        WebGL (Scattergl) is used above WEBGL_THRESHOLD plotted points.
+
         Parameters
         ----------
-        colors : tuple of strings
+        dot_colors : tuple of strings
             Colors for (inside, outside) the quadrant points.
         arc : bool
             If the quadrant will be plotted
+        max_points : int or None
+            Maximum number of plotted points
 
         Returns
         -------
         Plotly figure
         """
-        x, y = zip(*self.coords)
+        import plotly.graph_objects as go
+
+        groups = self._plotted_points(max_points)
+        plotted = sum(len(points) for points in groups)
+        scatter = go.Scattergl if plotted > self.WEBGL_THRESHOLD else go.Scatter
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=x, y=y,
-                                 mode='markers',
-                                 marker=dict(color=colors)))
+        for points, color, name in zip(groups, dot_colors, ('Inside', 'Outside')):
+            fig.add_trace(scatter(x=points.x, y=points.y,
+                                  mode='markers',
+                                  name=name,
+                                  showlegend=False,
+                                  marker=dict(color=color)))
         if arc:
             fig.add_shape(type='circle', x0=-1, x1=1, y0=-1, y1=1,
-                          line_color=colors[0])
+                          line_color=dot_colors[0])
         fig.update_xaxes(range=[0, 1], constrain='domain')
         fig.update_yaxes(range=[0, 1], constrain='domain')
         fig.update_layout(xaxis=dict(scaleanchor="y", scaleratio=1),
@@ -260,7 +439,8 @@ class PiMonteCarlo:
         # TODO title
         return fig
 
-    def plot(self, dot_colors=('red', 'blue'), backend='matplotlib', ax=None, arc=False):
+    def plot(self, dot_colors=('red', 'blue'), backend='matplotlib', ax=None, arc=False,
+             max_points=MAX_PLOTTED_POINTS):
         """
         Public plot API
 
@@ -275,18 +455,232 @@ class PiMonteCarlo:
             only if backend is matplotlib. Default: None
         arc : bool
             If the quadrant will be plotted
+        max_points : int or None, optional
+            Maximum number of plotted points; larger runs are subsampled keeping the
+            inside/outside proportion. None plots every point. Default: 100,000
 
         Returns
         -------
         Matplotlib axis or Plotly figure
         """
 
-        colors = self._colors(dot_colors)
         if backend == 'matplotlib':
             if ax is None:
+                import matplotlib.pyplot as plt
+
                 fig, ax = plt.subplots(figsize=(8, 8), facecolor=(1, 1, 1))
-            return self._matplotlib(colors, ax, arc)
+            return self._matplotlib(dot_colors, ax, arc, max_points)
         elif backend == 'plotly':
-            return self._plotly(colors, arc)
+            return self._plotly(dot_colors, arc, max_points)
         else:
             raise ValueError('Backend must be matplotlib or plotly')
+
+
+class PiMonteCarloStream:
+    """
+    Pi approximation by Monte Carlo method with constant memory
+
+    Samples are drawn and counted one chunk at a time and only running totals (hits,
+    trials and the running variance of the hit indicator) are kept. For a given seed
+    the estimate is the same as the one of `PiMonteCarlo`.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1_000_000
+
+    def __init__(self, points, seed=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 bit_generator=DEFAULT_BIT_GENERATOR, offset=0):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        points : int
+            number of points
+        seed : number or numpy.random.SeedSequence, optional
+            seed used by the NumPy PRNG. Default None
+        chunk_size : int, optional
+            number of points drawn at a time. Default: 1,000,000
+        bit_generator : str, optional
+            NumPy bit generator, see `src.helpers.make_rng`. Default: 'pcg64'
+        offset : int, optional
+            Index of the first point in the stream of the seed. The run uses the
+            points [offset, offset + points), so runs over consecutive ranges give
+            the points of a single run. Default: 0
+        """
+
+        if not isinstance(points, int):
+            raise TypeError('Points must be integer')
+        if points <= 0:
+            raise ValueError('Points must be a positive integer')
+        if not isinstance(seed, (type(None), int, np.random.SeedSequence)):
+            raise TypeError('Seed must be None, integer or SeedSequence')
+        if not isinstance(chunk_size, int):
+            raise TypeError('Chunk size must be integer')
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be a positive integer')
+        if not isinstance(offset, int):
+            raise TypeError('Offset must be integer')
+
+        self.points = points
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.hits = 0
+        self.stats = RunningStats()
+        self.bit_generator = bit_generator
+        self.offset = offset
+        self._rng = make_rng(seed, bit_generator, offset)
+
+    @property
+    def state(self):
+        """
+        Progress of the run as plain values (JSON serializable): the parameters, the
+        running totals and the state of the PRNG bit generator. A SeedSequence seed
+        is stored as None; the PRNG state is enough to continue the stream.
+
+        Returns
+        -------
+        dict
+        """
+        return {'points': self.points,
+                'seed': self.seed if isinstance(self.seed, (type(None), int)) else None,
+                'chunk_size': self.chunk_size,
+                'bit_generator': self.bit_generator,
+                'offset': self.offset,
+                'hits': self.hits,
+                'stats': {'count': self.stats.count, 'mean': float(self.stats.mean),
+                          'm2': float(self.stats.m2)},
+                'rng': self._rng.bit_generator.state}
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Recreates a run from its `state`, continuing the same PRNG stream
+
+        Parameters
+        ----------
+        state : dict
+            Value of the `state` property
+
+        Returns
+        -------
+        PiMonteCarloStream
+        """
+        stream = cls(state['points'], state['seed'], state['chunk_size'],
+                     state.get('bit_generator', DEFAULT_BIT_GENERATOR),
+                     state.get('offset', 0))
+        stream.hits = state['hits']
+        stream.stats = RunningStats(**state['stats'])
+        stream._rng.bit_generator.state = state['rng']
+        return stream
+
+    @property
+    def trials(self):
+        """
+        Number of points already drawn
+
+        Returns
+        -------
+        int
+        """
+        return self.stats.count
+
+    def advance(self, points):
+        """
+        Draws and counts more points, one chunk at a time
+
+        Parameters
+        ----------
+        points : int
+            number of points to draw
+        """
+        while points > 0:
+            size = min(points, self.chunk_size)
+            coords = draw_coords(self._rng, size)
+            hits = int(np.count_nonzero(inside_quadrant(coords.x, coords.y)))
+            self.hits += hits
+            self.stats.update_bernoulli(hits, size)
+            points -= size
+
+    @property
+    def calculate(self):
+        """
+        Pi estimation. The points not drawn yet are drawn on the first call.
+
+        Returns
+        -------
+        float
+        """
+        self.advance(self.points - self.trials)
+        return 4 * self.hits / self.trials
+
+    def run_until(self, target_error, level=0.95, max_time=None, initial_batch=10_000):
+        """
+        Draws points in growing batches until the confidence interval half width is
+        below a target error. `points` is the hard cap on the number of samples.
+
+        Batches double in size up to `chunk_size` and the stopping rule is checked
+        after each one, so at most one batch is drawn past the target or time limit.
+
+        Parameters
+        ----------
+        target_error : float
+            Target half width of the confidence interval
+        level : float, optional
+            Confidence level. Default: 0.95
+        max_time : float, optional
+            Time limit in seconds. Default: None (no limit)
+        initial_batch : int, optional
+            Size of the first batch. Default: 10,000
+
+        Returns
+        -------
+        AdaptiveResult
+            Estimation, confidence interval, samples used, elapsed seconds and whether
+            the target error was reached
+        """
+        if target_error <= 0:
+            raise ValueError('Target error must be positive')
+        if not 0 < level < 1:
+            raise ValueError('Confidence level must be between 0 and 1')
+        start = time.perf_counter()
+        batch = initial_batch
+        while True:
+            self.advance(min(batch, self.points - self.trials))
+            result = MonteCarloResult(4 * self.hits / self.trials, self.standard_error,
+                                      self.trials)
+            lower, upper = result.confidence_interval(level)
+            # a zero variance only means that too few points were drawn yet
+            converged = ((upper - lower) / 2 <= target_error
+                         and 0 < self.hits < self.trials)
+            elapsed = time.perf_counter() - start
+            if (converged or self.trials >= self.points
+                    or (max_time is not None and elapsed >= max_time)):
+                return AdaptiveResult(result.estimate, (float(lower), float(upper)),
+                                      self.trials, elapsed, bool(converged))
+            batch = min(self.trials, self.chunk_size)
+
+    @property
+    def standard_error(self):
+        """
+        Standard error of the estimation
+
+        Returns
+        -------
+        float
+        """
+        return 4 * self.stats.standard_error
+
+    def error(self, expected=math.pi):
+        """
+        Estimation error
+
+        Parameters
+        ----------
+        expected : float, optional
+            Pi value of reference. Default: math.pi
+
+        Returns
+        -------
+        float
+        """
+        return error(self.calculate, expected)
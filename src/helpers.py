@@ -1,7 +1,9 @@
 from collections import namedtuple
+from statistics import NormalDist
 
 import numpy as np
-import streamlit as st
+
+from src import instrumentation
 
 PLOTLY_REMOVE_FROM_MODEBAR = ["zoomIn", "zoomOut", "resetScale"]
 PLOTLY_ADD_TO_MODEBAR = ["v1hovermode", "toggleSpikelines"]
@@ -14,6 +16,47 @@ CONFIG_PLOTLY = {
 
 Coordinate = namedtuple('Coordinate', ('x', 'y'))
 
+# name: (bit generator, stream values skipped per `advance` step, None if it cannot
+# skip ahead)
+BIT_GENERATORS = {
+    'pcg64': (np.random.PCG64, 1),
+    'pcg64dxsm': (np.random.PCG64DXSM, 1),
+    'philox': (np.random.Philox, 4),
+    'sfc64': (np.random.SFC64, None),
+    'mt19937': (np.random.MT19937, None),
+}
+DEFAULT_BIT_GENERATOR = 'pcg64'
+
+
+class MonteCarloResult(namedtuple('MonteCarloResult',
+                                  ('estimate', 'standard_error', 'samples'))):
+    """
+    Monte Carlo estimation of pi with its standard error and the number of samples used
+    """
+
+    __slots__ = ()
+
+    def confidence_interval(self, level=0.95):
+        """
+        Normal approximation confidence interval of the estimation
+
+        Parameters
+        ----------
+        level : float, optional
+            Confidence level. Default: 0.95
+
+        Returns
+        -------
+        tuple of floats
+            (lower, upper) bounds
+        """
+        half_width = NormalDist().inv_cdf(0.5 + level / 2) * self.standard_error
+        return self.estimate - half_width, self.estimate + half_width
+
+
+AdaptiveResult = namedtuple('AdaptiveResult', ('estimate', 'confidence_interval',
+                                               'samples', 'elapsed', 'converged'))
+
 
 def distance_points(coord1, coord2=Coordinate(0, 0)):
     """
@@ -68,10 +111,371 @@ def create_coords(points, seed=None):
         Coordinates generator
     """
     rng = np.random.default_rng(seed)
+    instrumentation.increment('samples_generated', int(points))
     return (Coordinate(rng.uniform(), rng.uniform()) for _ in
             range(int(points)))
 
 
+class Coordinates:
+    """
+    Compact storage of points coordinates
+
+    The points are kept in a single (N, 2) float array, 16 bytes per point in float64
+    (8 in float32), instead of one Coordinate namedtuple per point. The `x` and `y`
+    columns are zero-copy views. Indexing with an integer still returns a Coordinate,
+    so code written for a tuple of Coordinate keeps working.
+
+    Points can be appended; the underlying buffer grows geometrically, so appending
+    is amortized linear in the number of new points.
+    """
+
+    def __init__(self, data=None, dtype=np.float64):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        data : array-like of shape (N, 2), optional
+            Points coordinates. Default: no points
+        dtype : numpy dtype, optional
+            Storage type, float64 or float32. Default: float64
+        """
+        data = np.empty((0, 2), dtype) if data is None else np.asarray(data, dtype)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError('Coordinates data must have shape (N, 2)')
+        self._buffer = data
+        self._size = len(data)
+
+    @property
+    def data(self):
+        """
+        Points coordinates as a (N, 2) array (a view of the storage)
+
+        Returns
+        -------
+        numpy array
+        """
+        return self._buffer[:self._size]
+
+    @property
+    def x(self):
+        """
+        x coordinates (a view of the storage)
+
+        Returns
+        -------
+        numpy array
+        """
+        return self.data[:, 0]
+
+    @property
+    def y(self):
+        """
+        y coordinates (a view of the storage)
+
+        Returns
+        -------
+        numpy array
+        """
+        return self.data[:, 1]
+
+    @property
+    def dtype(self):
+        """
+        Storage type
+
+        Returns
+        -------
+        numpy dtype
+        """
+        return self._buffer.dtype
+
+    @property
+    def nbytes(self):
+        """
+        Bytes used by the points (the buffer may have some extra capacity)
+
+        Returns
+        -------
+        int
+        """
+        return self.data.nbytes
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Coordinates(self.data[index], self.dtype)
+        return Coordinate(*self.data[index])
+
+    def __iter__(self):
+        return (Coordinate(x, y) for x, y in self.data)
+
+    def __eq__(self, other):
+        if not isinstance(other, Coordinates):
+            try:
+                other = Coordinates(other)
+            except ValueError:
+                return NotImplemented
+        return np.array_equal(self.data, other.data)
+
+    __hash__ = None
+
+    def __array__(self, dtype=None, copy=None):
+        return self.data if dtype is None else self.data.astype(dtype)
+
+    def __repr__(self):
+        return f'Coordinates({len(self)} points, dtype={self.dtype})'
+
+    def append(self, other):
+        """
+        Appends points at the end
+
+        Parameters
+        ----------
+        other : Coordinates or array-like of shape (M, 2)
+        """
+        other = np.asarray(other, self.dtype)
+        size = self._size + len(other)
+        if self._size == 0 and size > len(self._buffer):
+            # nothing to keep: adopt the new points as the buffer, without a copy
+            self._buffer = other
+        elif size > len(self._buffer):
+            buffer = np.empty((max(size, 2 * len(self._buffer)), 2), self.dtype)
+            buffer[:self._size] = self.data
+            self._buffer = buffer
+        self._buffer[self._size:size] = other
+        self._size = size
+
+
+def make_rng(seed=None, bit_generator=DEFAULT_BIT_GENERATOR, offset=0):
+    """
+    NumPy generator of the points of a seeded run, starting at any point
+
+    Each point takes two values of the stream (x and y). PCG64, PCG64DXSM and Philox
+    skip ahead in constant time (`advance`), so any chunk of a run can be drawn on
+    its own and gives the same points as drawing the run from its start. With the
+    default PCG64 the stream is the one of `numpy.random.default_rng(seed)`.
+
+    Parameters
+    ----------
+    seed : number or numpy.random.SeedSequence, optional
+        seed used by the NumPy PRNG. Default None
+    bit_generator : str, optional
+        'pcg64', 'pcg64dxsm', 'philox', 'sfc64' or 'mt19937'. Default: 'pcg64'
+    offset : int, optional
+        Index of the first point. Default: 0
+
+    Returns
+    -------
+    numpy.random.Generator
+    """
+    if bit_generator not in BIT_GENERATORS:
+        raise ValueError(f'Bit generator must be one of {", ".join(BIT_GENERATORS)}')
+    if offset < 0:
+        raise ValueError('Offset must be a non-negative integer')
+    bit_generator_class, step = BIT_GENERATORS[bit_generator]
+    rng = np.random.Generator(bit_generator_class(seed))
+    if offset:
+        if step is None:
+            raise ValueError(f'Bit generator {bit_generator} cannot skip ahead')
+        steps, remainder = divmod(2 * offset, step)
+        rng.bit_generator.advance(steps)
+        rng.random(remainder)
+    return rng
+
+
+@instrumentation.timed('draw_coords')
+def draw_coords(rng, points, dtype=np.float64):
+    """
+    Draws points coordinates in a single batch
+
+    The values are drawn in the same order as `create_coords` does (x, y, x, y, ...)
+    so, for a given seed, both functions give the same points. With float32 storage
+    the float64 values are rounded, so points very close to the quadrant may change
+    side.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        Generator used to draw the values
+    points : int
+        number of points
+    dtype : numpy dtype, optional
+        Storage type, float64 or float32. Default: float64
+
+    Returns
+    -------
+    Coordinates
+    """
+    instrumentation.increment('samples_generated', int(points))
+    return Coordinates(rng.random((int(points), 2)), dtype)
+
+
+@instrumentation.timed('inside_quadrant')
+def inside_quadrant(x, y):
+    """
+    Checks which points are inside the unit quadrant
+
+    The squared distance to the origin is compared with the squared radius, so no
+    square root is taken.
+
+    Parameters
+    ----------
+    x : numpy array
+        Points x coordinates
+    y : numpy array
+        Points y coordinates
+
+    Returns
+    -------
+    numpy array
+        Boolean array, True for points inside the quadrant
+    """
+    instrumentation.increment('mask_evaluations', len(x))
+    squared_distance = x * x
+    squared_distance += y * y
+    return squared_distance <= 1
+
+
+def stratified_indices(mask, max_points):
+    """
+    Indices of a subsample that keeps the proportion of True and False values
+
+    Each group gets its share of `max_points` and its indices are evenly spread over
+    the group, so the subsample keeps the look of the whole set of points.
+
+    Parameters
+    ----------
+    mask : numpy array
+        Boolean array, e.g. points inside the quadrant
+    max_points : int or None
+        Maximum size of the subsample. None (or a value not smaller than the mask)
+        keeps every index.
+
+    Returns
+    -------
+    numpy array
+        Sorted indices
+    """
+    if max_points is None or max_points >= len(mask):
+        return np.arange(len(mask))
+    inside, outside = np.flatnonzero(mask), np.flatnonzero(~mask)
+    inside_share = round(max_points * len(inside) / len(mask))
+    selected = []
+    for group, share in ((inside, inside_share), (outside, max_points - inside_share)):
+        share = min(share, len(group))
+        selected.append(group[np.linspace(0, len(group) - 1, share, dtype=np.intp)])
+    return np.sort(np.concatenate(selected))
+
+
+class RunningStats:
+    """
+    Running count, mean and variance of a stream of values
+
+    Batches are merged with the parallel update of Chan et al., so only three numbers
+    are kept no matter how many values were seen.
+    """
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of values already seen. Default: 0
+        mean : float, optional
+            Mean of the values already seen. Default: 0.0
+        m2 : float, optional
+            Sum of squared deviations from the mean. Default: 0.0
+        """
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, count, mean, m2):
+        """
+        Merges the statistics of a batch of values
+
+        Parameters
+        ----------
+        count : int
+            Number of values in the batch
+        mean : float
+            Mean of the batch
+        m2 : float
+            Sum of squared deviations from the batch mean
+        """
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    def update(self, values):
+        """
+        Merges a batch of values
+
+        Parameters
+        ----------
+        values : numpy array
+        """
+        values = np.asarray(values, dtype=float)
+        if values.size:
+            mean = values.mean()
+            self.add(values.size, mean, np.sum((values - mean) ** 2))
+
+    def update_bernoulli(self, successes, count):
+        """
+        Merges a batch of 0/1 values given only how many of them are 1
+
+        Parameters
+        ----------
+        successes : int
+            Number of 1's in the batch
+        count : int
+            Number of values in the batch
+        """
+        if count:
+            self.add(count, successes / count, successes * (count - successes) / count)
+
+    def merge(self, other):
+        """
+        Merges the statistics of another RunningStats
+
+        Parameters
+        ----------
+        other : RunningStats
+        """
+        self.add(other.count, other.mean, other.m2)
+
+    @property
+    def variance(self):
+        """
+        Sample variance (zero while less than two values were seen)
+
+        Returns
+        -------
+        float
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def standard_error(self):
+        """
+        Standard error of the mean
+
+        Returns
+        -------
+        float
+        """
+        return np.sqrt(self.variance / self.count) if self.count else 0.0
+
+
 def load_css(css_file_path):
     """
     Inject CSS
@@ -80,6 +484,7 @@ def load_css(css_file_path):
     None
         Inject CSS through Streamlit markdown with HTML flag.
     """
+    import streamlit as st
 
     with open(css_file_path) as f:
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
@@ -121,6 +526,8 @@ def find_me_buttons(site, url_or_user, width=120, margin=3):
         <img src="https://img.shields.io/badge/-Sponsor-EA4AAA?style=for-the-badge&logo=GitHubSponsors&logoColor=white" width="{width}" style="margin:{margin}px" target="_blank"></a>"""  # noqa: E501
     else:
         raise ValueError("Invalid site")
+    import streamlit as st
+
     return st.markdown(button_code, unsafe_allow_html=True)
 
 
@@ -183,6 +590,8 @@ def vertical_spacer(lines, sidebar=False):
     -------
     None
     """
+    import streamlit as st
+
     for _ in range(lines):
         if sidebar:
             st.sidebar.write("\n")
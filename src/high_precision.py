@@ -0,0 +1,253 @@
+import decimal
+import math
+
+CHUDNOVSKY_DIGITS_PER_TERM = math.log10(640320 ** 3 / 1728)
+HIGH_PRECISION_METHODS = ('chudnovsky', 'machin')
+
+# ranges of up to this many terms are split with Python integers and then converted to
+# Decimal, whose multiplication of huge numbers is much faster
+_INTEGER_BLOCK = 512
+_EXACT_CONTEXT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                                 Emin=decimal.MIN_EMIN)
+
+
+def _binary_split(leaf, a, b):
+    """
+    Binary splitting of a hypergeometric-like series on Python integers
+
+    The sum of the terms a to b - 1 is T / Q, where P is the product of the terms
+    ratios numerators.
+
+    Parameters
+    ----------
+    leaf : callable
+        Returns the (P, Q, T) integers of a single term index
+    a, b : int
+        Range of terms [a, b)
+
+    Returns
+    -------
+    tuple of ints
+        (P, Q, T)
+    """
+    if b - a == 1:
+        return leaf(a)
+    m = (a + b) // 2
+    p_am, q_am, t_am = _binary_split(leaf, a, m)
+    p_mb, q_mb, t_mb = _binary_split(leaf, m, b)
+    return p_am * p_mb, q_am * q_mb, q_mb * t_am + p_am * t_mb
+
+
+def _binary_split_decimal(leaf, a, b):
+    """
+    Same as `_binary_split`, but the big products are computed with exact Decimal
+    arithmetic. Small ranges are still split on Python integers.
+
+    Returns
+    -------
+    tuple of Decimals
+        (P, Q, T)
+    """
+    if b - a <= _INTEGER_BLOCK:
+        return tuple(decimal.Decimal(value) for value in _binary_split(leaf, a, b))
+    m = (a + b) // 2
+    p_am, q_am, t_am = _binary_split_decimal(leaf, a, m)
+    p_mb, q_mb, t_mb = _binary_split_decimal(leaf, m, b)
+    multiply = _EXACT_CONTEXT.multiply
+    return (multiply(p_am, p_mb), multiply(q_am, q_mb),
+            _EXACT_CONTEXT.add(multiply(q_mb, t_am), multiply(p_am, t_mb)))
+
+
+def _chudnovsky_leaf(k):
+    """
+    (P, Q, T) of the k-th term of the Chudnovsky series
+    """
+    if k == 0:
+        p = q = 1
+    else:
+        p = -(6 * k - 5) * (2 * k - 1) * (6 * k - 1)
+        q = k ** 3 * (640320 ** 3 // 24)
+    return p, q, p * (13591409 + 545140134 * k)
+
+
+def _arccot_leaf(x):
+    """
+    Leaf function of the arctan(1 / x) series, whose terms ratio is
+    -(2k - 1) / ((2k + 1) x ** 2)
+    """
+    x_squared = x * x
+
+    def leaf(k):
+        if k == 0:
+            return 1, 1, 1
+        p = -(2 * k - 1)
+        return p, (2 * k + 1) * x_squared, p
+
+    return leaf
+
+
+# Machin formula: pi = 16 arctan(1 / 5) - 4 arctan(1 / 239)
+MACHIN_TERMS = ((16, 5), (-4, 239))
+
+
+def _decimal_sqrt(value, context):
+    """
+    Square root of an integer by Newton iteration of the inverse square root
+
+    The precision is doubled at each step, so the cost is a few multiplications at
+    full precision. It is much faster than `Context.sqrt` for millions of digits.
+
+    Parameters
+    ----------
+    value : int
+        Radicand
+    context : decimal.Context
+        Context with the target precision
+
+    Returns
+    -------
+    decimal.Decimal
+    """
+    precisions = []
+    precision = context.prec + 10
+    while precision > 15:
+        precisions.append(precision)
+        precision = precision // 2 + 2
+    radicand = decimal.Decimal(value)
+    inverse = decimal.Decimal(1 / math.sqrt(value))
+    for precision in reversed(precisions):
+        step = context.copy()
+        step.prec = precision
+        square = step.multiply(inverse, inverse)
+        correction = step.subtract(3, step.multiply(radicand, square))
+        inverse = step.divide(step.multiply(inverse, correction), 2)
+    return context.multiply(radicand, inverse)
+
+
+def _chudnovsky(number_of_terms, split, context):
+    p, q, t = split(_chudnovsky_leaf, 0, number_of_terms)
+    return context.divide(context.multiply(
+        context.multiply(426880, _decimal_sqrt(10005, context)), q), t)
+
+
+def _machin(number_of_terms, split, context):
+    result = decimal.Decimal(0)
+    for coefficient, x in MACHIN_TERMS:
+        _, q, t = split(_arccot_leaf(x), 0, number_of_terms)
+        arccot = context.divide(t, context.multiply(q, decimal.Decimal(x)))
+        result = context.add(result,
+                             context.multiply(decimal.Decimal(coefficient), arccot))
+    return result
+
+
+_METHODS = {'chudnovsky': _chudnovsky, 'machin': _machin}
+
+
+def terms_for_digits(digits, method='chudnovsky'):
+    """
+    Number of terms needed for a number of correct decimal digits
+
+    Parameters
+    ----------
+    digits : int
+        Decimal digits
+    method : str, optional
+        'chudnovsky' or 'machin'. Default: 'chudnovsky'
+
+    Returns
+    -------
+    int
+    """
+    if method == 'chudnovsky':
+        return int(digits / CHUDNOVSKY_DIGITS_PER_TERM) + 2
+    if method == 'machin':
+        # the arctan(1 / 5) series is the slowest one: 2 log10(5) digits per term
+        return int(digits / (2 * math.log10(5))) + 2
+    raise ValueError(f'Method must be one of {", ".join(HIGH_PRECISION_METHODS)}')
+
+
+def pi_chudnovsky(number_of_terms):
+    """
+    Pi approximation using Chudnovsky formula, computed by binary splitting
+
+    Each term adds about 14 correct digits, so 2 terms are already beyond float
+    precision. Use `pi_decimal` to get more digits.
+
+    Parameters
+    ----------
+    number_of_terms : int
+        Terms of the infinite series
+
+    Returns
+    -------
+    float
+        Pi approximation
+    """
+    if number_of_terms <= 0:
+        raise ValueError('Number of terms must be a positive integer')
+    return float(_chudnovsky(number_of_terms, _binary_split, decimal.Context(prec=40)))
+
+
+def pi_machin(number_of_terms):
+    """
+    Pi approximation using Machin formula, 16 arctan(1/5) - 4 arctan(1/239), with
+    each arctan series computed by binary splitting
+
+    Parameters
+    ----------
+    number_of_terms : int
+        Terms of each arctan series
+
+    Returns
+    -------
+    float
+        Pi approximation
+    """
+    if number_of_terms <= 0:
+        raise ValueError('Number of terms must be a positive integer')
+    return float(_machin(number_of_terms, _binary_split, decimal.Context(prec=40)))
+
+
+def pi_decimal(digits, method='chudnovsky'):
+    """
+    Pi with a number of decimal places
+
+    Parameters
+    ----------
+    digits : int
+        Decimal places
+    method : str, optional
+        'chudnovsky' or 'machin'. Default: 'chudnovsky'
+
+    Returns
+    -------
+    decimal.Decimal
+        Pi truncated to `digits` decimal places
+    """
+    if digits < 0:
+        raise ValueError('Digits must be a non-negative integer')
+    number_of_terms = terms_for_digits(digits, method)
+    context = decimal.Context(prec=digits + 20, Emax=decimal.MAX_EMAX,
+                              Emin=decimal.MIN_EMIN)
+    value = _METHODS[method](number_of_terms, _binary_split_decimal, context)
+    return value.quantize(decimal.Decimal(1).scaleb(-digits),
+                          rounding=decimal.ROUND_DOWN, context=context)
+
+
+def pi_digits(digits, method='chudnovsky'):
+    """
+    Pi with a number of decimal places, as a string
+
+    Parameters
+    ----------
+    digits : int
+        Decimal places
+    method : str, optional
+        'chudnovsky' or 'machin'. Default: 'chudnovsky'
+
+    Returns
+    -------
+    str
+        e.g. '3.14159' for 5 digits
+    """
+    return str(pi_decimal(digits, method))
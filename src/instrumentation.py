@@ -0,0 +1,234 @@
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# Nothing is recorded while there is no sink: `timer` returns a shared no-op context
+# manager, `increment` returns right away and `timed` functions are called directly,
+# so the overhead of the disabled instrumentation is a truthiness check per call.
+_SINKS = []
+_NULL_TIMER = nullcontext()
+
+
+class RegistrySink:
+    """
+    In-memory registry of counters and timers
+    """
+
+    def __init__(self):
+        """
+        Class initialization
+        """
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.timers = {}
+
+    def increment(self, name, value):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record_time(self, name, seconds):
+        with self._lock:
+            count, total, maximum = self.timers.get(name, (0, 0.0, 0.0))
+            self.timers[name] = (count + 1, total + seconds, max(maximum, seconds))
+
+    def reset(self):
+        """
+        Removes all the recorded values
+        """
+        with self._lock:
+            self.counters.clear()
+            self.timers.clear()
+
+    def to_prometheus(self, prefix='pi'):
+        """
+        Recorded values in the Prometheus text exposition format
+
+        Counters become `<prefix>_<name>_total` and timers the summary
+        `<prefix>_stage_seconds` with a `stage` label.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefix of the metric names. Default: 'pi'
+
+        Returns
+        -------
+        str
+        """
+        lines = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                metric = f'{prefix}_{_metric_name(name)}_total'
+                lines += [f'# TYPE {metric} counter', f'{metric} {value}']
+            if self.timers:
+                metric = f'{prefix}_stage_seconds'
+                lines.append(f'# TYPE {metric} summary')
+                for name, (count, total, _) in sorted(self.timers.items()):
+                    lines += [f'{metric}_count{{stage="{name}"}} {count}',
+                              f'{metric}_sum{{stage="{name}"}} {total!r}']
+        return '\n'.join(lines) + '\n'
+
+
+class LoggingSink:
+    """
+    Sends every counter increment and timer to a logger
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            Default: the logger of this module
+        level : int, optional
+            Logging level. Default: logging.DEBUG
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def increment(self, name, value):
+        self.logger.log(self.level, '%s += %s', name, value)
+
+    def record_time(self, name, seconds):
+        self.logger.log(self.level, '%s took %.6f s', name, seconds)
+
+
+def _metric_name(name):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def add_sink(sink):
+    """
+    Starts sending timers and counters to a sink
+
+    Parameters
+    ----------
+    sink : object
+        Object with `increment(name, value)` and `record_time(name, seconds)` methods,
+        e.g. RegistrySink or LoggingSink
+    """
+    _SINKS.append(sink)
+
+
+def remove_sink(sink):
+    """
+    Stops sending timers and counters to a sink
+
+    Parameters
+    ----------
+    sink : object
+        A sink previously added
+    """
+    _SINKS.remove(sink)
+
+
+def enabled():
+    """
+    If there is at least one sink
+
+    Returns
+    -------
+    bool
+    """
+    return bool(_SINKS)
+
+
+def increment(name, value=1):
+    """
+    Adds a value to a counter
+
+    Parameters
+    ----------
+    name : str
+        Counter name
+    value : int, optional
+        Default: 1
+    """
+    if _SINKS:
+        for sink in _SINKS:
+            sink.increment(name, value)
+
+
+class _Timer:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        for sink in _SINKS:
+            sink.record_time(self.name, seconds)
+
+
+def timer(name):
+    """
+    Context manager that times a stage
+
+    Parameters
+    ----------
+    name : str
+        Stage name
+
+    Returns
+    -------
+    context manager
+    """
+    return _Timer(name) if _SINKS else _NULL_TIMER
+
+
+def timed(name):
+    """
+    Decorator that times every call of a function as a stage
+
+    Parameters
+    ----------
+    name : str
+        Stage name
+
+    Returns
+    -------
+    callable
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _SINKS:
+                return function(*args, **kwargs)
+            with _Timer(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile():
+    """
+    Records the timers and counters of a block in a new registry
+
+    The sinks are process-wide, so work done by other threads in the meantime is
+    recorded too.
+
+        with profile() as registry:
+            PiMonteCarlo(1_000_000, 42).plot(backend='plotly')
+        print(registry.to_prometheus())
+
+    Yields
+    ------
+    RegistrySink
+    """
+    registry = RegistrySink()
+    add_sink(registry)
+    try:
+        yield registry
+    finally:
+        remove_sink(registry)
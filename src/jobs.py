@@ -0,0 +1,419 @@
+import asyncio
+import math
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError
+
+import numpy as np
+
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import MonteCarloResult
+from src.series import SERIES, get_series
+
+DEFAULT_STEPS = 8
+DEFAULT_POLL_INTERVAL = 0.1
+# jobs running at the same time, across all sessions; later jobs wait in a queue
+DEFAULT_MAX_WORKERS = 8
+
+
+class Job:
+    """
+    Handle of a computation running in the background
+
+    The computation is a generator function: each value it yields is a partial
+    result and the value it returns is the final result. Cancellation is
+    cooperative, the generator is closed at its next yield.
+    """
+
+    def __init__(self, function, args=(), kwargs=None):
+        """
+        Class initialization. Jobs are created by `JobManager.submit`.
+
+        Parameters
+        ----------
+        function : generator function
+            Computation
+        args, kwargs : optional
+            Arguments of the function
+        """
+        self.function = function
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self._cancel = threading.Event()
+        self._partial = None
+        self._partials_count = 0
+        self._future = Future()
+        # job that must stop before this one starts, None if it started right away
+        self._blocker = None
+
+    @property
+    def signature(self):
+        return self.function, self.args, tuple(sorted(self.kwargs.items()))
+
+    def _start(self, executor):
+        """
+        Submits the job to a thread pool, unless it was cancelled before starting
+        """
+        if not self._future.set_running_or_notify_cancel():
+            return
+        try:
+            executor.submit(self._run).add_done_callback(self._finish)
+        except RuntimeError as exception:  # the pool was shut down
+            self._future.set_exception(exception)
+
+    def _finish(self, inner):
+        if inner.cancelled():
+            self._future.set_exception(CancelledError())
+        elif inner.exception() is not None:
+            self._future.set_exception(inner.exception())
+        else:
+            self._future.set_result(inner.result())
+
+    def _run(self):
+        if self._cancel.is_set():
+            raise CancelledError
+        generator = self.function(*self.args, **self.kwargs)
+        try:
+            while True:
+                partial = next(generator)
+                self._partial = partial
+                self._partials_count += 1
+                if self._cancel.is_set():
+                    generator.close()
+                    raise CancelledError
+        except StopIteration as stop:
+            return stop.value
+
+    @property
+    def partial(self):
+        """
+        Last partial result, None while there is none
+
+        Returns
+        -------
+        object
+        """
+        return self._partial
+
+    def partials(self, interval=DEFAULT_POLL_INTERVAL):
+        """
+        Polls the job, yielding each new partial result until the job finishes
+
+        Partial results produced faster than the polling interval are skipped; only
+        the last one is yielded.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Seconds between polls. Default: 0.1
+
+        Yields
+        ------
+        object
+        """
+        seen = 0
+        while True:
+            finished = self.wait(interval)
+            if self._partials_count != seen:
+                seen = self._partials_count
+                yield self._partial
+            if finished:
+                return
+
+    def cancel(self):
+        """
+        Asks the job to stop. A job that has not started yet never runs.
+        """
+        self._cancel.set()
+        self._future.cancel()
+
+    def cancelled(self):
+        """
+        If the job was cancelled
+
+        Returns
+        -------
+        bool
+        """
+        return self._cancel.is_set()
+
+    def done(self):
+        """
+        If the job finished, was cancelled or failed
+
+        Returns
+        -------
+        bool
+        """
+        return self._future.done()
+
+    def wait(self, timeout=None):
+        """
+        Waits for the job to finish
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait. Default: None (no limit)
+
+        Returns
+        -------
+        bool
+            If the job finished
+        """
+        try:
+            self._future.exception(timeout)
+        except TimeoutError:
+            return False
+        except CancelledError:
+            pass
+        return True
+
+    def result(self, timeout=None):
+        """
+        Final result, waiting for it if needed
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait. Default: None (no limit)
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        concurrent.futures.CancelledError
+            If the job was cancelled
+        TimeoutError
+            If the job did not finish in time
+        """
+        return self._future.result(timeout)
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
+
+
+class JobManager:
+    """
+    Runs jobs in a thread pool, with at most one job per key
+
+    Submitting a job with the key of a running job cancels the old one (unless it is
+    the same computation, which is then reused) and the new job is queued only when
+    the old one stopped, so both never run at the same time and the new job does not
+    hold a thread while it waits. A replacement that is still waiting is cancelled
+    before it starts and the newer job waits for the same running job instead. Pages
+    use one key per session, so a newer request replaces the previous one.
+
+    Only running and waiting jobs are kept: a key is forgotten when its job ends, so
+    the manager does not keep the arguments and results of finished jobs alive.
+
+    At most `max_workers` jobs run at the same time, across all keys; the other jobs
+    wait for a free thread in submission order.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Threads of the pool, the number of jobs run at the same time. Default: 8
+        """
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='pi-job')
+        self._jobs = {}
+        # reentrant: cancelling a job that has not started runs its done callbacks,
+        # which forget its key, in the thread that holds the lock
+        self._lock = threading.RLock()
+
+    def submit(self, function, *args, key=None, **kwargs):
+        """
+        Starts a job
+
+        Parameters
+        ----------
+        function : generator function
+            Computation, see `Job`
+        key : hashable, optional
+            Job key, e.g. a session id. Default: None (independent job)
+        args, kwargs
+            Arguments of the function
+
+        Returns
+        -------
+        Job
+        """
+        job = Job(function, args, kwargs)
+        with self._lock:
+            previous = self._jobs.get(key) if key is not None else None
+            if previous is not None and not previous.done():
+                if previous.signature == job.signature and not previous.cancelled():
+                    return previous
+            if key is not None:
+                self._jobs[key] = job
+                job._future.add_done_callback(lambda _: self._forget(key, job))
+            if previous is not None and not previous.done():
+                previous.cancel()
+                # a cancelled job that never started does not hold the key: wait for
+                # the job it was waiting for
+                blocker = previous
+                if previous._future.cancelled() and previous._blocker is not None:
+                    blocker = previous._blocker
+                job._blocker = blocker
+                blocker._future.add_done_callback(lambda _: job._start(self._executor))
+                return job
+        job._start(self._executor)
+        return job
+
+    def _forget(self, key, job):
+        """
+        Removes a finished job, unless a newer job already replaced it
+        """
+        with self._lock:
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+
+    def get(self, key):
+        """
+        Running or waiting job of a key
+
+        Returns
+        -------
+        Job or None
+            None if the last job of the key finished
+        """
+        with self._lock:
+            return self._jobs.get(key)
+
+    def cancel(self, key):
+        """
+        Cancels the job of a key, if any
+        """
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            job.cancel()
+
+    def shutdown(self, wait=True):
+        """
+        Cancels every job and stops the threads
+
+        Parameters
+        ----------
+        wait : bool, optional
+            If it waits for the running jobs to stop. Default: True
+        """
+        with self._lock:
+            jobs, self._jobs = list(self._jobs.values()), {}
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait)
+
+
+JOBS = JobManager(DEFAULT_MAX_WORKERS)
+
+
+def _schedule(start, stop, steps):
+    """
+    Increasing sizes above `start` up to `stop`, from about stop / 2 ** (steps - 1) and
+    doubling
+    """
+    if stop <= start:
+        return []
+    first = max(stop >> (steps - 1), 1)
+    sizes = {int(size) for size in np.geomspace(first, stop, steps).round()
+             if size > start}
+    return sorted(sizes | {stop})
+
+
+def progressive_monte_carlo(pi_monte_carlo, points, steps=DEFAULT_STEPS,
+                            max_stored_points=None):
+    """
+    Grows a PiMonteCarlo up to a number of points in steps, yielding the estimation
+    after each one. PiMonteCarlo only draws the extra points of each step, so the total
+    cost is the one of a single run.
+
+    With `max_stored_points`, the estimator keeps at most that many points (e.g. the
+    plotted ones) and larger runs are continued by a PiMonteCarloStream with the same
+    seed, which only keeps running totals. For an integer seed its estimation is the
+    one of a PiMonteCarlo with all the points.
+
+    Parameters
+    ----------
+    pi_monte_carlo : PiMonteCarlo
+        Estimator, modified in place. It must not be used elsewhere until the job ends.
+    points : int
+        Final number of points
+    steps : int, optional
+        Maximum number of partial results. Default: 8
+    max_stored_points : int, optional
+        Maximum number of points kept by `pi_monte_carlo`. Default: None (no limit)
+
+    Yields
+    ------
+    MonteCarloResult
+
+    Returns
+    -------
+    PiMonteCarlo or PiMonteCarloStream
+        The same estimator, with `points` points, or the stream of the whole run if
+        it has more than `max_stored_points` points
+    """
+    stored = points if max_stored_points is None else min(points, max_stored_points)
+    start = min(pi_monte_carlo._stored_points, stored)
+    for size in _schedule(start, stored, steps) or [stored]:
+        pi_monte_carlo.points = int(size)
+        p = pi_monte_carlo.calculate / 4
+        standard_error = 4 * math.sqrt(p * (1 - p) / max(size - 1, 1))
+        yield MonteCarloResult(pi_monte_carlo.calculate, standard_error, int(size))
+    if stored == points:
+        return pi_monte_carlo
+    stream = PiMonteCarloStream(points, pi_monte_carlo.seed,
+                                bit_generator=pi_monte_carlo.bit_generator)
+    for size in _schedule(stored, points, steps):
+        stream.advance(int(size) - stream.trials)
+        yield MonteCarloResult(4 * stream.hits / stream.trials, stream.standard_error,
+                               stream.trials)
+    return stream
+
+
+def progressive_curves(number_of_terms, steps=DEFAULT_STEPS, series=tuple(SERIES)):
+    """
+    Computes the convergence curves of infinite series (`src.series.pi_series_curve`)
+    in steps, yielding the part computed so far after each one. The cumulative sums
+    carry over between steps, so the final curves are the same as the ones of a single
+    pass.
+
+    Parameters
+    ----------
+    number_of_terms : int
+        Terms of the infinite series
+    steps : int, optional
+        Maximum number of partial results. Default: 8
+    series : tuple of str, optional
+        Names of the series. Default: every series of `src.series.SERIES`
+
+    Yields
+    ------
+    dict
+        {name: array}, views of the first computed values of each series
+
+    Returns
+    -------
+    dict
+        {name: array}, the whole curves
+    """
+    definitions = [get_series(name) for name in series]
+    curves = {definition.name: np.empty(number_of_terms) for definition in definitions}
+    totals = dict.fromkeys(curves, 0.0)
+    done = 0
+    for size in _schedule(0, number_of_terms, steps):
+        for definition in definitions:
+            values = definition.terms(np.arange(done, size) + definition.start)
+            sums = np.cumsum(np.concatenate(([totals[definition.name]], values)))[1:]
+            totals[definition.name] = sums[-1]
+            curves[definition.name][done:size] = definition.pi_from_sum(sums)
+        done = size
+        yield {name: curve[:done] for name, curve in curves.items()}
+    return curves
@@ -0,0 +1,197 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import DEFAULT_BIT_GENERATOR, MonteCarloResult, RunningStats
+from src.series import get_series
+from src.summation import DEFAULT_CHUNK_SIZE, NeumaierAccumulator, chunk_bounds
+
+# tasks per worker of the parallel series, so workers that finish early take more
+TASKS_PER_WORKER = 4
+
+
+def split_work(total, parts):
+    """
+    Splits a number of work items as evenly as possible
+
+    Parameters
+    ----------
+    total : int
+        Number of work items
+    parts : int
+        Number of parts
+
+    Returns
+    -------
+    list of ints
+        Items of each part. The first `total % parts` parts get one extra item.
+    """
+    quotient, remainder = divmod(total, parts)
+    return [quotient + 1 if i < remainder else quotient for i in range(parts)]
+
+
+def _monte_carlo_worker(points, seed, chunk_size, bit_generator, offset):
+    """
+    Counts hits of one worker. Runs in a child process.
+
+    Parameters
+    ----------
+    points : int
+        number of points of the worker
+    seed : numpy.random.SeedSequence
+        seed of the worker stream
+    chunk_size : int
+        number of points drawn at a time
+    bit_generator : str
+        NumPy bit generator
+    offset : int
+        index of the first point of the worker in its stream
+
+    Returns
+    -------
+    tuple
+        (hits, RunningStats)
+    """
+    if points == 0:
+        return 0, RunningStats()
+    stream = PiMonteCarloStream(points, seed, chunk_size, bit_generator, offset)
+    stream.advance(points)
+    return stream.hits, stream.stats
+
+
+def pi_monte_carlo_parallel(points, seed=None, workers=None,
+                            chunk_size=PiMonteCarloStream.DEFAULT_CHUNK_SIZE,
+                            bit_generator=DEFAULT_BIT_GENERATOR, skip_ahead=False):
+    """
+    Pi approximation by Monte Carlo method on a process pool
+
+    By default each worker draws its share of points from its own statistically
+    independent stream, spawned from `numpy.random.SeedSequence(seed)`, so the result
+    depends on (seed, workers, points). With `skip_ahead` the workers split the
+    single stream of the seed instead, each one skipping ahead to its first point, and
+    the estimate is the same as the serial one (`PiMonteCarloStream`) for any number
+    of workers. Worker results are reduced in worker order.
+
+    Parameters
+    ----------
+    points : int
+        number of points
+    seed : int, optional
+        seed used by the NumPy PRNG. Default None
+    workers : int, optional
+        number of worker processes. Default: number of CPUs
+    chunk_size : int, optional
+        number of points drawn at a time by each worker. Default: 1,000,000
+    bit_generator : str, optional
+        NumPy bit generator, see `src.helpers.make_rng`. Default: 'pcg64'
+    skip_ahead : bool, optional
+        If the workers split the stream of the seed. Default: False
+
+    Returns
+    -------
+    MonteCarloResult
+    """
+    if not isinstance(points, int):
+        raise TypeError('Points must be integer')
+    if points <= 0:
+        raise ValueError('Points must be a positive integer')
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 0:
+        raise ValueError('Workers must be a positive integer')
+
+    shares = split_work(points, workers)
+    if skip_ahead:
+        seeds = [np.random.SeedSequence(seed)] * workers
+        offsets = [sum(shares[:worker]) for worker in range(workers)]
+    else:
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        offsets = [0] * workers
+    with ProcessPoolExecutor(workers) as executor:
+        partials = list(executor.map(_monte_carlo_worker, shares, seeds,
+                                     [chunk_size] * workers, [bit_generator] * workers,
+                                     offsets))
+
+    hits = 0
+    stats = RunningStats()
+    for worker_hits, worker_stats in partials:
+        hits += worker_hits
+        stats.merge(worker_stats)
+    return MonteCarloResult(4 * hits / points, 4 * stats.standard_error, points)
+
+
+def _series_worker(series, bounds):
+    """
+    Compensated sums of chunks of a series, each chunk summed on its own. Runs in a
+    child process.
+
+    Parameters
+    ----------
+    series : str
+        Name of the series
+    bounds : list of tuples
+        (first, last + 1) indices of the chunks
+
+    Returns
+    -------
+    list of tuples
+        (total, compensation) of each chunk
+    """
+    terms = get_series(series).terms
+    sums = []
+    for first, last in bounds:
+        accumulator = NeumaierAccumulator()
+        accumulator.add(terms(np.arange(first, last)))
+        sums.append((accumulator.total, accumulator.compensation))
+    return sums
+
+
+def pi_series_parallel(series, number_of_terms, workers=None,
+                       chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Pi approximation using an infinite series, summed on a process pool
+
+    The range of terms is split into chunks and contiguous runs of chunks are summed
+    by the workers with compensated summation. The chunk sums are then added in
+    chunk order, so the result does not depend on the number of workers and is the
+    same as `src.series.pi_series` with 'neumaier' summation and the same chunk size.
+
+    Parameters
+    ----------
+    series : str
+        'leibniz', 'euler', 'nilakantha', 'wallis', 'ramanujan' or 'bbp'
+    number_of_terms : int
+        Terms of the infinite series
+    workers : int, optional
+        number of worker processes. Default: number of CPUs
+    chunk_size : int, optional
+        Terms computed at a time. Default: 2 ** 20
+
+    Returns
+    -------
+    float
+        Pi approximation
+    """
+    definition = get_series(series)
+    if not isinstance(number_of_terms, int):
+        raise TypeError('Number of terms must be integer')
+    if number_of_terms < 0:
+        raise ValueError('Number of terms must be a non-negative integer')
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 0:
+        raise ValueError('Workers must be a positive integer')
+
+    bounds = chunk_bounds(definition.start, definition.start + number_of_terms,
+                          chunk_size)
+    tasks, position = [], 0
+    for size in split_work(len(bounds), workers * TASKS_PER_WORKER):
+        if size:
+            tasks.append(bounds[position:position + size])
+            position += size
+    accumulator = NeumaierAccumulator()
+    with ProcessPoolExecutor(workers) as executor:
+        for sums in executor.map(_series_worker, [definition.name] * len(tasks), tasks):
+            for total, compensation in sums:
+                accumulator.add_partial(total, compensation)
+    return definition.pi_from_sum(accumulator.value)
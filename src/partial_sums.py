@@ -0,0 +1,208 @@
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
+
+from src.series import SERIES
+from src.summation import DEFAULT_CHUNK_SIZE, chunk_bounds, make_accumulator
+
+TABLE_VERSION = 1
+TABLE_METHODS = {'naive': ('total',), 'neumaier': ('total', 'compensation')}
+DEFAULT_STRIDE = DEFAULT_CHUNK_SIZE
+
+# magic, version, series, summation, stride, chunk size, entries, terms checksum and
+# data checksum, padded to HEADER_SIZE bytes so the data is aligned
+_MAGIC = b'PISUMS\x00\x00'
+_HEADER = struct.Struct('<8sI16s16sqqqII')
+HEADER_SIZE = 128
+_FINGERPRINT_TERMS = 64
+
+
+def _terms_fingerprint(series):
+    """
+    Checksum of the first terms of a series, so a table built with an older
+    definition of the terms is detected
+    """
+    series = SERIES[series]
+    indices = np.arange(series.start, series.start + _FINGERPRINT_TERMS)
+    return zlib.crc32(series.terms(indices).tobytes())
+
+
+def build_table(path, series, max_terms, stride=DEFAULT_STRIDE, summation='naive',
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Builds the table of partial sums of a series at every multiple of `stride` terms
+
+    Each entry is the accumulator state (e.g. sum and compensation) after that many
+    terms, added chunk by chunk as `src.summation.sum_terms` does. The file is written
+    to a temporary file and renamed, so readers never see a partial table.
+
+    Parameters
+    ----------
+    path : str
+        Table file
+    series : str
+        Name of a series of `src.series.SERIES`, e.g. 'leibniz'
+    max_terms : int
+        Largest number of terms stored
+    stride : int, optional
+        Terms between stored partial sums, a multiple of `chunk_size`. Default: 2 ** 20
+    summation : str, optional
+        'naive' or 'neumaier'. Default: 'naive'
+    chunk_size : int, optional
+        Terms computed at a time. Default: 2 ** 20
+    """
+    if series not in SERIES:
+        raise ValueError(f'Series must be one of {", ".join(SERIES)}')
+    if summation not in TABLE_METHODS:
+        raise ValueError(f'Summation must be one of {", ".join(TABLE_METHODS)}')
+    if stride <= 0 or stride % chunk_size:
+        raise ValueError('Stride must be a positive multiple of the chunk size')
+    terms, start = SERIES[series].terms, SERIES[series].start
+    fields = TABLE_METHODS[summation]
+    entries = max_terms // stride + 1
+    data = np.zeros((entries, len(fields)))
+    accumulator = make_accumulator(summation)
+    for first, last in chunk_bounds(start, start + (entries - 1) * stride, chunk_size):
+        accumulator.add(terms(np.arange(first, last)))
+        if (last - start) % stride == 0:
+            state = accumulator.state
+            data[(last - start) // stride] = [state[field] for field in fields]
+    header = _HEADER.pack(_MAGIC, TABLE_VERSION, series.encode(), summation.encode(),
+                          stride, chunk_size, entries, _terms_fingerprint(series),
+                          zlib.crc32(data.tobytes()))
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False,
+                                     suffix='.tmp') as file:
+        file.write(header.ljust(HEADER_SIZE, b'\x00'))
+        file.write(data.tobytes())
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(file.name, path)
+
+
+class PartialSumTable:
+    """
+    Memory-mapped table of partial sums of a series, built by `build_table`
+
+    Any number of processes can open the same file; the partial sums are read from
+    the page cache without copies. A sum of n terms starts from the stored partial
+    sum of the largest multiple of the stride not above n and adds only the
+    remaining terms, so the result is the same as `sum_terms` with the same
+    summation method and chunk size.
+    """
+
+    def __init__(self, path):
+        """
+        Class initialization. The table is validated: a file with another format
+        version, an outdated definition of the terms, a wrong size (e.g. truncated) or
+        corrupted data raises ValueError.
+
+        Parameters
+        ----------
+        path : str
+            Table file
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f'Partial sums table {path} is truncated')
+        (magic, version, series, summation, self.stride, self.chunk_size, self.entries,
+         terms_crc, data_crc) = _HEADER.unpack_from(header)
+        if magic != _MAGIC:
+            raise ValueError(f'{path} is not a partial sums table')
+        if version != TABLE_VERSION:
+            raise ValueError(f'Partial sums table {path} has version {version}, '
+                             f'not {TABLE_VERSION}')
+        self.series = series.rstrip(b'\x00').decode()
+        self.summation = summation.rstrip(b'\x00').decode()
+        if self.series not in SERIES or self.summation not in TABLE_METHODS:
+            raise ValueError(f'Partial sums table {path} has an unknown series or '
+                             'summation method')
+        if terms_crc != _terms_fingerprint(self.series):
+            raise ValueError(f'Partial sums table {path} was built with other terms')
+        columns = len(TABLE_METHODS[self.summation])
+        if os.path.getsize(path) != HEADER_SIZE + self.entries * columns * 8:
+            raise ValueError(f'Partial sums table {path} is truncated')
+        self._data = np.memmap(path, dtype=np.float64, mode='r', offset=HEADER_SIZE,
+                               shape=(self.entries, columns))
+        if zlib.crc32(self._data) != data_crc:
+            raise ValueError(f'Partial sums table {path} is corrupted')
+
+    @property
+    def max_terms(self):
+        """
+        Largest number of terms stored in the table
+
+        Returns
+        -------
+        int
+        """
+        return (self.entries - 1) * self.stride
+
+    def sum(self, number_of_terms):
+        """
+        Sum of the first terms of the series
+
+        Parameters
+        ----------
+        number_of_terms : int
+            Terms of the series. It may be larger than `max_terms`; the terms after
+            the last stored partial sum are computed.
+
+        Returns
+        -------
+        float
+        """
+        terms, start = SERIES[self.series].terms, SERIES[self.series].start
+        entry = min(max(number_of_terms, 0) // self.stride, self.entries - 1)
+        state = dict(zip(TABLE_METHODS[self.summation], map(float, self._data[entry])))
+        accumulator = make_accumulator(self.summation, state)
+        for first, last in chunk_bounds(start + entry * self.stride,
+                                        start + number_of_terms, self.chunk_size):
+            accumulator.add(terms(np.arange(first, last)))
+        return accumulator.value
+
+    def pi(self, number_of_terms):
+        """
+        Pi approximation of the series with a number of terms, the same as
+        `src.series.pi_series` with the table summation method
+
+        Parameters
+        ----------
+        number_of_terms : int
+            Terms of the infinite series
+
+        Returns
+        -------
+        float
+        """
+        return SERIES[self.series].pi_from_sum(self.sum(number_of_terms))
+
+
+def open_or_build_table(path, series, max_terms, stride=DEFAULT_STRIDE,
+                        summation='naive', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Opens a table, building it again if it is missing, invalid, built with other
+    parameters or too short
+
+    Parameters
+    ----------
+    See `build_table`
+
+    Returns
+    -------
+    PartialSumTable
+    """
+    try:
+        table = PartialSumTable(path)
+        if (table.series, table.summation, table.stride, table.chunk_size) == (
+                series, summation, stride, chunk_size) and table.max_terms >= max_terms:
+            return table
+    except (OSError, ValueError):
+        pass
+    build_table(path, series, max_terms, stride, summation, chunk_size)
+    return PartialSumTable(path)
@@ -0,0 +1,188 @@
+import math
+
+import numpy as np
+
+from src.compute_pi import PiMonteCarloStream
+from src.helpers import MonteCarloResult, inside_quadrant
+
+QMC_REPLICATES = 16
+
+# Sobol direction numbers of the first two dimensions, 32 bits. The second dimension
+# uses the primitive polynomial x + 1: m_k = 2 m_(k-1) XOR m_(k-1), m_1 = 1.
+_SOBOL_BITS = 32
+_SOBOL_M = [1]
+for _ in range(_SOBOL_BITS - 1):
+    _SOBOL_M.append((2 * _SOBOL_M[-1]) ^ _SOBOL_M[-1])
+_SOBOL_DIRECTIONS = np.array(
+    [[1 << (_SOBOL_BITS - 1 - j), m << (_SOBOL_BITS - 1 - j)]
+     for j, m in enumerate(_SOBOL_M)], dtype=np.uint64)
+
+
+def sobol_points(points):
+    """
+    First points of the two-dimensional Sobol sequence
+
+    Point n is the XOR of the direction numbers selected by the bits of n, so the
+    points are generated without a loop over them.
+
+    Parameters
+    ----------
+    points : int
+        number of points
+
+    Returns
+    -------
+    numpy array
+        (points, 2) array in [0, 1)
+    """
+    index = np.arange(points, dtype=np.uint64)
+    result = np.zeros((points, 2), dtype=np.uint64)
+    for bit in range(int(points - 1).bit_length()):
+        selected = ((index >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        result[selected] ^= _SOBOL_DIRECTIONS[bit]
+    return result / 2.0 ** _SOBOL_BITS
+
+
+def _radical_inverse(index, base):
+    result = np.zeros(len(index))
+    factor = 1.0 / base
+    index = index.copy()
+    while np.any(index):
+        index, digit = np.divmod(index, base)
+        result += digit * factor
+        factor /= base
+    return result
+
+
+def halton_points(points):
+    """
+    First points of the two-dimensional Halton sequence (bases 2 and 3), skipping
+    the point at the origin
+
+    Parameters
+    ----------
+    points : int
+        number of points
+
+    Returns
+    -------
+    numpy array
+        (points, 2) array in [0, 1)
+    """
+    index = np.arange(1, points + 1)
+    return np.column_stack((_radical_inverse(index, 2), _radical_inverse(index, 3)))
+
+
+def _uniform(points, seed):
+    stream = PiMonteCarloStream(points, seed)
+    return MonteCarloResult(stream.calculate, stream.standard_error, points)
+
+
+def _antithetic(points, seed):
+    pairs = points // 2
+    x, y = np.random.default_rng(seed).random((2, pairs))
+    hits = (inside_quadrant(x, y).astype(float) + inside_quadrant(1 - x, 1 - y)) / 2
+    return MonteCarloResult(4 * hits.mean(), 4 * hits.std(ddof=1) / math.sqrt(pairs),
+                            2 * pairs)
+
+
+def _control_variate(points, seed):
+    x, y = np.random.default_rng(seed).random((2, points))
+    squared_distance = x * x + y * y
+    hits = (squared_distance <= 1).astype(float)
+    # E[x ** 2 + y ** 2] = 2 / 3 for uniform points in the unit square
+    covariance = np.cov(hits, squared_distance)
+    beta = covariance[0, 1] / covariance[1, 1]
+    corrected = hits - beta * (squared_distance - 2 / 3)
+    return MonteCarloResult(4 * corrected.mean(),
+                            4 * corrected.std(ddof=1) / math.sqrt(points), points)
+
+
+def _stratified(points, seed):
+    # m x m grid with (at least) 2 points per cell, so each cell variance is estimated
+    cells_per_side = max(math.isqrt(points // 2), 1)
+    cells = cells_per_side ** 2
+    per_cell = max(points // cells, 2)
+    rng = np.random.default_rng(seed)
+    i, j = np.divmod(np.arange(cells), cells_per_side)
+    x = (i[:, np.newaxis] + rng.random((cells, per_cell))) / cells_per_side
+    y = (j[:, np.newaxis] + rng.random((cells, per_cell))) / cells_per_side
+    hits = inside_quadrant(x, y)
+    cell_means = hits.mean(axis=1)
+    cell_variances = hits.var(axis=1, ddof=1)
+    return MonteCarloResult(4 * cell_means.mean(),
+                            4 * math.sqrt(cell_variances.sum() / per_cell) / cells,
+                            cells * per_cell)
+
+
+def _randomized_qmc(sequence):
+    def estimator(points, seed):
+        # randomly shifted (Cranley-Patterson) replicates of the same point set; the
+        # spread of the replicates estimates the error
+        per_replicate = points // QMC_REPLICATES
+        base = sequence(per_replicate)
+        shifts = np.random.default_rng(seed).random((QMC_REPLICATES, 2))
+        estimates = np.empty(QMC_REPLICATES)
+        for replicate, shift in enumerate(shifts):
+            shifted = (base + shift) % 1
+            estimates[replicate] = 4 * np.mean(inside_quadrant(shifted[:, 0],
+                                                               shifted[:, 1]))
+        return MonteCarloResult(estimates.mean(),
+                                estimates.std(ddof=1) / math.sqrt(QMC_REPLICATES),
+                                QMC_REPLICATES * per_replicate)
+
+    return estimator
+
+
+SAMPLING_STRATEGIES = {
+    'uniform': _uniform,
+    'antithetic': _antithetic,
+    'control_variate': _control_variate,
+    'stratified': _stratified,
+    'sobol': _randomized_qmc(sobol_points),
+    'halton': _randomized_qmc(halton_points),
+}
+# fewest points giving a standard error: 2 pairs, 2 points per replicate; the other
+# strategies need 2 points
+MIN_POINTS = {'antithetic': 4, 'sobol': 2 * QMC_REPLICATES, 'halton': 2 * QMC_REPLICATES}
+
+
+def estimate_pi(points, seed=None, strategy='uniform'):
+    """
+    Pi approximation by Monte Carlo method with a selectable sampling strategy
+
+    - uniform: independent uniform points, same estimate as `PiMonteCarlo`
+    - antithetic: pairs of points (x, y) and (1 - x, 1 - y)
+    - control_variate: the squared distance to the origin, whose mean is 2/3, is
+      used as control variate
+    - stratified: the unit square is split in a grid with 2 or more points per cell
+    - sobol, halton: randomized quasi-Monte Carlo, 16 randomly shifted copies of a
+      low-discrepancy point set
+
+    Parameters
+    ----------
+    points : int
+        number of points, at least 2 (4 for antithetic, 32 for sobol and halton).
+        Strategies that need pairs, grid cells or replicates may use slightly fewer
+        points; the number used is reported.
+    seed : int, optional
+        seed used by the NumPy PRNG. Default None
+    strategy : str, optional
+        One of SAMPLING_STRATEGIES. Default: 'uniform'
+
+    Returns
+    -------
+    MonteCarloResult
+        Estimation, standard error and number of points used
+    """
+    if not isinstance(points, int):
+        raise TypeError('Points must be integer')
+    if points < 2:
+        raise ValueError('Points must be an integer greater than 1')
+    if strategy not in SAMPLING_STRATEGIES:
+        raise ValueError(f'Strategy must be one of {", ".join(SAMPLING_STRATEGIES)}')
+    if points < MIN_POINTS.get(strategy, 2):
+        raise ValueError(f'Points must be at least {MIN_POINTS[strategy]} for the '
+                         f'{strategy} strategy')
+    estimate, standard_error, samples = SAMPLING_STRATEGIES[strategy](points, seed)
+    return MonteCarloResult(float(estimate), float(standard_error), samples)
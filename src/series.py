@@ -0,0 +1,282 @@
+from collections import namedtuple
+
+import numpy as np
+
+from src.summation import DEFAULT_CHUNK_SIZE, sum_terms
+
+
+class Series(namedtuple('Series', ('name', 'title', 'terms', 'start', 'finish'))):
+    """
+    Infinite series for pi, pi = finish(sum of terms(k) for k = start, start + 1, ...)
+
+    `terms` returns the terms for an array of indices and `finish` works on floats and
+    arrays, so every series is summed chunk by chunk (`src.summation.sum_terms`) and
+    gets its convergence curve from a single cumulative sum.
+    """
+
+    __slots__ = ()
+
+    def pi_from_sum(self, total):
+        """
+        Pi approximation from the sum of the first terms
+
+        Parameters
+        ----------
+        total : float or numpy array
+            Sum (or cumulative sums) of the terms
+
+        Returns
+        -------
+        float or numpy array
+        """
+        with np.errstate(divide='ignore'):
+            value = self.finish(np.asarray(total, dtype=float))
+        return float(value) if np.ndim(value) == 0 else value
+
+    def pi(self, number_of_terms, summation='naive', chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Pi approximation with a number of terms
+
+        Parameters
+        ----------
+        number_of_terms : int
+            Terms of the infinite series
+        summation : str, optional
+            Summation method: 'naive', 'neumaier', 'pairwise' or 'reverse'. See
+            `src.summation.sum_terms`. Default: 'naive'
+        chunk_size : int, optional
+            Terms computed at a time. Default: 2 ** 20
+
+        Returns
+        -------
+        float
+        """
+        return self.pi_from_sum(sum_terms(self.terms, self.start,
+                                          self.start + number_of_terms, summation,
+                                          chunk_size))
+
+    def curve(self, number_of_terms):
+        """
+        Pi approximations for every number of terms from 1 to `number_of_terms`,
+        computed in a single pass with a cumulative sum
+
+        Parameters
+        ----------
+        number_of_terms : int
+            Terms of the infinite series
+
+        Returns
+        -------
+        numpy array
+            Element i is the approximation with i + 1 terms
+        """
+        indices = np.arange(self.start, self.start + number_of_terms)
+        return self.pi_from_sum(np.cumsum(self.terms(indices)))
+
+
+def _leibniz_terms(k):
+    """
+    Terms of the Leibniz series, paired as 1 / ((4k + 1)(4k + 3))
+
+    Parameters
+    ----------
+    k : numpy array
+        Terms indices
+
+    Returns
+    -------
+    numpy array
+    """
+    k = k.astype(float)
+    return 1 / ((4 * k + 1) * (4 * k + 3))
+
+
+def _euler_terms(k):
+    """
+    Terms of the Euler series, 1 / k ** 2
+
+    Parameters
+    ----------
+    k : numpy array
+        Terms indices
+
+    Returns
+    -------
+    numpy array
+    """
+    k = k.astype(float)
+    return 1 / k ** 2
+
+
+def _nilakantha_terms(k):
+    """
+    Terms of the Nilakantha series, (-1) ** (k + 1) 4 / (2k (2k + 1) (2k + 2))
+
+    Parameters
+    ----------
+    k : numpy array
+        Terms indices
+
+    Returns
+    -------
+    numpy array
+    """
+    k = k.astype(float)
+    return np.where(k % 2, 4.0, -4.0) / (2 * k * (2 * k + 1) * (2 * k + 2))
+
+
+def _wallis_terms(k):
+    """
+    Logarithms of the factors of the Wallis product, log(4k ** 2 / (4k ** 2 - 1)),
+    computed as log1p(1 / (4k ** 2 - 1)) so the product becomes an accurate sum
+
+    Parameters
+    ----------
+    k : numpy array
+        Terms indices
+
+    Returns
+    -------
+    numpy array
+    """
+    k = k.astype(float)
+    return np.log1p(1 / (4 * k ** 2 - 1))
+
+
+def _ramanujan_table():
+    """
+    Terms (4k)! (1103 + 26390k) / ((k!) ** 4 396 ** 4k) of the Ramanujan series,
+    correctly rounded from exact integers, up to the first one that underflows to 0
+    """
+    values = []
+    numerator, denominator, k = 1, 1, 0
+    while not values or values[-1]:
+        values.append(numerator * (1103 + 26390 * k) / denominator)
+        k += 1
+        numerator *= (4 * k) * (4 * k - 1) * (4 * k - 2) * (4 * k - 3)
+        denominator *= k ** 4 * 396 ** 4
+    return np.array(values)
+
+
+_RAMANUJAN_TERMS = _ramanujan_table()
+
+
+def _ramanujan_terms(k):
+    """
+    Terms of the Ramanujan series. Each term adds about 8 digits, so all but the
+    first few are 0 in floating point.
+
+    Parameters
+    ----------
+    k : numpy array
+        Terms indices
+
+    Returns
+    -------
+    numpy array
+    """
+    return _RAMANUJAN_TERMS[np.minimum(k, len(_RAMANUJAN_TERMS) - 1)]
+
+
+def _bbp_table():
+    """
+    Terms 16 ** -k (4 / (8k + 1) - 2 / (8k + 4) - 1 / (8k + 5) - 1 / (8k + 6)) of the
+    Bailey-Borwein-Plouffe series, up to the first one where 16 ** -k underflows to 0
+    """
+    k = np.arange(0.0, 270.0)
+    return np.power(16.0, -k) * (4 / (8 * k + 1) - 2 / (8 * k + 4) - 1 / (8 * k + 5)
+                                 - 1 / (8 * k + 6))
+
+
+_BBP_TERMS = _bbp_table()
+
+
+def _bbp_terms(k):
+    """
+    Terms of the Bailey-Borwein-Plouffe series. Each term adds more than one digit,
+    and the terms after the first few hundred are 0 in floating point.
+
+    Parameters
+    ----------
+    k : numpy array
+        Terms indices
+
+    Returns
+    -------
+    numpy array
+    """
+    return _BBP_TERMS[np.minimum(k, len(_BBP_TERMS) - 1)]
+
+
+SERIES = {series.name: series for series in (
+    Series('leibniz', 'Leibniz', _leibniz_terms, 0, lambda total: 8 * total),
+    Series('euler', 'Euler', _euler_terms, 1, lambda total: np.sqrt(6 * total)),
+    Series('nilakantha', 'Nilakantha', _nilakantha_terms, 1, lambda total: 3 + total),
+    Series('wallis', 'Wallis', _wallis_terms, 1, lambda total: 2 * np.exp(total)),
+    Series('ramanujan', 'Ramanujan', _ramanujan_terms, 0,
+           lambda total: 9801 / (np.sqrt(8) * total)),
+    Series('bbp', 'BBP', _bbp_terms, 0, lambda total: total),
+)}
+
+
+def get_series(series):
+    """
+    Series by name
+
+    Parameters
+    ----------
+    series : str or Series
+        Name in SERIES or the series itself
+
+    Returns
+    -------
+    Series
+    """
+    if isinstance(series, Series):
+        return series
+    if series not in SERIES:
+        raise ValueError(f'Series must be one of {", ".join(SERIES)}')
+    return SERIES[series]
+
+
+def pi_series(series, number_of_terms, summation='naive', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Pi approximation using an infinite series
+
+    Parameters
+    ----------
+    series : str or Series
+        'leibniz', 'euler', 'nilakantha', 'wallis', 'ramanujan' or 'bbp'
+    number_of_terms : int
+        Terms of the infinite series
+    summation : str, optional
+        Summation method, see `src.summation.sum_terms`. Default: 'naive'
+    chunk_size : int, optional
+        Terms computed at a time. Default: 2 ** 20
+
+    Returns
+    -------
+    float
+        Pi approximation
+    """
+    return get_series(series).pi(number_of_terms, summation, chunk_size)
+
+
+def pi_series_curve(series, number_of_terms):
+    """
+    Pi approximations using an infinite series for every number of terms from 1 to
+    `number_of_terms`
+
+    Parameters
+    ----------
+    series : str or Series
+        'leibniz', 'euler', 'nilakantha', 'wallis', 'ramanujan' or 'bbp'
+    number_of_terms : int
+        Terms of the infinite series
+
+    Returns
+    -------
+    numpy array
+        Element i is the approximation with i + 1 terms
+    """
+    return get_series(series).curve(number_of_terms)
@@ -0,0 +1,307 @@
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 2 ** 20
+
+
+def _two_sum(a, b):
+    """
+    Error-free transformation of a sum (Knuth's TwoSum)
+
+    Parameters
+    ----------
+    a, b : float or numpy array
+        Values to be added
+
+    Returns
+    -------
+    tuple
+        (a + b rounded to float, exact rounding error)
+    """
+    total = a + b
+    b_virtual = total - a
+    return total, (a - (total - b_virtual)) + (b - b_virtual)
+
+
+class NaiveAccumulator:
+    """
+    Sums values in order with a plain float accumulator
+
+    Chunks are added with a cumulative sum, so the result is the same as adding the
+    values one by one in a Python loop.
+    """
+
+    def __init__(self, total=0.0):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        total : float, optional
+            Sum of the values already added. Default: 0.0
+        """
+        self.total = total
+
+    def add(self, values):
+        """
+        Adds a chunk of values
+
+        Parameters
+        ----------
+        values : numpy array
+        """
+        if len(values):
+            self.total = np.cumsum(np.concatenate(([self.total], values)))[-1]
+
+    @property
+    def value(self):
+        """
+        Sum of the values added so far
+
+        Returns
+        -------
+        float
+        """
+        return float(self.total)
+
+    @property
+    def state(self):
+        """
+        Keyword arguments that recreate this accumulator
+
+        Returns
+        -------
+        dict
+        """
+        return {'total': float(self.total)}
+
+
+class NeumaierAccumulator:
+    """
+    Compensated (Kahan/Neumaier) summation
+
+    Each chunk is split into `LANES` interleaved lanes that are summed with TwoSum,
+    keeping the rounding errors in a compensation array. The lanes are then folded
+    pairwise, still with TwoSum, and the chunk is added to a running (total,
+    compensation) pair. The error does not grow with the number of values.
+    """
+
+    LANES = 2 ** 14
+
+    def __init__(self, total=0.0, compensation=0.0):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        total : float, optional
+            Sum of the values already added. Default: 0.0
+        compensation : float, optional
+            Rounding error of `total`. Default: 0.0
+        """
+        self.total = total
+        self.compensation = compensation
+
+    def add(self, values):
+        """
+        Adds a chunk of values
+
+        Parameters
+        ----------
+        values : numpy array
+        """
+        if not len(values):
+            return
+        lanes = min(self.LANES, 1 << (len(values) - 1).bit_length())
+        sums = np.zeros(lanes)
+        compensations = np.zeros(lanes)
+        for start in range(0, len(values), lanes):
+            row = values[start:start + lanes]
+            size = len(row)
+            sums[:size], errors = _two_sum(sums[:size], row)
+            compensations[:size] += errors
+        while lanes > 1:
+            lanes //= 2
+            sums[:lanes], errors = _two_sum(sums[:lanes], sums[lanes:2 * lanes])
+            compensations[:lanes] += compensations[lanes:2 * lanes] + errors
+        self.add_partial(sums[0], compensations[0])
+
+    def add_partial(self, total, compensation):
+        """
+        Adds the compensated sum of a chunk, e.g. summed by another accumulator. Adding
+        the (total, compensation) of chunks summed one by one gives the same result as
+        adding the chunks.
+
+        Parameters
+        ----------
+        total : float
+            Sum of the chunk
+        compensation : float
+            Rounding error of `total`
+        """
+        self.total, error = _two_sum(self.total, total)
+        self.compensation += error + compensation
+
+    @property
+    def value(self):
+        """
+        Sum of the values added so far
+
+        Returns
+        -------
+        float
+        """
+        return float(self.total + self.compensation)
+
+    @property
+    def state(self):
+        """
+        Keyword arguments that recreate this accumulator
+
+        Returns
+        -------
+        dict
+        """
+        return {'total': float(self.total), 'compensation': float(self.compensation)}
+
+
+class PairwiseAccumulator:
+    """
+    Pairwise (cascade) summation
+
+    Each chunk is summed by NumPy, which already uses pairwise summation, and the chunk
+    sums are combined as a binary tree: partial sums of the same level are merged as
+    soon as both exist, like the carries of a binary counter.
+    """
+
+    def __init__(self, partials=()):
+        """
+        Class initialization
+
+        Parameters
+        ----------
+        partials : sequence of (level, sum) pairs, optional
+            Partial sums of the values already added. Default: ()
+        """
+        self.partials = [tuple(partial) for partial in partials]
+
+    def add(self, values):
+        """
+        Adds a chunk of values
+
+        Parameters
+        ----------
+        values : numpy array
+        """
+        if not len(values):
+            return
+        level, total = 0, float(np.sum(values))
+        while self.partials and self.partials[-1][0] == level:
+            total += self.partials.pop()[1]
+            level += 1
+        self.partials.append((level, total))
+
+    @property
+    def value(self):
+        """
+        Sum of the values added so far
+
+        Returns
+        -------
+        float
+        """
+        total = 0.0
+        for _, partial in reversed(self.partials):
+            total += partial
+        return total
+
+    @property
+    def state(self):
+        """
+        Keyword arguments that recreate this accumulator
+
+        Returns
+        -------
+        dict
+        """
+        return {'partials': [list(partial) for partial in self.partials]}
+
+
+ACCUMULATORS = {
+    'naive': NaiveAccumulator,
+    'neumaier': NeumaierAccumulator,
+    'pairwise': PairwiseAccumulator,
+    'reverse': NaiveAccumulator,
+}
+SUMMATION_METHODS = tuple(ACCUMULATORS)
+
+
+def make_accumulator(method, state=None):
+    """
+    Creates the accumulator of a summation method
+
+    Parameters
+    ----------
+    method : str
+        One of SUMMATION_METHODS
+    state : dict, optional
+        State of a previous accumulator (its `state` property). Default: None
+
+    Returns
+    -------
+    Accumulator
+    """
+    if method not in ACCUMULATORS:
+        raise ValueError(f'Summation must be one of {", ".join(SUMMATION_METHODS)}')
+    return ACCUMULATORS[method](**(state or {}))
+
+
+def chunk_bounds(start, stop, chunk_size=DEFAULT_CHUNK_SIZE, reverse=False):
+    """
+    Bounds of the chunks of a range of indices
+
+    Parameters
+    ----------
+    start, stop : int
+        Range of indices [start, stop)
+    chunk_size : int, optional
+        Indices per chunk. Default: 2 ** 20
+    reverse : bool, optional
+        If the chunks are listed from the last one. Default: False
+
+    Returns
+    -------
+    list of tuples
+        (first, last + 1) indices of each chunk
+    """
+    bounds = [(first, min(first + chunk_size, stop))
+              for first in range(start, stop, chunk_size)]
+    return bounds[::-1] if reverse else bounds
+
+
+def sum_terms(terms, start, stop, method='naive', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Sum of the terms of a series, computed chunk by chunk
+
+    Parameters
+    ----------
+    terms : callable
+        Vectorized function that returns the terms for an array of indices
+    start, stop : int
+        Range of indices [start, stop)
+    method : str, optional
+        Summation method: 'naive' (in order, plain accumulator), 'neumaier'
+        (compensated), 'pairwise' or 'reverse' (from the smallest terms, plain
+        accumulator). Default: 'naive'
+    chunk_size : int, optional
+        Terms computed at a time. Default: 2 ** 20
+
+    Returns
+    -------
+    float
+    """
+    accumulator = make_accumulator(method)
+    reverse = method == 'reverse'
+    for first, last in chunk_bounds(start, stop, chunk_size, reverse):
+        values = terms(np.arange(first, last))
+        accumulator.add(values[::-1] if reverse else values)
+    return accumulator.value
@@ -0,0 +1,77 @@
+import math
+
+import pytest
+
+from src.acceleration import (accelerate, accelerate_to_tolerance,
+                              leibniz_alternating_curve)
+from src.compute_pi import pi_euler_curve, pi_leibniz_curve
+
+
+def test_leibniz_alternating_curve():
+    expected = [4, 4 - 4 / 3, 4 - 4 / 3 + 4 / 5]
+    assert leibniz_alternating_curve(3) == pytest.approx(expected)
+    assert leibniz_alternating_curve(200)[1::2] == pytest.approx(pi_leibniz_curve(100))
+
+
+@pytest.mark.parametrize(
+    'curve, method, terms',
+    (
+            (pi_leibniz_curve, 'richardson', 1_024),
+            (pi_euler_curve, 'richardson', 1_024),
+            (pi_leibniz_curve, 'richardson', 1_000),
+            (pi_euler_curve, 'richardson', 1_500),
+            (leibniz_alternating_curve, 'aitken', 32),
+            (leibniz_alternating_curve, 'wynn', 32),
+            (leibniz_alternating_curve, 'euler', 64),
+    )
+)
+def test_accelerate(curve, method, terms):
+    result = accelerate(curve(terms), method)
+    assert result.estimate == pytest.approx(math.pi, abs=1e-12)
+    assert result.terms_used == terms
+    assert result.error_estimate < 1e-10
+
+
+@pytest.mark.parametrize('method', ('aitken', 'wynn', 'richardson', 'euler'))
+def test_accelerate_single_value(method):
+    assert accelerate([4.0], method).estimate == 4.0
+
+
+@pytest.mark.parametrize('curve', (pi_leibniz_curve, pi_euler_curve))
+def test_richardson_more_terms_not_worse(curve):
+    errors = [abs(accelerate(curve(terms)).estimate - math.pi)
+              for terms in (300, 1_000, 1_024, 1_500)]
+    assert max(errors) < 1e-12
+
+
+def test_accelerate_to_tolerance():
+    result = accelerate_to_tolerance(pi_leibniz_curve, 'richardson', 1e-12)
+    assert abs(result.estimate - math.pi) < 1e-12
+    assert result.terms_used <= 1_024
+
+
+@pytest.mark.parametrize(
+    'curve, method',
+    (
+            (pi_leibniz_curve, 'euler'),
+            (pi_euler_curve, 'aitken'),
+            (pi_euler_curve, 'wynn'),
+    )
+)
+def test_accelerate_to_tolerance_unsuited_method(curve, method):
+    result = accelerate_to_tolerance(curve, method, 1e-12, max_terms=8_192)
+    assert result.terms_used == 8_192
+    assert result.error_estimate > abs(result.estimate - math.pi) / 10
+    assert result.error_estimate > 1e-6
+
+
+@pytest.mark.parametrize(
+    'partial_sums, method, message',
+    (
+            ([1.0], 'shanks', 'Method must be one of'),
+            ([], 'wynn', 'At least one partial sum is needed'),
+    )
+)
+def test_accelerate_invalid(partial_sums, method, message):
+    with pytest.raises(ValueError, match=message):
+        accelerate(partial_sums, method)
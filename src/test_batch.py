@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+from src.batch import (pi_euler_batch, pi_leibniz_batch, pi_monte_carlo_batch,
+                       pi_series_batch)
+from src.compute_pi import PiMonteCarlo, pi_euler, pi_leibniz
+from src.helpers import error
+from src.series import SERIES, pi_series
+
+TERMS = [1, 7, 0, 3_000, 7, 2_048, 2_049, 10_000]
+
+
+@pytest.mark.parametrize('batch, scalar', ((pi_leibniz_batch, pi_leibniz),
+                                           (pi_euler_batch, pi_euler)))
+def test_series_batch_same_as_scalar(batch, scalar):
+    estimates, errors = batch(TERMS, chunk_size=1_024)
+    assert list(estimates) == [scalar(n) for n in TERMS]
+    assert list(errors) == [error(scalar(n), math.pi) for n in TERMS]
+
+
+@pytest.mark.parametrize('series', SERIES)
+def test_pi_series_batch_same_as_pi_series(series):
+    estimates, _ = pi_series_batch(series, TERMS, chunk_size=1_024)
+    assert list(estimates) == [pi_series(series, n, chunk_size=1_024) for n in TERMS]
+
+
+def test_monte_carlo_batch_same_as_scalar():
+    points = [10, 100, 1_000, 10, 5_000, 1]
+    seeds = [42, 42, 1, 7, 42, 3]
+    estimates, _ = pi_monte_carlo_batch(points, seeds, chunk_size=300)
+    assert list(estimates) == [PiMonteCarlo(p, s).calculate
+                               for p, s in zip(points, seeds)]
+
+
+@pytest.mark.parametrize(
+    'points, seeds, exception',
+    (
+            ([10, 20], [1], ValueError),
+            ([10, 0], [1, 2], ValueError),
+            ([10.0], [1], TypeError),
+    )
+)
+def test_monte_carlo_batch_invalid(points, seeds, exception):
+    with pytest.raises(exception):
+        pi_monte_carlo_batch(points, seeds)
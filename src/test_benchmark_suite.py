@@ -0,0 +1,40 @@
+import pytest
+
+from benchmarks.suite import MIN_COMPARED_TIME, compare
+
+
+def result(case, size, time):
+    return {'case': case, 'size': size, 'time': time}
+
+
+BASELINE = [result('pi_leibniz', 1_000, 0.01), result('pi_leibniz', 100, 0.01),
+            result('pi_euler', 1_000, MIN_COMPARED_TIME / 2)]
+
+
+@pytest.mark.parametrize(
+    'time, regression',
+    (
+            (0.009, False),
+            (0.012, False),
+            (0.0121, True),
+    )
+)
+def test_compare_threshold(time, regression):
+    regressions = compare([result('pi_leibniz', 1_000, time)], BASELINE, 0.2)
+    assert regressions == ([('pi_leibniz', 1_000, 0.01, time, time / 0.01)]
+                           if regression else [])
+
+
+def test_compare_skips_short_baseline_times():
+    assert compare([result('pi_euler', 1_000, 1.0)], BASELINE, 0.2) == []
+
+
+def test_compare_skips_cases_missing_from_baseline():
+    results = [result('pi_leibniz', 10_000, 1.0), result('pi_series[bbp]', 1_000, 1.0)]
+    assert compare(results, BASELINE, 0.2) == []
+
+
+def test_compare_matches_case_and_size():
+    results = [result('pi_leibniz', 100, 0.005), result('pi_leibniz', 1_000, 0.05)]
+    assert [regression[:2] for regression in compare(results, BASELINE, 0.2)] == [
+        ('pi_leibniz', 1_000)]
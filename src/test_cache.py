@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from src.cache import ResultCache, cached_monte_carlo, sizeof
+from src.compute_pi import PiMonteCarlo
+
+
+def test_hits_and_misses():
+    cache = ResultCache()
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert cache.get_or_compute(('square', 3), square, 3) == 9
+    assert cache.get_or_compute(('square', 3), square, 3) == 9
+    info = cache.info()
+    assert calls == [3]
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_lru_eviction():
+    array_bytes = sizeof(np.zeros(100))
+    cache = ResultCache(max_bytes=2 * array_bytes)
+    cache.put('a', np.zeros(100))
+    cache.put('b', np.zeros(100))
+    cache.get_or_compute('a', np.zeros, 100)
+    cache.put('c', np.zeros(100))
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.info().evictions == 1
+    assert cache.info().bytes <= cache.max_bytes
+
+
+def test_too_large_value_not_stored():
+    cache = ResultCache(max_bytes=10)
+    assert len(cache.get_or_compute('big', np.ones, 1_000)) == 1_000
+    assert len(cache) == 0
+
+
+def test_cached_arrays_are_read_only():
+    cache = ResultCache()
+    memoized = cache.memoize(np.arange)
+    with pytest.raises(ValueError, match='read-only'):
+        memoized(5)[0] = 1
+    pair = cache.get_or_compute('pair', lambda: (np.zeros(3), [np.ones(2)]))
+    assert not pair[0].flags.writeable and not pair[1][0].flags.writeable
+    assert list(memoized(5)) == [0, 1, 2, 3, 4]
+
+
+def test_memoize():
+    cache = ResultCache()
+    memoized = cache.memoize(np.arange)
+    assert memoized(5) is memoized(5)
+    assert memoized(5, dtype=float) is not memoized(5)
+
+
+def test_cached_monte_carlo():
+    cache = ResultCache()
+    first = cached_monte_carlo(1_000, 42, cache)
+    assert cached_monte_carlo(1_000, 42, cache) is first
+    assert first.calculate == PiMonteCarlo(1_000, 42).calculate
+    assert cache.info().bytes >= 2 * 1_000 * 8
+
+
+def test_cached_monte_carlo_without_seed():
+    cache = ResultCache()
+    cached_monte_carlo(10, None, cache)
+    assert len(cache) == 0
+
+
+def test_clear():
+    cache = ResultCache()
+    cache.get_or_compute('a', int, 1)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, 0, cache.max_bytes)
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from src import checkpoint
+from src.checkpoint import (load_checkpoint, pi_monte_carlo_checkpointed,
+                            pi_series_checkpointed, save_checkpoint)
+from src.compute_pi import PiMonteCarloStream, pi_euler, pi_leibniz
+
+
+class _Crash(Exception):
+    pass
+
+
+def crash_after(monkeypatch, saves):
+    """
+    Makes the checkpointed functions die right after a number of checkpoints
+    """
+    original = checkpoint.save_checkpoint
+    calls = []
+
+    def save(path, state):
+        original(path, state)
+        calls.append(path)
+        if len(calls) == saves:
+            raise _Crash
+
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', save)
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / 'state.json'
+    save_checkpoint(path, {'hits': 3})
+    assert load_checkpoint(path) == {'hits': 3}
+    assert list(tmp_path.iterdir()) == [path]
+    assert load_checkpoint(tmp_path / 'missing.json') is None
+
+
+def test_stream_state_round_trip():
+    stream = PiMonteCarloStream(10_000, 42, 1_000)
+    stream.advance(3_000)
+    resumed = PiMonteCarloStream.from_state(json.loads(json.dumps(stream.state)))
+    assert resumed.calculate == stream.calculate
+    assert resumed.standard_error == stream.standard_error
+
+
+def test_monte_carlo_resume(tmp_path, monkeypatch):
+    path = tmp_path / 'monte_carlo.json'
+    expected = PiMonteCarloStream(50_000, 42, 5_000)
+    with monkeypatch.context() as patch:
+        crash_after(patch, 3)
+        with pytest.raises(_Crash):
+            pi_monte_carlo_checkpointed(50_000, 42, path, 5_000, interval=0)
+    assert load_checkpoint(path)['stats']['count'] == 15_000
+    result = pi_monte_carlo_checkpointed(50_000, 42, path, 5_000, interval=0)
+    assert result.estimate == expected.calculate
+    assert result.standard_error == expected.standard_error
+    assert result.samples == 50_000
+
+
+@pytest.mark.parametrize('summation', ('naive', 'neumaier', 'pairwise', 'reverse'))
+@pytest.mark.parametrize('series', ('leibniz', 'euler'))
+def test_series_resume(tmp_path, monkeypatch, series, summation):
+    expected = pi_series_checkpointed(series, 100_000, tmp_path / 'whole.json',
+                                      summation, 2 ** 12)
+    path = tmp_path / 'series.json'
+    with monkeypatch.context() as patch:
+        crash_after(patch, 4)
+        with pytest.raises(_Crash):
+            pi_series_checkpointed(series, 100_000, path, summation, 2 ** 12,
+                                   interval=0)
+    assert load_checkpoint(path)['chunks_done'] == 4
+    result = pi_series_checkpointed(series, 100_000, path, summation, 2 ** 12,
+                                    interval=0)
+    assert result == expected
+
+
+@pytest.mark.parametrize('series, function', (('leibniz', pi_leibniz),
+                                              ('euler', pi_euler)))
+def test_series_same_as_function(tmp_path, series, function):
+    result = pi_series_checkpointed(series, 3_000_000, tmp_path / 'series.json',
+                                    'pairwise')
+    assert result == function(3_000_000, 'pairwise')
+
+
+def test_checkpoint_of_another_run(tmp_path):
+    path = tmp_path / 'monte_carlo.json'
+    pi_monte_carlo_checkpointed(1_000, 42, path)
+    with pytest.raises(ValueError, match='seed=42'):
+        pi_monte_carlo_checkpointed(1_000, 0, path)
@@ -0,0 +1,86 @@
+import csv
+import json
+
+import pytest
+
+from src.cli import main, parse_values
+from src.compute_pi import PiMonteCarlo, pi_leibniz
+from src.series import pi_series
+
+
+@pytest.mark.parametrize(
+    'values, expected',
+    (
+            (['5'], [5]),
+            (['10:40:10', '7'], [10, 20, 30, 7]),
+            (['0:3'], [0, 1, 2]),
+            (['100:100001:*10'], [100, 1_000, 10_000, 100_000]),
+    )
+)
+def test_parse_values(values, expected):
+    assert parse_values(values) == expected
+
+
+def test_parse_values_invalid_geometric_range():
+    with pytest.raises(ValueError, match='Invalid geometric range'):
+        parse_values(['0:100:*10'])
+
+
+@pytest.mark.parametrize(
+    'arguments, message',
+    (
+            (['--points', '1000', '0'], '--points must be at least 1, got 0'),
+            (['--points', '-5'], '--points must be at least 1, got -5'),
+            (['--terms', '-1'], '--terms must be at least 0, got -1'),
+            (['--seeds', '-1'], '--seeds must be at least 0, got -1'),
+            (['--seeds', 'x'], '--seeds: invalid literal'),
+            (['--points', '0:10:*10'], '--points: Invalid geometric range'),
+    )
+)
+def test_invalid_sizes(tmp_path, capsys, arguments, message):
+    output = tmp_path / 'sweep.jsonl'
+    with pytest.raises(SystemExit):
+        main(['leibniz', 'monte-carlo', '--terms', '10', '--output', str(output),
+              *arguments])
+    assert message in capsys.readouterr().err
+    assert not output.exists()
+
+
+def test_jsonl_output(capsys):
+    main(['leibniz', 'monte-carlo', '--terms', '10', '100', '--points', '1000',
+          '--seeds', '42'])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r['method'], r['size'], r['seed']) for r in records] == [
+        ('leibniz', 10, None), ('leibniz', 100, None), ('monte-carlo', 1_000, 42)]
+    assert records[1]['estimate'] == pi_leibniz(100)
+    assert records[2]['estimate'] == PiMonteCarlo(1_000, 42).calculate
+    assert all(r['elapsed'] >= 0 for r in records)
+
+
+def test_every_series(capsys):
+    main(['nilakantha', 'wallis', 'ramanujan', 'bbp', '--terms', '3'])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r['estimate'] for r in records] == [
+        pi_series(name, 3) for name in ('nilakantha', 'wallis', 'ramanujan', 'bbp')]
+
+
+@pytest.mark.parametrize('output_format', ('jsonl', 'csv'))
+def test_resume(tmp_path, output_format):
+    output = str(tmp_path / f'sweep.{output_format}')
+    arguments = ['monte-carlo', '--format', output_format, '--output', output,
+                 '--resume', '--seeds', '0:2', '--points']
+    main(arguments + ['1000'])
+    main(arguments + ['1000', '2000'])
+    with open(output, newline='') as file:
+        if output_format == 'csv':
+            records = list(csv.DictReader(file))
+        else:
+            records = [json.loads(line) for line in file]
+    assert [(int(r['size']), int(r['seed'])) for r in records] == [
+        (1_000, 0), (1_000, 1), (2_000, 0), (2_000, 1)]
+
+
+def test_parallel_workers_keep_order(capsys):
+    main(['monte-carlo', '--points', '1000', '--seeds', '0:4', '--workers', '2'])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r['seed'] for r in records] == [0, 1, 2, 3]
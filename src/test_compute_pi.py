@@ -1,9 +1,13 @@
 import math
 from contextlib import nullcontext as does_not_raise
 
+import numpy as np
 import pytest
 
-from src.compute_pi import pi_leibniz, pi_euler, PiMonteCarlo
+from src import instrumentation
+from src.compute_pi import (pi_leibniz, pi_euler, pi_leibniz_curve, pi_euler_curve,
+                            PiMonteCarlo, PiMonteCarloStream)
+from src.helpers import create_coords, distance_points
 
 
 def test_leibniz_n1():
@@ -30,6 +34,25 @@ def test_euler_n3():
     assert pi_euler(3) == math.sqrt(6 * (1 + 1 / 4 + 1 / 9))
 
 
+@pytest.mark.parametrize('summation', ('naive', 'neumaier', 'pairwise', 'reverse'))
+@pytest.mark.parametrize('function', (pi_leibniz, pi_euler))
+def test_summation_methods(function, summation):
+    assert function(10_000, summation) == pytest.approx(function(10_000), rel=1e-13)
+
+
+@pytest.mark.parametrize('curve, scalar', ((pi_leibniz_curve, pi_leibniz),
+                                           (pi_euler_curve, pi_euler)))
+def test_curve_matches_scalar(curve, scalar):
+    values = curve(500)
+    assert len(values) == 500
+    assert values == pytest.approx([scalar(n) for n in range(1, 501)], rel=1e-12)
+
+
+@pytest.mark.parametrize('curve', (pi_leibniz_curve, pi_euler_curve))
+def test_curve_empty(curve):
+    assert len(curve(0)) == 0
+
+
 class TestMonteCarlo:
     SEED = 42
 
@@ -99,3 +122,171 @@ class TestMonteCarlo:
         with expectation:
             instance = PiMonteCarlo(points, self.SEED)
             assert instance.points == points
+
+    @pytest.mark.parametrize('points', (1, 10, 1_000))
+    def test_coords_match_generator(self, points):
+        instance = PiMonteCarlo(points, self.SEED)
+        assert instance.coords == tuple(create_coords(points, self.SEED))
+
+    def test_mask_matches_distance(self):
+        instance = PiMonteCarlo(1_000, self.SEED)
+        expected = [distance_points(c) <= 1 for c in instance.coords]
+        assert instance.count_inside_quadrant() == sum(expected)
+
+    @pytest.mark.parametrize('backend', ('matplotlib', 'plotly'))
+    def test_plot_backends(self, backend):
+        instance = PiMonteCarlo(100, self.SEED)
+        assert instance.plot(backend=backend, arc=True) is not None
+
+    @pytest.mark.parametrize(
+        'points, max_points, trace_type, plotted',
+        (
+                (100, None, 'scatter', 100),
+                (50_000, None, 'scattergl', 50_000),
+                (50_000, 1_000, 'scatter', 1_000),
+        )
+    )
+    def test_plotly_traces(self, points, max_points, trace_type, plotted):
+        instance = PiMonteCarlo(points, self.SEED)
+        inside, outside = instance.plot(backend='plotly', max_points=max_points).data
+        assert inside.type == outside.type == trace_type
+        assert len(inside.x) + len(outside.x) == plotted
+        assert len(inside.x) / plotted == pytest.approx(instance.calculate / 4, abs=1e-3)
+
+    def test_plot_invalid_backend(self):
+        with pytest.raises(ValueError, match='Backend must be matplotlib or plotly'):
+            PiMonteCarlo(10, self.SEED).plot(backend='bokeh')
+
+    @pytest.mark.parametrize('sequence', ((5_000, 5_500), (5_500, 5_000),
+                                          (10, 1_000, 100, 10_000, 1)))
+    def test_incremental_same_as_cold(self, sequence):
+        instance = PiMonteCarlo(sequence[0], self.SEED)
+        for points in sequence:
+            instance.points = points
+            cold = PiMonteCarlo(points, self.SEED)
+            assert instance.calculate == cold.calculate
+            assert instance.coords == cold.coords
+
+    def test_float32_storage(self):
+        instance = PiMonteCarlo(10_000, self.SEED, np.float32)
+        assert instance.coords.dtype == np.float32
+        expected = PiMonteCarlo(10_000, self.SEED).calculate
+        assert instance.calculate == pytest.approx(expected, abs=4 / 10_000)
+
+    def test_incremental_draws_only_extra_points(self):
+        instance = PiMonteCarlo(5_000, self.SEED)
+        instance.calculate
+        instance.points = 5_500
+        instance.calculate
+        assert instance._stored_points == 5_500
+        instance.points = 100
+        instance.calculate
+        assert instance._stored_points == 5_500
+
+    def test_mask_evaluated_once(self):
+        with instrumentation.profile() as registry:
+            instance = PiMonteCarlo(5_000, self.SEED)
+            instance.calculate
+            instance.error()
+            instance._colors()
+            instance.plot(backend='plotly')
+            instance.plot(backend='matplotlib')
+            instance.points = 2_000
+            instance.calculate
+            instance.points = 6_000
+            instance.calculate
+        assert registry.counters['mask_evaluations'] == 6_000
+        assert instance.calculate == PiMonteCarlo(6_000, self.SEED).calculate
+
+    def test_seed_change_discards_points(self):
+        instance = PiMonteCarlo(1_000, self.SEED)
+        instance.calculate
+        instance.seed = 0
+        assert instance.calculate == PiMonteCarlo(1_000, 0).calculate
+
+    def test_bit_generator(self):
+        instance = PiMonteCarlo(1_000, self.SEED, bit_generator='philox')
+        assert instance.bit_generator == 'philox'
+        assert instance.calculate == PiMonteCarlo(1_000, self.SEED,
+                                                  bit_generator='philox').calculate
+        assert list(instance.coords) != list(PiMonteCarlo(1_000, self.SEED).coords)
+        with pytest.raises(ValueError, match='Bit generator must be one of'):
+            PiMonteCarlo(10, self.SEED, bit_generator='xorshift')
+
+
+class TestMonteCarloStream:
+    SEED = 42
+
+    @pytest.mark.parametrize(
+        'points, chunk_size',
+        (
+                (10, 1),
+                (1_000, 7),
+                (100_000, 1_000),
+                (100_000, 1_000_000),
+        )
+    )
+    def test_same_as_in_memory(self, points, chunk_size):
+        stream = PiMonteCarloStream(points, self.SEED, chunk_size)
+        assert stream.calculate == PiMonteCarlo(points, self.SEED).calculate
+        assert stream.trials == points
+
+    @pytest.mark.parametrize('bit_generator', ('pcg64', 'philox'))
+    def test_consecutive_offsets(self, bit_generator):
+        hits = 0
+        for size, offset in ((3_001, 0), (5_000, 3_001), (1, 8_001)):
+            stream = PiMonteCarloStream(size, self.SEED, 999, bit_generator, offset)
+            stream.advance(size)
+            hits += stream.hits
+        instance = PiMonteCarlo(8_002, self.SEED, bit_generator=bit_generator)
+        assert hits == instance.count_inside_quadrant()
+
+    def test_state_round_trip_with_bit_generator(self):
+        stream = PiMonteCarloStream(10_001, self.SEED, 333, 'philox', 5)
+        stream.advance(4_001)
+        resumed = PiMonteCarloStream.from_state(stream.state)
+        assert (resumed.bit_generator, resumed.offset) == ('philox', 5)
+        assert resumed.calculate == stream.calculate
+
+    def test_standard_error(self):
+        stream = PiMonteCarloStream(100_000, self.SEED, 1_000)
+        p = stream.calculate / 4
+        expected = 4 * math.sqrt(p * (1 - p) / (stream.trials - 1))
+        assert stream.standard_error == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize(
+        'chunk_size, expectation',
+        (
+                (1.0, pytest.raises(TypeError, match='Chunk size must be integer')),
+                (0, pytest.raises(ValueError,
+                                  match='Chunk size must be a positive integer')),
+        )
+    )
+    def test_chunk_size_validation(self, chunk_size, expectation):
+        with expectation:
+            PiMonteCarloStream(10, self.SEED, chunk_size)
+
+    @pytest.mark.parametrize('level', (0.9, 0.99))
+    def test_run_until_target_error(self, level):
+        result = PiMonteCarloStream(10 ** 8, self.SEED).run_until(0.01, level)
+        lower, upper = result.confidence_interval
+        assert result.converged
+        assert (upper - lower) / 2 <= 0.01
+        assert lower < result.estimate < upper
+        assert result.samples < 10 ** 8
+
+    def test_run_until_points_cap(self):
+        result = PiMonteCarloStream(50_000, self.SEED).run_until(1e-6)
+        assert not result.converged
+        assert result.samples == 50_000
+        assert result.estimate == PiMonteCarlo(50_000, self.SEED).calculate
+
+    def test_run_until_time_limit(self):
+        result = PiMonteCarloStream(10 ** 12, self.SEED, 1_000).run_until(1e-9,
+                                                                          max_time=0.05)
+        assert not result.converged
+        assert result.elapsed >= 0.05
+
+    def test_run_until_validation(self):
+        with pytest.raises(ValueError, match='Target error must be positive'):
+            PiMonteCarloStream(10, self.SEED).run_until(0)
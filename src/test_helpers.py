@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from src.helpers import (BIT_GENERATORS, Coordinate, Coordinates, create_coords,
+                         draw_coords, make_rng, stratified_indices)
+
+
+def create_coordinates(points, seed, dtype=np.float64):
+    return draw_coords(make_rng(seed), points, dtype)
+
+
+class TestCoordinates:
+    SEED = 42
+
+    def test_same_points_as_generator(self):
+        coords = create_coordinates(100, self.SEED)
+        assert list(coords) == list(create_coords(100, self.SEED))
+
+    def test_zero_copy_columns(self):
+        coords = create_coordinates(100, self.SEED)
+        assert np.shares_memory(coords.x, coords.data)
+        assert np.shares_memory(coords.y, coords.data)
+        assert coords.x[3] == coords[3].x and coords.y[3] == coords[3].y
+
+    def test_indexing(self):
+        coords = create_coordinates(10, self.SEED)
+        assert isinstance(coords[0], Coordinate)
+        assert coords[-1] == tuple(coords.data[-1])
+        assert len(coords[2:5]) == 3
+
+    @pytest.mark.parametrize('dtype, bytes_per_point', ((np.float64, 16),
+                                                        (np.float32, 8)))
+    def test_compact_storage(self, dtype, bytes_per_point):
+        coords = create_coordinates(1_000, self.SEED, dtype)
+        assert coords.dtype == dtype
+        assert coords.nbytes == 1_000 * bytes_per_point
+
+    def test_append(self):
+        coords = Coordinates()
+        for chunk in range(5):
+            coords.append(create_coordinates(7, chunk))
+        assert len(coords) == 35
+        assert coords[7:14] == create_coordinates(7, 1)
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match='Coordinates data must have shape'):
+            Coordinates(np.zeros((3, 3)))
+
+
+class TestMakeRng:
+    SEED = 42
+
+    def test_default_stream(self):
+        expected = np.random.default_rng(self.SEED).random(10)
+        assert list(make_rng(self.SEED).random(10)) == list(expected)
+
+    @pytest.mark.parametrize('bit_generator', ('pcg64', 'pcg64dxsm', 'philox'))
+    @pytest.mark.parametrize('offset', (1, 2, 3, 1_001))
+    def test_skip_ahead(self, bit_generator, offset):
+        points = make_rng(self.SEED, bit_generator).random((offset + 10, 2))
+        skipped = make_rng(self.SEED, bit_generator, offset).random((10, 2))
+        np.testing.assert_array_equal(skipped, points[offset:])
+
+    @pytest.mark.parametrize('bit_generator', BIT_GENERATORS)
+    def test_reproducible(self, bit_generator):
+        assert (make_rng(self.SEED, bit_generator).random()
+                == make_rng(self.SEED, bit_generator).random())
+
+    @pytest.mark.parametrize(
+        'bit_generator, offset, message',
+        (
+                ('sfc64', 10, 'Bit generator sfc64 cannot skip ahead'),
+                ('xorshift', 0, 'Bit generator must be one of'),
+                ('pcg64', -1, 'Offset must be a non-negative integer'),
+        )
+    )
+    def test_invalid(self, bit_generator, offset, message):
+        with pytest.raises(ValueError, match=message):
+            make_rng(self.SEED, bit_generator, offset)
+
+
+@pytest.mark.parametrize('max_points', (None, 0, 1, 10, 999, 5_000))
+def test_stratified_indices(max_points):
+    mask = np.random.default_rng(0).random(1_000) < 0.8
+    indices = stratified_indices(mask, max_points)
+    expected = len(mask) if max_points is None else min(max_points, len(mask))
+    assert len(indices) == expected
+    assert np.all(np.diff(indices) > 0)
+    if expected:
+        assert mask[indices].mean() == pytest.approx(mask.mean(), abs=1 / expected)
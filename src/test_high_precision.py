@@ -0,0 +1,47 @@
+import math
+from decimal import Decimal
+
+import pytest
+
+from src.high_precision import (HIGH_PRECISION_METHODS, pi_chudnovsky, pi_decimal,
+                                pi_digits, pi_machin, terms_for_digits)
+
+PI_50 = '3.14159265358979323846264338327950288419716939937510'
+
+
+@pytest.mark.parametrize('method', HIGH_PRECISION_METHODS)
+@pytest.mark.parametrize('digits', (0, 1, 5, 50))
+def test_pi_digits(method, digits):
+    assert pi_digits(digits, method) == PI_50[:digits + 2].rstrip('.')
+
+
+def test_methods_agree():
+    assert pi_digits(2_000, 'chudnovsky') == pi_digits(2_000, 'machin')
+
+
+def test_pi_decimal():
+    assert pi_decimal(10) == Decimal('3.1415926535')
+
+
+@pytest.mark.parametrize(
+    'function, terms, tolerance',
+    (
+            (pi_chudnovsky, 1, 1e-13),
+            (pi_chudnovsky, 2, 0),
+            (pi_machin, 1, 0.05),
+            (pi_machin, 12, 0),
+    )
+)
+def test_terms_contract(function, terms, tolerance):
+    assert function(terms) == pytest.approx(math.pi, abs=tolerance)
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError, match='Method must be one of'):
+        terms_for_digits(10, 'leibniz')
+
+
+@pytest.mark.parametrize('function', (pi_chudnovsky, pi_machin))
+def test_invalid_terms(function):
+    with pytest.raises(ValueError, match='Number of terms must be a positive integer'):
+        function(0)
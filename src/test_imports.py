@@ -0,0 +1,31 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ('matplotlib', 'plotly', 'streamlit')
+REPOSITORY_ROOT = Path(__file__).parents[1]
+
+
+@pytest.mark.parametrize('module', ('src.compute_pi', 'src.helpers', 'src.summation',
+                                    'src.sampling', 'src.batch', 'src.cache'))
+def test_numeric_core_imports_without_plotting(module):
+    # a None entry in sys.modules makes any import of that package fail
+    code = '; '.join((
+        'import sys',
+        *(f'sys.modules[{name!r}] = None' for name in HEAVY_MODULES),
+        f'import {module}',
+        'from src.compute_pi import PiMonteCarlo, pi_leibniz',
+        'print(PiMonteCarlo(1000, 42).calculate, pi_leibniz(10))',
+    ))
+    subprocess.run([sys.executable, '-c', code], check=True, capture_output=True,
+                   cwd=REPOSITORY_ROOT)
+
+
+def test_plotting_is_not_imported():
+    code = ('import sys, src.compute_pi, src.helpers; '
+            f'print(any(name in sys.modules for name in {HEAVY_MODULES!r}))')
+    result = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True, cwd=REPOSITORY_ROOT)
+    assert result.stdout.strip() == 'False'
@@ -0,0 +1,83 @@
+import logging
+
+import pytest
+
+from src import instrumentation
+from src.compute_pi import PiMonteCarlo
+
+
+def test_disabled_by_default():
+    assert not instrumentation.enabled()
+    assert instrumentation.timer('stage') is instrumentation._NULL_TIMER
+
+
+def test_profile_counters_and_timers():
+    with instrumentation.profile() as registry:
+        instance = PiMonteCarlo(1_000, 42)
+        instance.calculate
+        instance.calculate
+        instance.plot(backend='plotly')
+    assert not instrumentation.enabled()
+    assert registry.counters['samples_generated'] == 1_000
+    assert registry.counters['calculate_cache_misses'] == 1
+    assert registry.counters['calculate_cache_hits'] == 1
+    assert registry.counters['coords_cache_misses'] == 1
+    for stage in ('draw_coords', 'inside_quadrant', 'PiMonteCarlo.calculate',
+                  'PiMonteCarlo._plotly'):
+        count, total, maximum = registry.timers[stage]
+        assert count >= 1
+        assert 0 <= maximum <= total
+
+
+def test_draw_coords_timed_once_per_draw():
+    with instrumentation.profile() as registry:
+        instance = PiMonteCarlo(1_000, 42)
+        instance.calculate
+        instance.points = 3_000
+        instance.calculate
+        instance.points = 2_000
+        instance.calculate
+    assert registry.timers['draw_coords'][0] == 2
+    assert registry.counters['samples_generated'] == 3_000
+
+
+def test_coords_cache_counts_caller_reads_only():
+    with instrumentation.profile() as registry:
+        instance = PiMonteCarlo(1_000, 42)
+        instance.calculate
+        instance.plot(backend='plotly')
+        assert 'coords_cache_hits' not in registry.counters
+        instance.coords
+    assert registry.counters['coords_cache_hits'] == 1
+    assert registry.counters['coords_cache_misses'] == 1
+
+
+def test_prometheus_text():
+    registry = instrumentation.RegistrySink()
+    registry.increment('samples_generated', 10)
+    registry.record_time('PiMonteCarlo._plotly', 0.5)
+    assert registry.to_prometheus() == (
+        '# TYPE pi_samples_generated_total counter\n'
+        'pi_samples_generated_total 10\n'
+        '# TYPE pi_stage_seconds summary\n'
+        'pi_stage_seconds_count{stage="PiMonteCarlo._plotly"} 1\n'
+        'pi_stage_seconds_sum{stage="PiMonteCarlo._plotly"} 0.5\n'
+    )
+
+
+def test_logging_sink(caplog):
+    sink = instrumentation.LoggingSink()
+    instrumentation.add_sink(sink)
+    try:
+        with caplog.at_level(logging.DEBUG, logger='src.instrumentation'):
+            instrumentation.increment('samples_generated', 5)
+    finally:
+        instrumentation.remove_sink(sink)
+    assert 'samples_generated += 5' in caplog.text
+
+
+def test_profile_removes_sink_on_error():
+    with pytest.raises(RuntimeError):
+        with instrumentation.profile():
+            raise RuntimeError
+    assert not instrumentation.enabled()
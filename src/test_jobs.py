@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import numpy as np
+import pytest
+
+from src.compute_pi import PiMonteCarlo, PiMonteCarloStream, pi_euler_curve
+from src.jobs import JobManager, progressive_curves, progressive_monte_carlo
+from src.series import SERIES, pi_series_curve
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager()
+    yield manager
+    manager.shutdown()
+
+
+def blocking(release, values=(1, 2, 3)):
+    for value in values:
+        release.wait()
+        yield value
+    return sum(values)
+
+
+def test_partials_and_result(manager):
+    release = threading.Event()
+    release.set()
+    job = manager.submit(blocking, release)
+    assert job.result(5) == 6
+    assert job.partial == 3
+    assert list(job.partials()) == [3]
+
+
+def test_partials_of_running_job(manager):
+    release = threading.Event()
+    job = manager.submit(blocking, release)
+    assert not job.wait(0.01)
+    threading.Timer(0.1, release.set).start()
+    assert list(job.partials(interval=0.01))[-1] == 3
+    assert job.result(5) == 6
+
+
+def test_await(manager):
+    release = threading.Event()
+    release.set()
+
+    async def main():
+        return await manager.submit(blocking, release)
+
+    assert asyncio.run(main()) == 6
+
+
+def test_cancel(manager):
+    release = threading.Event()
+    job = manager.submit(blocking, release)
+    job.cancel()
+    release.set()
+    with pytest.raises(CancelledError):
+        job.result(5)
+    assert job.cancelled()
+    assert job.partial in (None, 1)
+
+
+def test_newer_job_replaces_older(manager):
+    release = threading.Event()
+    first = manager.submit(blocking, release, key='session')
+    assert manager.submit(blocking, release, key='session') is first
+    second = manager.submit(blocking, release, (4, 5), key='session')
+    assert manager.get('session') is second
+    release.set()
+    assert second.result(5) == 9
+    assert first.cancelled()
+
+
+def test_waiting_replacement_is_skipped(manager):
+    running, overlaps = set(), []
+    release = threading.Event()
+
+    def tracked(name):
+        overlaps.extend((name, other) for other in running)
+        running.add(name)
+        try:
+            release.wait()
+            yield name
+        finally:
+            running.discard(name)
+        return name
+
+    first = manager.submit(tracked, 'A', key='session')
+    while not running:
+        first.wait(0.01)
+    second = manager.submit(tracked, 'B', key='session')
+    third = manager.submit(tracked, 'C', key='session')
+    release.set()
+    assert third.result(5) == 'C'
+    assert first.cancelled() and second.cancelled()
+    assert overlaps == []
+
+
+def test_finished_jobs_are_forgotten(manager):
+    release = threading.Event()
+    release.set()
+    job = manager.submit(blocking, release, key='session')
+    job.result(5)
+    # the key is forgotten by a done callback, which may run just after the result
+    deadline = time.monotonic() + 5
+    while manager.get('session') is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.get('session') is None
+    assert manager._jobs == {}
+
+
+def test_replacement_does_not_hold_a_thread():
+    manager = JobManager(max_workers=2)
+    release, free = threading.Event(), threading.Event()
+    free.set()
+    try:
+        first = manager.submit(blocking, release, key='session')
+        replacement = manager.submit(blocking, release, (4, 5), key='session')
+        other = manager.submit(blocking, free, key='other session')
+        assert other.result(5) == 6
+        assert not replacement.done()
+        release.set()
+        assert replacement.result(5) == 9
+        assert first.cancelled()
+    finally:
+        release.set()
+        manager.shutdown()
+
+
+def run(generator):
+    partials = []
+    try:
+        while True:
+            partials.append(next(generator))
+    except StopIteration as stop:
+        return partials, stop.value
+
+
+def test_progressive_monte_carlo():
+    instance = PiMonteCarlo(1, 42)
+    partials, result = run(progressive_monte_carlo(instance, 100_000))
+    assert result is instance
+    assert [partial.samples for partial in partials] == sorted(
+        partial.samples for partial in partials)
+    assert partials[-1].samples == 100_000
+    assert partials[-1].estimate == PiMonteCarlo(100_000, 42).calculate
+    partials, _ = run(progressive_monte_carlo(instance, 1_000))
+    assert [partial.samples for partial in partials] == [1_000]
+
+
+def test_progressive_monte_carlo_max_stored_points():
+    instance = PiMonteCarlo(1, 42)
+    partials, result = run(progressive_monte_carlo(instance, 100_000,
+                                                   max_stored_points=10_000))
+    assert isinstance(result, PiMonteCarloStream)
+    assert result.points == result.trials == 100_000
+    assert result.calculate == PiMonteCarlo(100_000, 42).calculate
+    assert instance._stored_points == instance.points == 10_000
+    assert [partial.samples for partial in partials][-1] == 100_000
+    partials, result = run(progressive_monte_carlo(instance, 5_000,
+                                                   max_stored_points=10_000))
+    assert result is instance
+    assert instance._stored_points == 10_000
+
+
+@pytest.mark.parametrize('number_of_terms', (0, 1, 7, 100_003))
+def test_progressive_curves(number_of_terms):
+    partials, curves = run(progressive_curves(number_of_terms))
+    assert list(curves) == list(SERIES)
+    for name, curve in curves.items():
+        np.testing.assert_array_equal(curve, pi_series_curve(name, number_of_terms))
+    for partial in partials:
+        length = len(partial['leibniz'])
+        np.testing.assert_array_equal(partial['wallis'], curves['wallis'][:length])
+
+
+def test_progressive_curves_selected_series():
+    _, curves = run(progressive_curves(1_000, series=('euler', 'bbp')))
+    assert list(curves) == ['euler', 'bbp']
+    np.testing.assert_array_equal(curves['euler'], pi_euler_curve(1_000))
@@ -0,0 +1,72 @@
+import math
+
+import pytest
+
+from src.compute_pi import PiMonteCarloStream
+from src.parallel import pi_monte_carlo_parallel, pi_series_parallel, split_work
+from src.series import SERIES, pi_series
+
+
+@pytest.mark.parametrize(
+    'total, parts, expected',
+    (
+            (10, 1, [10]),
+            (10, 3, [4, 3, 3]),
+            (2, 4, [1, 1, 0, 0]),
+    )
+)
+def test_split_work(total, parts, expected):
+    assert split_work(total, parts) == expected
+
+
+def test_monte_carlo_parallel_reproducible():
+    first = pi_monte_carlo_parallel(100_000, 42, workers=3, chunk_size=10_000)
+    second = pi_monte_carlo_parallel(100_000, 42, workers=3, chunk_size=10_000)
+    assert first == second
+    assert first.samples == 100_000
+    assert first.estimate == pytest.approx(math.pi, abs=5 * first.standard_error)
+
+
+@pytest.mark.parametrize('workers', (1, 3))
+@pytest.mark.parametrize('bit_generator', ('pcg64', 'philox'))
+def test_monte_carlo_parallel_skip_ahead_same_as_serial(workers, bit_generator):
+    result = pi_monte_carlo_parallel(100_001, 42, workers, 7_000, bit_generator,
+                                     skip_ahead=True)
+    expected = PiMonteCarloStream(100_001, 42, 7_000, bit_generator).calculate
+    assert result.estimate == expected
+
+
+def test_monte_carlo_parallel_more_workers_than_points():
+    result = pi_monte_carlo_parallel(2, 42, workers=4)
+    assert result.samples == 2
+
+
+@pytest.mark.parametrize('series', SERIES)
+def test_series_parallel_same_as_serial(series):
+    expected = pi_series(series, 100_003, 'neumaier', chunk_size=4_096)
+    assert pi_series_parallel(series, 100_003, workers=2, chunk_size=4_096) == expected
+
+
+@pytest.mark.parametrize('workers', (1, 3))
+def test_series_parallel_independent_of_workers(workers):
+    expected = pi_series_parallel('euler', 50_000, workers=2, chunk_size=1_000)
+    result = pi_series_parallel('euler', 50_000, workers=workers, chunk_size=1_000)
+    assert result == expected
+
+
+def test_series_parallel_no_terms():
+    assert pi_series_parallel('leibniz', 0, workers=2) == 0
+
+
+@pytest.mark.parametrize(
+    'series, number_of_terms, workers, exception',
+    (
+            ('leibniz', 10.0, 2, TypeError),
+            ('leibniz', -1, 2, ValueError),
+            ('leibniz', 10, 0, ValueError),
+            ('gregory', 10, 2, ValueError),
+    )
+)
+def test_series_parallel_invalid(series, number_of_terms, workers, exception):
+    with pytest.raises(exception):
+        pi_series_parallel(series, number_of_terms, workers)
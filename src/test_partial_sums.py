@@ -0,0 +1,127 @@
+import multiprocessing
+
+import pytest
+
+from src.partial_sums import (HEADER_SIZE, PartialSumTable, build_table,
+                              open_or_build_table)
+from src.series import pi_series
+
+CHUNK = 1_000
+STRIDE = 4_000
+
+
+def expected_pi(series, number_of_terms, summation='naive'):
+    return pi_series(series, number_of_terms, summation, CHUNK)
+
+
+@pytest.fixture
+def leibniz_table(tmp_path):
+    path = tmp_path / 'leibniz.table'
+    build_table(path, 'leibniz', 50_000, STRIDE, chunk_size=CHUNK)
+    return path
+
+
+def _table_pi(path, number_of_terms):
+    return PartialSumTable(path).pi(number_of_terms)
+
+
+class TestPartialSumTable:
+
+    @pytest.mark.parametrize('number_of_terms', [0, 1, 999, STRIDE, STRIDE + 1, 47_999,
+                                                 48_000, 50_000, 61_234])
+    def test_leibniz(self, leibniz_table, number_of_terms):
+        table = PartialSumTable(leibniz_table)
+        assert table.pi(number_of_terms) == expected_pi('leibniz', number_of_terms)
+
+    @pytest.mark.parametrize('number_of_terms', [3, STRIDE, 12_345, 60_000])
+    def test_euler_neumaier(self, tmp_path, number_of_terms):
+        path = tmp_path / 'euler.table'
+        build_table(path, 'euler', 40_000, STRIDE, 'neumaier', CHUNK)
+        expected = expected_pi('euler', number_of_terms, 'neumaier')
+        assert PartialSumTable(path).pi(number_of_terms) == expected
+
+    def test_header(self, leibniz_table):
+        table = PartialSumTable(leibniz_table)
+        assert (table.series, table.summation, table.stride, table.chunk_size) == (
+            'leibniz', 'naive', STRIDE, CHUNK)
+        assert table.entries == 13
+        assert table.max_terms == 48_000
+
+    def test_shared_between_processes(self, leibniz_table):
+        with multiprocessing.get_context('spawn').Pool(2) as pool:
+            values = pool.starmap(_table_pi, [(leibniz_table, 10_001),
+                                              (leibniz_table, 49_000)])
+        assert values == [expected_pi('leibniz', 10_001),
+                          expected_pi('leibniz', 49_000)]
+
+
+class TestIntegrity:
+
+    def _rewrite(self, path, offset, data):
+        content = bytearray(path.read_bytes())
+        content[offset:offset + len(data)] = data
+        path.write_bytes(bytes(content))
+
+    def test_truncated(self, leibniz_table):
+        leibniz_table.write_bytes(leibniz_table.read_bytes()[:-8])
+        with pytest.raises(ValueError, match='truncated'):
+            PartialSumTable(leibniz_table)
+
+    def test_truncated_header(self, leibniz_table):
+        leibniz_table.write_bytes(leibniz_table.read_bytes()[:HEADER_SIZE // 2])
+        with pytest.raises(ValueError, match='truncated'):
+            PartialSumTable(leibniz_table)
+
+    def test_corrupted(self, leibniz_table):
+        self._rewrite(leibniz_table, HEADER_SIZE + 8, b'\x01')
+        with pytest.raises(ValueError, match='corrupted'):
+            PartialSumTable(leibniz_table)
+
+    def test_not_a_table(self, leibniz_table):
+        self._rewrite(leibniz_table, 0, b'NOTATABL')
+        with pytest.raises(ValueError, match='not a partial sums table'):
+            PartialSumTable(leibniz_table)
+
+    def test_version(self, leibniz_table):
+        self._rewrite(leibniz_table, 8, (99).to_bytes(4, 'little'))
+        with pytest.raises(ValueError, match='version 99'):
+            PartialSumTable(leibniz_table)
+
+    def test_other_terms(self, leibniz_table, monkeypatch):
+        from src import partial_sums
+        series = dict(partial_sums.SERIES)
+        terms = series['leibniz'].terms
+        series['leibniz'] = series['leibniz']._replace(terms=lambda k: terms(k) / 2)
+        monkeypatch.setattr(partial_sums, 'SERIES', series)
+        with pytest.raises(ValueError, match='other terms'):
+            PartialSumTable(leibniz_table)
+
+
+class TestBuild:
+
+    def test_open_or_build(self, tmp_path):
+        path = tmp_path / 'euler.table'
+        table = open_or_build_table(path, 'euler', 10_000, STRIDE, chunk_size=CHUNK)
+        assert table.max_terms == 8_000
+        modified = path.stat().st_mtime_ns
+        assert open_or_build_table(path, 'euler', 8_000, STRIDE,
+                                   chunk_size=CHUNK).max_terms == 8_000
+        assert path.stat().st_mtime_ns == modified
+        assert open_or_build_table(path, 'euler', 20_000, STRIDE,
+                                   chunk_size=CHUNK).max_terms == 20_000
+
+    def test_rebuilds_invalid(self, tmp_path):
+        path = tmp_path / 'leibniz.table'
+        path.write_bytes(b'stale')
+        table = open_or_build_table(path, 'leibniz', 8_000, STRIDE, chunk_size=CHUNK)
+        assert table.pi(9_000) == expected_pi('leibniz', 9_000)
+        assert [file.name for file in tmp_path.iterdir()] == ['leibniz.table']
+
+    @pytest.mark.parametrize('arguments, message', [
+        (('gregory', 10_000, STRIDE), 'Series must be one of'),
+        (('leibniz', 10_000, STRIDE, 'pairwise'), 'Summation must be one of'),
+        (('leibniz', 10_000, 1_500), 'Stride must be a positive multiple'),
+    ])
+    def test_invalid(self, tmp_path, arguments, message):
+        with pytest.raises(ValueError, match=message):
+            build_table(tmp_path / 'table', *arguments, chunk_size=CHUNK)
@@ -0,0 +1,67 @@
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+from src.compute_pi import PiMonteCarlo
+from src.sampling import (MIN_POINTS, SAMPLING_STRATEGIES, estimate_pi, halton_points,
+                          sobol_points)
+
+
+def test_sobol_points():
+    expected = [[0, 0], [0.5, 0.5], [0.25, 0.75], [0.75, 0.25]]
+    np.testing.assert_array_equal(sobol_points(4), expected)
+
+
+def test_halton_points():
+    expected = [[1 / 2, 1 / 3], [1 / 4, 2 / 3], [3 / 4, 1 / 9]]
+    np.testing.assert_allclose(halton_points(3), expected)
+
+
+def test_uniform_strategy_matches_pi_monte_carlo():
+    result = estimate_pi(10_000, 42)
+    assert result.estimate == PiMonteCarlo(10_000, 42).calculate
+    assert result.samples == 10_000
+
+
+@pytest.mark.parametrize('strategy', SAMPLING_STRATEGIES)
+def test_strategies(strategy):
+    result = estimate_pi(100_000, 42, strategy)
+    assert result == estimate_pi(100_000, 42, strategy)
+    assert 0.9 * 100_000 <= result.samples <= 100_000
+    assert result.standard_error > 0
+    assert result.estimate == pytest.approx(math.pi, abs=5 * result.standard_error)
+
+
+@pytest.mark.parametrize('strategy', ('antithetic', 'control_variate', 'stratified',
+                                      'sobol', 'halton'))
+def test_strategies_reduce_variance(strategy):
+    uniform = estimate_pi(100_000, 42)
+    assert estimate_pi(100_000, 42, strategy).standard_error < uniform.standard_error
+
+
+@pytest.mark.parametrize('strategy', SAMPLING_STRATEGIES)
+def test_strategies_minimum_points(strategy):
+    points = MIN_POINTS.get(strategy, 2)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = estimate_pi(points, 42, strategy)
+    assert math.isfinite(result.standard_error)
+    assert result.samples <= points
+
+
+@pytest.mark.parametrize(
+    'points, strategy, exception',
+    (
+            (1000.0, 'uniform', TypeError),
+            (1, 'uniform', ValueError),
+            (1000, 'importance', ValueError),
+            (3, 'antithetic', ValueError),
+            (31, 'sobol', ValueError),
+            (31, 'halton', ValueError),
+    )
+)
+def test_invalid_arguments(points, strategy, exception):
+    with pytest.raises(exception):
+        estimate_pi(points, 42, strategy)
@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from src.compute_pi import pi_euler, pi_euler_curve, pi_leibniz, pi_leibniz_curve
+from src.series import SERIES, get_series, pi_series, pi_series_curve
+
+
+def test_nilakantha_n2():
+    assert pi_series('nilakantha', 2) == 3 + 4 / (2 * 3 * 4) - 4 / (4 * 5 * 6)
+
+
+def test_wallis_n2():
+    assert pi_series('wallis', 2) == pytest.approx(2 * (4 / 3) * (16 / 15), rel=1e-15)
+
+
+def test_ramanujan_n1():
+    assert pi_series('ramanujan', 1) == pytest.approx(9801 / (2 * math.sqrt(2) * 1103),
+                                                      rel=1e-15)
+
+
+def test_bbp_n1():
+    assert pi_series('bbp', 1) == 4 - 2 / 4 - 1 / 5 - 1 / 6
+
+
+def test_leibniz_and_euler_unchanged():
+    assert pi_series('leibniz', 1_000) == pi_leibniz(1_000)
+    assert pi_series('euler', 1_000) == pi_euler(1_000)
+    assert list(pi_series_curve('leibniz', 100)) == list(pi_leibniz_curve(100))
+    assert list(pi_series_curve('euler', 100)) == list(pi_euler_curve(100))
+
+
+@pytest.mark.parametrize(
+    'series, number_of_terms, tolerance',
+    (
+            ('leibniz', 10_000, 1e-4),
+            ('euler', 10_000, 1e-4),
+            ('nilakantha', 1_000, 1e-9),
+            ('wallis', 10_000, 1e-4),
+            ('ramanujan', 3, 1e-15),
+            ('bbp', 12, 1e-15),
+    )
+)
+def test_convergence(series, number_of_terms, tolerance):
+    assert pi_series(series, number_of_terms) == pytest.approx(math.pi, rel=tolerance)
+
+
+@pytest.mark.parametrize('series', SERIES)
+def test_curve_matches_scalar(series):
+    values = pi_series_curve(series, 300)
+    assert len(values) == 300
+    assert list(values) == [pi_series(series, n) for n in range(1, 301)]
+
+
+@pytest.mark.parametrize('series', SERIES)
+def test_chunks(series):
+    assert pi_series(series, 5_000, chunk_size=64) == pi_series(series, 5_000)
+
+
+@pytest.mark.parametrize('summation', ('naive', 'neumaier', 'pairwise', 'reverse'))
+@pytest.mark.parametrize('series', SERIES)
+def test_summation_methods(series, summation):
+    assert pi_series(series, 2_000, summation) == pytest.approx(pi_series(series, 2_000),
+                                                                rel=1e-13)
+
+
+@pytest.mark.parametrize('series', SERIES)
+def test_empty_curve(series):
+    assert len(pi_series_curve(series, 0)) == 0
+
+
+def test_get_series():
+    assert get_series('bbp') is SERIES['bbp']
+    assert get_series(SERIES['bbp']) is SERIES['bbp']
+    with pytest.raises(ValueError, match='Series must be one of'):
+        get_series('gregory')
@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.summation import (SUMMATION_METHODS, NaiveAccumulator, NeumaierAccumulator,
+                           chunk_bounds, make_accumulator, sum_terms)
+
+
+def reciprocal_squares(k):
+    return 1 / k.astype(float) ** 2
+
+
+@pytest.mark.parametrize('method', SUMMATION_METHODS)
+@pytest.mark.parametrize('stop', (1, 2, 1_000, 100_001))
+@pytest.mark.parametrize('chunk_size', (7, 4_096))
+def test_sum_terms(method, stop, chunk_size):
+    expected = math.fsum(reciprocal_squares(np.arange(1, stop + 1)))
+    result = sum_terms(reciprocal_squares, 1, stop + 1, method, chunk_size)
+    assert result == pytest.approx(expected, rel=1e-13)
+
+
+def test_sum_terms_empty():
+    assert sum_terms(reciprocal_squares, 1, 1) == 0
+
+
+def test_naive_same_as_loop():
+    values = reciprocal_squares(np.arange(1, 10_001))
+    expected = 0
+    for value in values:
+        expected += value
+    accumulator = NaiveAccumulator()
+    for first, last in chunk_bounds(0, len(values), 333):
+        accumulator.add(values[first:last])
+    assert accumulator.value == expected
+
+
+def test_neumaier_exact():
+    values = np.array([1.0, 1e100, 1.0, -1e100] * 1_000)
+    accumulator = make_accumulator('neumaier')
+    accumulator.add(values)
+    assert accumulator.value == 2_000
+
+
+def test_neumaier_add_partial():
+    values = reciprocal_squares(np.arange(1, 10_001))
+    accumulator = NeumaierAccumulator()
+    merged = NeumaierAccumulator()
+    for first, last in chunk_bounds(0, len(values), 999):
+        accumulator.add(values[first:last])
+        chunk = NeumaierAccumulator()
+        chunk.add(values[first:last])
+        merged.add_partial(chunk.total, chunk.compensation)
+    assert merged.state == accumulator.state
+
+
+@pytest.mark.parametrize('method', SUMMATION_METHODS)
+def test_state_roundtrip(method):
+    values = reciprocal_squares(np.arange(1, 1_001))
+    accumulator = make_accumulator(method)
+    accumulator.add(values[:500])
+    resumed = make_accumulator(method, accumulator.state)
+    accumulator.add(values[500:])
+    resumed.add(values[500:])
+    assert resumed.value == accumulator.value
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError, match='Summation must be one of'):
+        make_accumulator('fast')
+
+
+@pytest.mark.parametrize(
+    'reverse, expected',
+    (
+            (False, [(0, 4), (4, 8), (8, 10)]),
+            (True, [(8, 10), (4, 8), (0, 4)]),
+    )
+)
+def test_chunk_bounds(reverse, expected):
+    assert chunk_bounds(0, 10, 4, reverse) == expected